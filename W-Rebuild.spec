@@ -19,6 +19,7 @@ a = Analysis(
     datas=[
         ('src\\core', 'src\\core'),
         ('src\\cli', 'src\\cli'),
+        ('src\\ui\\resources_rc.py', 'src\\ui'),  # Compiled stylesheet and icons
         ('scripts', 'scripts'),
         ('docs', 'docs'),
         ('README.md', '.'),
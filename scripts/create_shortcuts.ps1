@@ -0,0 +1,33 @@
+# W-Rebuild Shortcut PowerShell Script
+# Creates Desktop and Start Menu shortcuts for a restored application
+
+param(
+    [Parameter(Mandatory=$true)]
+    [string]$TargetPath,
+    
+    [Parameter(Mandatory=$true)]
+    [string]$WorkingDirectory,
+    
+    [Parameter(Mandatory=$true)]
+    [string]$Name
+)
+
+$ErrorActionPreference = "Stop"
+
+$WshShell = New-Object -ComObject WScript.Shell
+
+$Locations = @(
+    [Environment]::GetFolderPath('Desktop'),
+    (Join-Path ([Environment]::GetFolderPath('StartMenu')) 'Programs')
+)
+
+foreach ($Location in $Locations) {
+    $ShortcutPath = Join-Path $Location "$Name.lnk"
+    if (Test-Path -LiteralPath $ShortcutPath) { Remove-Item -LiteralPath $ShortcutPath -Force }
+    $Shortcut = $WshShell.CreateShortcut($ShortcutPath)
+    $Shortcut.TargetPath = $TargetPath
+    $Shortcut.WorkingDirectory = $WorkingDirectory
+    $Shortcut.Description = $Name
+    $Shortcut.Save()
+    Write-Host "Shortcut created: $ShortcutPath"
+}
@@ -1,6 +1,12 @@
 # W-Rebuild Modular Detection Script
 # Dynamically loads and executes all detector modules
 # Returns JSON output for Python to parse
+# Optional -Only takes a comma-separated list of detector names (file base names)
+# so several groups of detectors can be run in parallel processes
+
+param(
+    [string]$Only = ""
+)
 
 $ErrorActionPreference = "SilentlyContinue"
 $detectedTools = @()
@@ -14,6 +20,12 @@ if (Test-Path $detectorsDir) {
     # Get all PowerShell detector scripts
     $detectorScripts = Get-ChildItem -Path $detectorsDir -Filter "*.ps1" | Sort-Object Name
     
+    # Restrict to the requested detectors, if any
+    if ($Only) {
+        $onlyNames = $Only.Split(",") | ForEach-Object { $_.Trim() }
+        $detectorScripts = $detectorScripts | Where-Object { $onlyNames -contains $_.BaseName }
+    }
+    
     # Execute each detector script
     foreach ($detector in $detectorScripts) {
         try {
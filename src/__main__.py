@@ -0,0 +1,48 @@
+"""
+W-Rebuild Command Line Entry Point
+Single entry for the desktop app and the terminal commands
+
+Usage (from the project root):
+    python -m src [ui]
+    python -m src detect [--workers N] [--cached]
+    python -m src backups
+"""
+
+import argparse
+import sys
+
+
+def main(argv=None) -> int:
+    """
+    Parse the command and dispatch to the UI or a CLI module
+
+    PySide6 and the core managers are imported only by the chosen command,
+    so the terminal commands start without loading the UI stack.
+
+    Args:
+        argv: Arguments without the program name; defaults to sys.argv[1:]
+
+    Returns:
+        Process exit code
+    """
+    from src.cli import backup_cli, detect_cli
+
+    parser = argparse.ArgumentParser(prog="python -m src", description="W-Rebuild")
+    commands = parser.add_subparsers(dest="command")
+    commands.add_parser("ui", help="Start the desktop application (default)")
+    detect_cli.add_arguments(commands.add_parser("detect", help="Detect installed tools"))
+    backup_cli.add_arguments(commands.add_parser("backups", help="List existing backups"))
+    args = parser.parse_args(argv)
+
+    if args.command == "detect":
+        return detect_cli.run(args)
+    if args.command == "backups":
+        return backup_cli.run(args)
+
+    from src.ui.main import main as run_ui
+    run_ui()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
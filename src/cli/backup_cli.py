@@ -0,0 +1,44 @@
+"""
+W-Rebuild Backup CLI
+Lists existing backups from the terminal without starting the UI
+"""
+
+import argparse
+import sys
+
+
+def add_arguments(parser: argparse.ArgumentParser):
+    """Register the backups command's options (none yet)"""
+
+
+def run(args: argparse.Namespace) -> int:
+    """
+    Print the backups found in the backup folder, newest first
+
+    Args:
+        args: Parsed command line options
+
+    Returns:
+        Process exit code
+    """
+    from src.core.backup import BackupManager
+
+    manager = BackupManager()
+    backups = manager.list_backups()
+    if not backups:
+        print(f"No backups found in: {manager.backup_root}")
+        return 0
+
+    # Build the listing first and write it in one call
+    lines = [f"Backups in {manager.backup_root}:"]
+    for backup in backups:
+        lines.append(f"\n• {backup['name']}")
+        lines.append(f"  Timestamp: {backup['timestamp']}")
+        if backup['is_compressed']:
+            lines.append(f"  Compressed: {backup['size']} bytes")
+        else:
+            manifest = backup['manifest']
+            lines.append(f"  Tools: {len(manifest.get('tools', []))}")
+            lines.append(f"  Env Vars: {len(manifest.get('environment_variables', []))}")
+    sys.stdout.write("\n".join(lines) + "\n")
+    return 0
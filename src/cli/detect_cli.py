@@ -0,0 +1,47 @@
+"""
+W-Rebuild Detection CLI
+Runs tool detection from the terminal without starting the UI
+"""
+
+import argparse
+import sys
+
+
+def add_arguments(parser: argparse.ArgumentParser):
+    """Register the detect command's options"""
+    from src.core.detector import DETECTION_PROBE_GROUPS
+
+    parser.add_argument("--workers", type=int, default=DETECTION_PROBE_GROUPS,
+                        help="PowerShell processes to split the detectors across "
+                             f"(default: {DETECTION_PROBE_GROUPS})")
+    parser.add_argument("--cached", action="store_true",
+                        help="Reuse the last cached scan when the installed-software registry, "
+                             "PATH and detection scripts are unchanged (may miss in-place upgrades)")
+
+
+def run(args: argparse.Namespace) -> int:
+    """
+    Detect installed tools and print them
+
+    Args:
+        args: Parsed command line options
+
+    Returns:
+        Process exit code
+    """
+    from src.core.detector import SystemDetector
+
+    detector = SystemDetector(probe_groups=args.workers)
+    try:
+        tools = detector.detect_all_tools(force_refresh=True, use_disk_cache=args.cached)
+    except Exception as e:
+        print(f"✗ {e}", file=sys.stderr)
+        return 1
+
+    # Build the listing first and write it in one call
+    lines = [f"Found {len(tools)} tools:"]
+    for tool in tools:
+        lines.append(f"  - {tool.name} (v{tool.version}) - {tool.tool_type}")
+        lines.append(f"    Path: {tool.path}")
+    sys.stdout.write("\n".join(lines) + "\n")
+    return 0
@@ -8,11 +8,77 @@ import json
 import shutil
 import zipfile
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 import subprocess
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Optional; the stdlib json module is used instead
+
+# Files copied concurrently when backing up a directory tree; each copy spends
+# most of its time blocked in file I/O, so threads overlap well
+BACKUP_COPY_WORKERS = 8
+
+
+def _copy_file(paths: Tuple[Path, Path]) -> bool:
+    """
+    Copy one file with its metadata
+
+    Args:
+        paths: (source, destination) pair
+
+    Returns:
+        True if copied, False if the file was locked or unreadable
+    """
+    try:
+        shutil.copy2(str(paths[0]), str(paths[1]))
+        return True
+    except Exception:
+        return False
+
+
+def _write_json(path: Path, data) -> None:
+    """
+    Write data as indented, human-readable UTF-8 JSON
+
+    The document is encoded in one pass and written with a single call,
+    and non-ASCII names and paths are kept as-is rather than escaped.
+    orjson is used when installed; both encoders produce the same layout.
+
+    Args:
+        path: File to create or overwrite
+        data: JSON-serializable object
+    """
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(json.dumps(data, indent=2, ensure_ascii=False))
+
+
+def _read_json(path) -> object:
+    """
+    Parse a UTF-8 JSON file, with orjson when it is installed
+
+    Args:
+        path: File to read
+
+    Returns:
+        The decoded JSON value
+    """
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
 
 class BackupManager:
     """Manages backup operations for tools and environment variables"""
@@ -641,7 +707,7 @@ class BackupManager:
         }
     
     def create_backup(self, selected_tools: List[Dict], selected_env_vars: List[Dict], 
-                     backup_name: Optional[str] = None) -> Dict:
+                     backup_name: Optional[str] = None, cancel_event=None) -> Dict:
         """
         Create a backup of selected tools and environment variables
         Creates backup in temp directory, zips it to OneDrive, then deletes temp folder
@@ -650,6 +716,8 @@ class BackupManager:
             selected_tools: List of dicts with 'name', 'version', 'path'
             selected_env_vars: List of dicts with 'name', 'value'
             backup_name: Optional custom backup name
+            cancel_event: Optional threading.Event; when set, the backup stops
+                          before the next tool and the partial backup is discarded
         
         Returns:
             Dict with backup results and manifest path
@@ -684,6 +752,15 @@ class BackupManager:
         
         # Backup each selected tool
         for tool in selected_tools:
+            if cancel_event is not None and cancel_event.is_set():
+                shutil.rmtree(backup_dir, ignore_errors=True)
+                return {
+                    "success": False,
+                    "cancelled": True,
+                    "results": results,
+                    "timestamp": timestamp
+                }
+            
             tool_name = tool['name']
             tool_version = tool['version']
             
@@ -746,13 +823,11 @@ class BackupManager:
         # Save environment variables to JSON
         if selected_env_vars:
             env_file = backup_dir / "environment_variables.json"
-            with open(env_file, 'w', encoding='utf-8') as f:
-                json.dump(selected_env_vars, f, indent=2)
+            _write_json(env_file, selected_env_vars)
         
         # Save manifest
         manifest_path = backup_dir / "manifest.json"
-        with open(manifest_path, 'w', encoding='utf-8') as f:
-            json.dump(manifest, f, indent=2)
+        _write_json(manifest_path, manifest)
         
         # Move backup from temp to final location (skip ZIP for now for speed)
         final_backup_dir = self.backup_root / backup_name
@@ -864,7 +939,11 @@ class BackupManager:
         
         # Create destination directory
         dst.mkdir(parents=True, exist_ok=True)
+        created_dirs = {dst}
         
+        # Walk the tree and create the directories first, collecting the files
+        # so they can be copied concurrently afterwards
+        file_pairs = []
         for item in src.rglob('*'):
             try:
                 # Skip cache and temporary folders
@@ -883,20 +962,27 @@ class BackupManager:
                 if item.is_dir():
                     # Create directory
                     dest_item.mkdir(parents=True, exist_ok=True)
+                    created_dirs.add(dest_item)
                 elif item.is_file():
-                    # Copy file
-                    dest_item.parent.mkdir(parents=True, exist_ok=True)
-                    shutil.copy2(str(item), str(dest_item))
-                    files_copied += 1
-            except (PermissionError, OSError) as e:
-                # File is locked or inaccessible - skip it
-                files_skipped += 1
-                skipped_files.append(str(item.relative_to(src)))
-            except Exception as e:
-                # Other errors - skip and log
+                    if dest_item.parent not in created_dirs:
+                        dest_item.parent.mkdir(parents=True, exist_ok=True)
+                        created_dirs.add(dest_item.parent)
+                    file_pairs.append((item, dest_item))
+            except Exception:
+                # Inaccessible entry - skip it
                 files_skipped += 1
                 skipped_files.append(str(item.relative_to(src)))
         
+        # Copy files, skipping locked or inaccessible ones
+        if file_pairs:
+            with ThreadPoolExecutor(max_workers=min(BACKUP_COPY_WORKERS, len(file_pairs))) as executor:
+                for (item, _), copied in zip(file_pairs, executor.map(_copy_file, file_pairs)):
+                    if copied:
+                        files_copied += 1
+                    else:
+                        files_skipped += 1
+                        skipped_files.append(str(item.relative_to(src)))
+        
         return files_copied, files_skipped, skipped_files
     
     def _backup_path(self, source_path: str, dest_folder: Path, path_config: Dict) -> Optional[Dict]:
@@ -1206,44 +1292,52 @@ class BackupManager:
             return None
     
     def list_backups(self) -> List[Dict]:
-        """List all available backups (both folders and zip files)"""
+        """
+        List all available backups (both folders and zip files)
+        
+        The backup root is enumerated with os.scandir, whose entries carry
+        their file type (and on Windows their size) from the directory read.
+        
+        Returns:
+            List of backup dictionaries, newest first
+        """
         backups = []
         
         if not self.backup_root.exists():
             return backups
         
         # Check for both directories and zip files
-        for item in self.backup_root.iterdir():
-            # Check zip files
-            if item.is_file() and item.suffix == '.zip':
-                try:
-                    backups.append({
-                        "name": item.stem,
-                        "path": str(item),
-                        "is_compressed": True,
-                        "size": item.stat().st_size,
-                        "timestamp": item.stem.split('_', 1)[-1] if '_' in item.stem else "unknown"
-                    })
-                except Exception:
-                    pass
-            
-            # Check directories (legacy uncompressed backups)
-            elif item.is_dir():
-                manifest_path = item / "manifest.json"
-                if manifest_path.exists():
+        with os.scandir(self.backup_root) as it:
+            for entry in it:
+                # Check zip files
+                if entry.name.endswith('.zip') and entry.is_file():
+                    stem = entry.name[:-len('.zip')]
                     try:
-                        with open(manifest_path, 'r', encoding='utf-8') as f:
-                            manifest = json.load(f)
+                        backups.append({
+                            "name": stem,
+                            "path": entry.path,
+                            "is_compressed": True,
+                            "size": entry.stat().st_size,
+                            "timestamp": stem.split('_', 1)[-1] if '_' in stem else "unknown"
+                        })
+                    except Exception:
+                        pass
+                
+                # Check directories (legacy uncompressed backups)
+                elif entry.is_dir():
+                    manifest_path = os.path.join(entry.path, "manifest.json")
+                    try:
+                        manifest = _read_json(manifest_path)
                         
                         backups.append({
-                            "name": item.name,
-                            "path": str(item),
+                            "name": entry.name,
+                            "path": entry.path,
                             "manifest": manifest,
                             "is_compressed": False,
                             "timestamp": manifest.get("timestamp", "unknown")
                         })
                     except Exception:
-                        pass
+                        pass  # No readable manifest
         
         return sorted(backups, key=lambda x: x['timestamp'], reverse=True)
     
@@ -6,13 +6,38 @@ Detects installed development tools and software on Windows system
 import json
 import subprocess
 import os
+import hashlib
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import cached_property
 from pathlib import Path
 from typing import List, Dict, Optional
 
+try:
+    import winreg
+except ImportError:
+    winreg = None  # Non-Windows platforms
+
+# Bump when the cached result format changes
+DETECTION_CACHE_VERSION = 1
+
+# Number of PowerShell processes the modular detectors are split across
+DETECTION_PROBE_GROUPS = 4
+
+# Registry roots whose state feeds the detection cache key
+UNINSTALL_REGISTRY_KEYS = [
+    ('HKEY_LOCAL_MACHINE', r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall"),
+    ('HKEY_LOCAL_MACHINE', r"SOFTWARE\WOW6432Node\Microsoft\Windows\CurrentVersion\Uninstall"),
+    ('HKEY_CURRENT_USER', r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall"),
+]
+
 
 class DetectedTool:
     """Represents a detected software tool"""
     
+    # One instance per detected tool/browser; no per-instance __dict__
+    __slots__ = ('name', 'version', 'path', 'tool_type')
+    
     def __init__(self, name: str, version: str, path: str, tool_type: str):
         self.name = name
         self.version = version
@@ -28,6 +53,16 @@ class DetectedTool:
             'type': self.tool_type
         }
     
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'DetectedTool':
+        """Create from a dictionary produced by to_dict()"""
+        return cls(
+            name=data.get('name', 'Unknown'),
+            version=data.get('version', 'Unknown'),
+            path=data.get('path', ''),
+            tool_type=data.get('type', 'Unknown')
+        )
+    
     def __repr__(self):
         return f"DetectedTool(name='{self.name}', version='{self.version}', type='{self.tool_type}')"
 
@@ -35,9 +70,11 @@ class DetectedTool:
 class SystemDetector:
     """Main detector class for scanning installed software"""
     
-    def __init__(self, use_modular: bool = True):
+    def __init__(self, use_modular: bool = True, probe_groups: int = DETECTION_PROBE_GROUPS):
         self.project_root = Path(__file__).parent.parent.parent
         self.use_modular = use_modular
+        # PowerShell processes the modular detectors are split across
+        self.probe_groups = max(1, probe_groups)
         
         # Use modular detection script by default
         if use_modular:
@@ -46,13 +83,27 @@ class SystemDetector:
             self.detect_script = self.project_root / "scripts" / "detect.ps1"
         
         self._cached_tools: Optional[List[DetectedTool]] = None
+        
+        # Persistent cache of detection results, keyed by system state
+        self.cache_dir = Path.home() / ".cache" / "w-rebuild"
     
-    def detect_all_tools(self, force_refresh: bool = False) -> List[DetectedTool]:
+    @cached_property
+    def detect_script_exists(self) -> bool:
+        """Whether the detection script is present, checked once per detector"""
+        # os.path.isfile is a single attribute query on Windows, unlike Path.is_file()
+        return os.path.isfile(self.detect_script)
+    
+    def detect_all_tools(self, force_refresh: bool = False, use_disk_cache: bool = False) -> List[DetectedTool]:
         """
         Detect all installed tools on the system
         
         Args:
-            force_refresh: If True, bypass cache and run fresh detection
+            force_refresh: If True, bypass the in-memory cache and re-check the system
+            use_disk_cache: If True, reuse results from a previous scan when the
+                            installed-software registry keys, PATH and detection
+                            scripts are unchanged since that scan. Opt-in only:
+                            the key cannot see in-place upgrades or tools found
+                            by folder and executable probes, so results may be stale
             
         Returns:
             List of DetectedTool objects
@@ -60,32 +111,35 @@ class SystemDetector:
         if not force_refresh and self._cached_tools is not None:
             return self._cached_tools
         
+        # Fail before hashing the system state or starting PowerShell processes
+        if not self.detect_script_exists:
+            raise Exception(f"Detection failed: script not found: {self.detect_script}")
+        
+        cache_key = self._cache_key() if use_disk_cache else None
+        if cache_key:
+            cached_tools = self._load_disk_cache(cache_key)
+            if cached_tools is not None:
+                self._cached_tools = cached_tools
+                return cached_tools
+        
         try:
-            # Execute PowerShell detection script
-            result = subprocess.run(
-                ["powershell", "-ExecutionPolicy", "Bypass", "-NoLogo", "-NonInteractive", 
-                 "-File", str(self.detect_script)],
-                capture_output=True,
-                text=True,
-                timeout=60,
-                creationflags=subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0
-            )
-            
-            # Parse JSON output
-            output = result.stdout.strip()
-            
-            # Check for errors
-            if result.returncode != 0 or not output:
-                error_msg = result.stderr.strip() if result.stderr else "No output from detection script"
-                raise Exception(f"Detection failed (code {result.returncode}): {error_msg}")
-            
-            tools_data = json.loads(output)
-            
-            # Handle single tool or empty array
-            if not tools_data:
-                return []
-            if isinstance(tools_data, dict):
-                tools_data = [tools_data]
+            # Split the modular detectors into groups and run them concurrently;
+            # each group is its own PowerShell process, so the probes overlap
+            groups = self._detector_groups()
+            tools_data = []
+            if len(groups) > 1:
+                group_results = [None] * len(groups)
+                with ThreadPoolExecutor(max_workers=len(groups)) as executor:
+                    futures = {
+                        executor.submit(self._run_detect_script, ["-Only", ",".join(group)]): index
+                        for index, group in enumerate(groups)
+                    }
+                    for future in as_completed(futures):
+                        group_results[futures[future]] = future.result()
+                for group_data in group_results:
+                    tools_data.extend(group_data)
+            else:
+                tools_data = self._run_detect_script()
             
             # Convert to DetectedTool objects
             detected_tools = []
@@ -100,18 +154,144 @@ class SystemDetector:
             
             # Cache the results
             self._cached_tools = detected_tools
+            if cache_key:
+                self._save_disk_cache(cache_key, detected_tools)
             return detected_tools
             
         except subprocess.TimeoutExpired:
             raise Exception("Detection script timed out after 60 seconds")
-        except json.JSONDecodeError as e:
-            raise Exception(f"Failed to parse detection output: {e}\nOutput was: {output[:200]}")
         except Exception as e:
             # Re-raise with context
             if "Detection failed" in str(e):
                 raise
             raise Exception(f"Error during detection: {e}")
     
+    def _detector_groups(self) -> List[List[str]]:
+        """
+        Split the modular detector scripts into groups for parallel runs
+        
+        Returns:
+            List of detector name groups; empty when the single-process
+            legacy script is in use
+        """
+        detectors_dir = self.detect_script.parent / "detectors"
+        if not self.use_modular or not detectors_dir.is_dir():
+            return []
+        
+        names = sorted(script.stem for script in detectors_dir.glob("*.ps1"))
+        if not names:
+            return []
+        # Contiguous chunks keep the combined output in detector-name order
+        chunk_size = -(-len(names) // self.probe_groups)
+        return [names[index:index + chunk_size] for index in range(0, len(names), chunk_size)]
+    
+    def _run_detect_script(self, extra_args: Optional[List[str]] = None) -> List[Dict]:
+        """
+        Run the detection script once and parse its JSON output
+        
+        Args:
+            extra_args: Additional arguments passed to the script
+            
+        Returns:
+            List of raw tool dictionaries as emitted by PowerShell
+        """
+        result = subprocess.run(
+            ["powershell", "-ExecutionPolicy", "Bypass", "-NoLogo", "-NonInteractive", 
+             "-File", str(self.detect_script)] + (extra_args or []),
+            capture_output=True,
+            text=True,
+            timeout=60,
+            creationflags=subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0
+        )
+        
+        # Parse JSON output
+        output = result.stdout.strip()
+        
+        # Check for errors
+        if result.returncode != 0 or not output:
+            error_msg = result.stderr.strip() if result.stderr else "No output from detection script"
+            raise Exception(f"Detection failed (code {result.returncode}): {error_msg}")
+        
+        try:
+            tools_data = json.loads(output)
+        except json.JSONDecodeError as e:
+            raise Exception(f"Failed to parse detection output: {e}\nOutput was: {output[:200]}")
+        
+        # Handle single tool or empty array
+        if not tools_data:
+            return []
+        if isinstance(tools_data, dict):
+            tools_data = [tools_data]
+        return tools_data
+    
+    def _cache_key(self) -> Optional[str]:
+        """
+        Build a hash of the system state that detection results depend on
+        
+        Returns:
+            Hex digest, or None if the state could not be read
+        """
+        hasher = hashlib.sha256()
+        hasher.update(f"v{DETECTION_CACHE_VERSION}\0".encode())
+        hasher.update(os.environ.get('PATH', '').encode('utf-8', 'replace'))
+        
+        try:
+            # Detection scripts (modular detectors live alongside the main script)
+            scripts = [self.detect_script]
+            detectors_dir = self.detect_script.parent / "detectors"
+            if detectors_dir.is_dir():
+                scripts.extend(sorted(detectors_dir.glob("*.ps1")))
+            for script in scripts:
+                stat = script.stat()
+                hasher.update(f"\0{script.name}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+        except OSError:
+            return None
+        
+        if winreg is not None:
+            # A key's last-write time changes whenever a subkey is added or removed,
+            # i.e. whenever software is installed or uninstalled
+            for hive_name, key_path in UNINSTALL_REGISTRY_KEYS:
+                try:
+                    with winreg.OpenKey(getattr(winreg, hive_name), key_path) as key:
+                        subkey_count, _, last_modified = winreg.QueryInfoKey(key)
+                    hasher.update(f"\0{hive_name}\\{key_path}:{subkey_count}:{last_modified}".encode())
+                except OSError:
+                    hasher.update(f"\0{hive_name}\\{key_path}:missing".encode())
+        
+        return hasher.hexdigest()
+    
+    def _load_disk_cache(self, cache_key: str) -> Optional[List[DetectedTool]]:
+        """Load detection results cached under cache_key, if present"""
+        cache_file = self.cache_dir / f"detect-{cache_key}.json"
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return [DetectedTool.from_dict(item) for item in data['tools']]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+    
+    def _save_disk_cache(self, cache_key: str, tools: List[DetectedTool]):
+        """Atomically write detection results and drop stale cache files"""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            cache_file = self.cache_dir / f"detect-{cache_key}.json"
+            
+            # Write to a temp file first so an interrupted scan never leaves a partial cache
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix="detect-", suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump({'tools': [tool.to_dict() for tool in tools]}, f, indent=2)
+                os.replace(tmp_path, cache_file)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            
+            for old_file in self.cache_dir.glob("detect-*.json"):
+                if old_file != cache_file:
+                    old_file.unlink(missing_ok=True)
+        except OSError:
+            pass  # Caching is best-effort
+    
     def get_tools_by_type(self, tool_type: str) -> List[DetectedTool]:
         """
         Get all tools of a specific type
@@ -164,8 +344,13 @@ class SystemDetector:
         return summary
     
     def clear_cache(self):
-        """Clear cached detection results"""
+        """Clear cached detection results, including the on-disk cache"""
         self._cached_tools = None
+        for cache_file in self.cache_dir.glob("detect-*.json"):
+            try:
+                cache_file.unlink()
+            except OSError:
+                pass
 
 
 # Convenience function for quick detection
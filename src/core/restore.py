@@ -5,19 +5,116 @@ Handles restoration of tool configurations, settings, and environment variables
 
 import os
 import json
+import ctypes
+import time
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 from typing import List, Dict, Optional
 
+try:
+    import winreg
+except ImportError:  # Non-Windows platforms
+    winreg = None
+
+
+# Number of backups whose manifests are read concurrently when listing
+BACKUP_SCAN_WORKERS = 4
+
+# Bump when the backup metadata sidecar format changes
+BACKUP_META_CACHE_VERSION = 1
+
+# Number of concurrent `code --install-extension` processes during restore
+EXTENSION_INSTALL_WORKERS = 3
+
+# Tool-specific silent installation flags for downloaded EXE installers
+SILENT_INSTALL_FLAGS = {
+    'Mockoon': ('/VERYSILENT', '/NORESTART'),
+    'MobaXterm': ('/VERYSILENT', '/SUPPRESSMSGBOXES', '/NORESTART'),
+    'Insomnia': ('/S',),
+    'Default': ('/S', '/SILENT', '/VERYSILENT')  # Try multiple common flags
+}
+
+# Seconds to wait for the setx fallback before giving up on it
+SETX_TIMEOUT = 2
+
+# Longest wait, in seconds, for a fresh install to create its config folders, and the poll interval
+POST_INSTALL_READY_TIMEOUT = 3
+POST_INSTALL_POLL_INTERVAL = 0.1
+
+# Common tool to winget package ID mappings
+WINGET_PACKAGE_IDS = {
+    'Visual Studio Code': 'Microsoft.VisualStudioCode',
+    'VS Code Insiders': 'Microsoft.VisualStudioCode.Insiders',
+    'Python': 'Python.Python.3.12',
+    'Node.js': 'OpenJS.NodeJS',
+    'Git': 'Git.Git',
+    'Docker Desktop': 'Docker.DockerDesktop',
+    'Docker': 'Docker.DockerDesktop',  # Backup config uses "Docker"
+    'Postman': 'Postman.Postman',
+    'IntelliJ IDEA': 'JetBrains.IntelliJIDEA.Community',
+    'PyCharm': 'JetBrains.PyCharm.Community',
+    'WebStorm': 'JetBrains.WebStorm',
+    'Rider': 'JetBrains.Rider',
+    'DataGrip': 'JetBrains.DataGrip',
+    'Android Studio': 'Google.AndroidStudio',
+    'JetBrains Toolbox': 'JetBrains.Toolbox',
+    'Notepad++': 'Notepad++.Notepad++',
+    'Sublime Text': 'SublimeHQ.SublimeText.4',
+    'DBeaver': 'dbeaver.dbeaver',
+    'Azure Data Studio': 'Microsoft.AzureDataStudio',
+    'Oracle SQL Developer': 'Oracle.SQLDeveloper',
+    'Oracle SQL Developer (Config Only)': 'Oracle.SQLDeveloper',  # Config-only detection
+    'MobaXterm': 'Mobatek.MobaXterm',
+    'MongoDB Compass': 'MongoDB.Compass',
+    'Insomnia': 'Insomnia.Insomnia',
+    'Mockoon': 'mockoon.mockoon',
+    # Browsers
+    'Google Chrome': 'Google.Chrome',
+    'Microsoft Edge': 'Microsoft.Edge',
+    'Mozilla Firefox': 'Mozilla.Firefox',
+    'Brave Browser': 'Brave.Brave',
+    'Opera': 'Opera.Opera',
+    'Vivaldi': 'Vivaldi.Vivaldi',
+    'VLC': 'VideoLAN.VLC',
+    '7-Zip': '7zip.7zip',
+    'WinRAR': 'RARLab.WinRAR',
+    'Microsoft Teams': 'Microsoft.Teams',
+    'Slack': 'SlackTechnologies.Slack',
+    'Zoom': 'Zoom.Zoom',
+    'Chrome': 'Google.Chrome',
+    'Firefox': 'Mozilla.Firefox',
+    'Edge': 'Microsoft.Edge',
+    'Windows Terminal': 'Microsoft.WindowsTerminal',
+    'PowerShell': 'Microsoft.PowerShell',
+    'Anaconda': 'Anaconda.Anaconda3',
+    'Miniconda': 'Anaconda.Miniconda3',
+    'MySQL Workbench': 'Oracle.MySQLWorkbench',
+    'PuTTY': 'PuTTY.PuTTY',
+    'WinSCP': 'WinSCP.WinSCP',
+    'FileZilla': 'TimKosse.FileZilla.Client',
+    'Eclipse': 'EclipseAdoptium.Temurin.11.JDK',
+    'Maven': 'Apache.Maven',
+    'Gradle': 'Gradle.Gradle',
+    'Omnissa Horizon Client': 'Omnissa.HorizonClient',
+    'RSA Authenticator': 'RSA.Authenticator'
+}
+
 
 class RestoreManager:
     """Manages restore operations for tools and environment variables"""
     
+    # `<command> --version` probe results, shared by all instances for the process lifetime
+    _command_available: Dict[str, bool] = {}
+    
     def __init__(self):
         # Default backup location in OneDrive (same as backup)
         self.onedrive_path = self._get_onedrive_path()
         self.backup_root = Path(self.onedrive_path) / "Backup Folders" / "W-Rebuild"
         
+        # Manifest summaries keyed by (path, mtime, size), reused across scans
+        self.backup_meta_cache_file = Path.home() / ".cache" / "w-rebuild" / "backup_meta.json"
+        
     def _get_onedrive_path(self) -> str:
         """Get OneDrive folder path"""
         # Try OneDrive - AMDOCS first
@@ -149,78 +246,186 @@ class RestoreManager:
         """
         List all available backup folders and zip files in the backup root directory
         
+        Manifests are read on a small thread pool so zip extraction and
+        OneDrive file reads for different backups overlap.
+        
         Returns:
             List of backup metadata dictionaries sorted by timestamp (newest first)
         """
+        from concurrent.futures import ThreadPoolExecutor
+        
         backups = []
         
         if not self.backup_root.exists():
             return backups
         
         # Scan for backup zip files and folders
-        for item in self.backup_root.iterdir():
-            # Handle zip files
-            if item.is_file() and item.suffix == '.zip' and item.stem.startswith('backup_'):
-                try:
-                    # Extract to temp to read manifest
-                    extracted_path = self._extract_zip_backup(str(item))
-                    if extracted_path:
-                        manifest_path = Path(extracted_path) / "manifest.json"
-                        
-                        if manifest_path.exists():
-                            with open(manifest_path, 'r', encoding='utf-8') as f:
-                                manifest = json.load(f)
-                            
-                            backup_info = {
-                                "backup_name": item.stem,
-                                "backup_path": str(item),
-                                "is_compressed": True,
-                                "extracted_path": extracted_path,
-                                "timestamp": manifest.get("timestamp", "unknown"),
-                                "datetime": manifest.get("datetime", ""),
-                                "tools_count": len(manifest.get("tools", [])),
-                                "env_vars_count": len(manifest.get("environment_variables", [])),
-                                "manifest": manifest
-                            }
-                            
-                            backups.append(backup_info)
-                            
-                            # Don't cleanup yet - will cleanup after user closes restore tab
-                            
-                except Exception as e:
-                    print(f"Warning: Could not read zip backup {item.name}: {e}")
-            
-            # Handle uncompressed folders (legacy)
-            elif item.is_dir() and item.name.startswith('backup_'):
-                manifest_path = item / "manifest.json"
-                
-                if manifest_path.exists():
-                    try:
-                        with open(manifest_path, 'r', encoding='utf-8') as f:
-                            manifest = json.load(f)
-                        
-                        # Extract backup metadata
-                        backup_info = {
-                            "backup_name": item.name,
-                            "backup_path": str(item),
-                            "is_compressed": False,
-                            "timestamp": manifest.get("timestamp", "unknown"),
-                            "datetime": manifest.get("datetime", ""),
-                            "tools_count": len(manifest.get("tools", [])),
-                            "env_vars_count": len(manifest.get("environment_variables", [])),
-                            "manifest": manifest
-                        }
-                        
-                        backups.append(backup_info)
-                    
-                    except Exception as e:
-                        print(f"Warning: Could not read backup {item.name}: {e}")
+        meta_cache = self._load_backup_meta_cache()
+        fresh_cache = {}
+        entries = list(self._iter_backup_entries())
+        if entries:
+            read_entry = partial(self._read_backup_entry, meta_cache=meta_cache, fresh_cache=fresh_cache)
+            with ThreadPoolExecutor(max_workers=min(BACKUP_SCAN_WORKERS, len(entries))) as executor:
+                backups = [info for info in executor.map(read_entry, entries) if info]
+        
+        # Rewrite the sidecar only when something changed; deleted backups drop out
+        if fresh_cache != meta_cache:
+            self._save_backup_meta_cache(fresh_cache)
         
         # Sort by timestamp (newest first)
         backups.sort(key=lambda x: x['timestamp'], reverse=True)
         
         return backups
     
+    def _iter_backup_entries(self):
+        """
+        Yield backup zip files and folders in the backup root
+        
+        os.scandir reports the entry type from the directory listing itself,
+        so no extra stat call is made per entry.
+        
+        Returns:
+            Generator of os.DirEntry objects for backup_* zips and folders
+        """
+        with os.scandir(self.backup_root) as it:
+            for entry in it:
+                if not entry.name.startswith('backup_'):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    yield entry
+                elif entry.name.endswith('.zip') and entry.is_file(follow_symlinks=False):
+                    yield entry
+    
+    def _read_backup_entry(self, entry: os.DirEntry, meta_cache: Dict, fresh_cache: Dict) -> Optional[Dict]:
+        """
+        Read the manifest metadata of a single backup zip or folder
+        
+        Args:
+            entry: Directory entry of a backup zip file or uncompressed backup folder
+            meta_cache: Manifest summaries loaded from the sidecar cache
+            fresh_cache: Collects the summary of every backup seen in this scan
+            
+        Returns:
+            Backup metadata dictionary or None if the entry is not a readable backup
+        """
+        # Handle zip files
+        if not entry.is_dir(follow_symlinks=False):
+            try:
+                # Extract to temp so restore can work from the extracted folder
+                extracted_path = self._extract_zip_backup(entry.path)
+                if extracted_path:
+                    summary = self._read_manifest_summary(
+                        Path(extracted_path) / "manifest.json", entry.path, meta_cache, fresh_cache
+                    )
+                    
+                    if summary:
+                        # Don't cleanup yet - will cleanup after user closes restore tab
+                        return {
+                            "backup_name": entry.name[:-len('.zip')],
+                            "backup_path": entry.path,
+                            "is_compressed": True,
+                            "extracted_path": extracted_path,
+                            **summary
+                        }
+                        
+            except Exception as e:
+                print(f"Warning: Could not read zip backup {entry.name}: {e}")
+        
+        # Handle uncompressed folders (legacy)
+        else:
+            manifest_path = Path(entry.path) / "manifest.json"
+            
+            try:
+                summary = self._read_manifest_summary(
+                    manifest_path, str(manifest_path), meta_cache, fresh_cache
+                )
+                
+                if summary:
+                    # Extract backup metadata
+                    return {
+                        "backup_name": entry.name,
+                        "backup_path": entry.path,
+                        "is_compressed": False,
+                        **summary
+                    }
+            
+            except Exception as e:
+                print(f"Warning: Could not read backup {entry.name}: {e}")
+        
+        return None
+    
+    def _read_manifest_summary(self, manifest_path: Path, source_path: str,
+                               meta_cache: Dict, fresh_cache: Dict) -> Optional[Dict]:
+        """
+        Get the listing fields of a backup manifest, parsing it only when it changed
+        
+        Args:
+            manifest_path: manifest.json to parse on a cache miss
+            source_path: File whose size and mtime identify this version of the
+                         backup (the zip itself, or the folder's manifest)
+            meta_cache: Manifest summaries loaded from the sidecar cache
+            fresh_cache: Collects the summary of every backup seen in this scan
+            
+        Returns:
+            Dictionary with timestamp, datetime, tools_count and env_vars_count,
+            or None if the manifest does not exist
+        """
+        try:
+            stat = os.stat(source_path)
+        except OSError:
+            return None
+        
+        cached = meta_cache.get(source_path)
+        if cached and cached.get("mtime_ns") == stat.st_mtime_ns and cached.get("size") == stat.st_size:
+            summary = cached["summary"]
+        else:
+            if not manifest_path.exists():
+                return None
+            
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            
+            summary = {
+                "timestamp": manifest.get("timestamp", "unknown"),
+                "datetime": manifest.get("datetime", ""),
+                "tools_count": len(manifest.get("tools", [])),
+                "env_vars_count": len(manifest.get("environment_variables", []))
+            }
+        
+        fresh_cache[source_path] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "summary": summary}
+        return dict(summary)
+    
+    def _load_backup_meta_cache(self) -> Dict:
+        """Load cached manifest summaries keyed by backup source path"""
+        try:
+            with open(self.backup_meta_cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") != BACKUP_META_CACHE_VERSION:
+                return {}
+            return data["backups"]
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return {}
+    
+    def _save_backup_meta_cache(self, backups: Dict):
+        """Atomically write the manifest summary sidecar"""
+        import tempfile
+        
+        try:
+            cache_dir = self.backup_meta_cache_file.parent
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            
+            # Write to a temp file first so an interrupted scan never leaves a partial cache
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix="backup_meta-", suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump({"version": BACKUP_META_CACHE_VERSION, "backups": backups}, f, indent=2)
+                os.replace(tmp_path, self.backup_meta_cache_file)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError:
+            pass  # Caching is best-effort
+    
     def get_most_recent_backup(self) -> Optional[Dict]:
         """
         Get the most recent backup
@@ -441,65 +646,7 @@ class RestoreManager:
         Returns:
             Winget package ID or None if not available
         """
-        # Common tool to winget ID mappings
-        winget_ids = {
-            'Visual Studio Code': 'Microsoft.VisualStudioCode',
-            'VS Code Insiders': 'Microsoft.VisualStudioCode.Insiders',
-            'Python': 'Python.Python.3.12',
-            'Node.js': 'OpenJS.NodeJS',
-            'Git': 'Git.Git',
-            'Docker Desktop': 'Docker.DockerDesktop',
-            'Docker': 'Docker.DockerDesktop',  # Backup config uses "Docker"
-            'Postman': 'Postman.Postman',
-            'IntelliJ IDEA': 'JetBrains.IntelliJIDEA.Community',
-            'PyCharm': 'JetBrains.PyCharm.Community',
-            'WebStorm': 'JetBrains.WebStorm',
-            'Rider': 'JetBrains.Rider',
-            'DataGrip': 'JetBrains.DataGrip',
-            'Android Studio': 'Google.AndroidStudio',
-            'JetBrains Toolbox': 'JetBrains.Toolbox',
-            'Notepad++': 'Notepad++.Notepad++',
-            'Sublime Text': 'SublimeHQ.SublimeText.4',
-            'DBeaver': 'dbeaver.dbeaver',
-            'Azure Data Studio': 'Microsoft.AzureDataStudio',
-            'Oracle SQL Developer': 'Oracle.SQLDeveloper',
-            'Oracle SQL Developer (Config Only)': 'Oracle.SQLDeveloper',  # Config-only detection
-            'MobaXterm': 'Mobatek.MobaXterm',
-            'MongoDB Compass': 'MongoDB.Compass',
-            'Insomnia': 'Insomnia.Insomnia',
-            'Mockoon': 'mockoon.mockoon',
-            # Browsers
-            'Google Chrome': 'Google.Chrome',
-            'Microsoft Edge': 'Microsoft.Edge',
-            'Mozilla Firefox': 'Mozilla.Firefox',
-            'Brave Browser': 'Brave.Brave',
-            'Opera': 'Opera.Opera',
-            'Vivaldi': 'Vivaldi.Vivaldi',
-            'VLC': 'VideoLAN.VLC',
-            '7-Zip': '7zip.7zip',
-            'WinRAR': 'RARLab.WinRAR',
-            'Microsoft Teams': 'Microsoft.Teams',
-            'Slack': 'SlackTechnologies.Slack',
-            'Zoom': 'Zoom.Zoom',
-            'Chrome': 'Google.Chrome',
-            'Firefox': 'Mozilla.Firefox',
-            'Edge': 'Microsoft.Edge',
-            'Windows Terminal': 'Microsoft.WindowsTerminal',
-            'PowerShell': 'Microsoft.PowerShell',
-            'Anaconda': 'Anaconda.Anaconda3',
-            'Miniconda': 'Anaconda.Miniconda3',
-            'MySQL Workbench': 'Oracle.MySQLWorkbench',
-            'PuTTY': 'PuTTY.PuTTY',
-            'WinSCP': 'WinSCP.WinSCP',
-            'FileZilla': 'TimKosse.FileZilla.Client',
-            'Eclipse': 'EclipseAdoptium.Temurin.11.JDK',
-            'Maven': 'Apache.Maven',
-            'Gradle': 'Gradle.Gradle',
-            'Omnissa Horizon Client': 'Omnissa.HorizonClient',
-            'RSA Authenticator': 'RSA.Authenticator'
-        }
-        
-        return winget_ids.get(tool_name)
+        return WINGET_PACKAGE_IDS.get(tool_name)
     
     def get_download_url(self, tool_name: str, version: str = None) -> Optional[str]:
         """
@@ -661,7 +808,6 @@ class RestoreManager:
         """
         import subprocess
         import urllib.request
-        import os
         import tempfile
         
         # Check for special cases that need manual download
@@ -762,8 +908,8 @@ class RestoreManager:
                 # MSI installer
                 result = subprocess.run(
                     ['msiexec', '/i', temp_file, '/quiet', '/norestart'],
-                    capture_output=True,
-                    text=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
                     timeout=600
                 )
             else:
@@ -771,8 +917,8 @@ class RestoreManager:
                 silent_flags = self._get_silent_install_flags(tool_name)
                 result = subprocess.run(
                     [temp_file] + silent_flags,
-                    capture_output=True,
-                    text=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
                     timeout=600
                 )
             
@@ -824,15 +970,8 @@ class RestoreManager:
         Returns:
             List of command-line flags for silent installation
         """
-        # Tool-specific silent installation flags
-        silent_flags_map = {
-            'Mockoon': ['/VERYSILENT', '/NORESTART'],
-            'MobaXterm': ['/VERYSILENT', '/SUPPRESSMSGBOXES', '/NORESTART'],
-            'Insomnia': ['/S'],
-            'Default': ['/S', '/SILENT', '/VERYSILENT']  # Try multiple common flags
-        }
-        
-        return silent_flags_map.get(tool_name, silent_flags_map['Default'])
+        # Copy so callers can extend the list without touching the shared table
+        return list(SILENT_INSTALL_FLAGS.get(tool_name, SILENT_INSTALL_FLAGS['Default']))
     
     def install_tool_via_chocolatey(self, tool_name: str, package_name: str) -> Dict:
         """
@@ -851,8 +990,8 @@ class RestoreManager:
             # Check if chocolatey is installed
             choco_check = subprocess.run(
                 ['choco', '--version'],
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 timeout=10
             )
             
@@ -987,47 +1126,19 @@ class RestoreManager:
             if not exe_path or not os.path.exists(exe_path):
                 return False
             
-            # Create shortcuts using PowerShell
+            # Create shortcuts using PowerShell - values are passed as script
+            # parameters rather than spliced into the script text
             shortcut_name = tool_name.replace('(Config Only)', '').strip()
-            
-            # Desktop shortcut
-            desktop_cmd = f'''
-            $WshShell = New-Object -ComObject WScript.Shell
-            $Desktop = [Environment]::GetFolderPath('Desktop')
-            $ShortcutPath = Join-Path $Desktop '{shortcut_name}.lnk'
-            if (Test-Path $ShortcutPath) {{ Remove-Item $ShortcutPath -Force }}
-            $Shortcut = $WshShell.CreateShortcut($ShortcutPath)
-            $Shortcut.TargetPath = '{exe_path}'
-            $Shortcut.WorkingDirectory = '{os.path.dirname(exe_path)}'
-            $Shortcut.Description = '{shortcut_name}'
-            $Shortcut.Save()
-            Write-Host 'Desktop shortcut created'
-            '''
-            
-            subprocess.run(
-                ['powershell', '-Command', desktop_cmd],
-                capture_output=True,
-                timeout=10,
-                creationflags=subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0
-            )
-            
-            # Start Menu shortcut
-            startmenu_cmd = f'''
-            $WshShell = New-Object -ComObject WScript.Shell
-            $StartMenu = [Environment]::GetFolderPath('StartMenu') + '\\Programs'
-            $ShortcutPath = Join-Path $StartMenu '{shortcut_name}.lnk'
-            if (Test-Path $ShortcutPath) {{ Remove-Item $ShortcutPath -Force }}
-            $Shortcut = $WshShell.CreateShortcut($ShortcutPath)
-            $Shortcut.TargetPath = '{exe_path}'
-            $Shortcut.WorkingDirectory = '{os.path.dirname(exe_path)}'
-            $Shortcut.Description = '{shortcut_name}'
-            $Shortcut.Save()
-            Write-Host 'Start Menu shortcut created'
-            '''
+            shortcut_script = Path(__file__).parent.parent.parent / "scripts" / "create_shortcuts.ps1"
             
             subprocess.run(
-                ['powershell', '-Command', startmenu_cmd],
-                capture_output=True,
+                ['powershell', '-ExecutionPolicy', 'Bypass', '-NoLogo', '-NoProfile', '-NonInteractive',
+                 '-File', str(shortcut_script),
+                 '-TargetPath', exe_path,
+                 '-WorkingDirectory', os.path.dirname(exe_path),
+                 '-Name', shortcut_name],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 timeout=10,
                 creationflags=subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0
             )
@@ -1040,6 +1151,32 @@ class RestoreManager:
         
         return False
     
+    def wait_for_config_targets(self, tool_data: Dict, timeout: float = POST_INSTALL_READY_TIMEOUT) -> bool:
+        """
+        Wait for a freshly installed tool to create the folders its configs restore into
+        
+        Args:
+            tool_data: Tool data from manifest
+            timeout: Maximum seconds to wait
+            
+        Returns:
+            True if every target folder exists, False if the wait timed out
+        """
+        target_dirs = {
+            os.path.dirname(item['source'])
+            for item in tool_data.get('backed_up_items', [])
+            if item.get('source')
+        }
+        target_dirs.discard('')
+        
+        deadline = time.monotonic() + timeout
+        while True:
+            if all(os.path.isdir(target_dir) for target_dir in target_dirs):
+                return True
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(POST_INSTALL_POLL_INTERVAL)
+    
     def restore_tool_configs(self, backup_path: str, tool_name: str, tool_data: Dict, is_compressed: bool = False, extracted_path: str = None) -> Dict:
         """
         Restore configurations for a specific tool
@@ -1055,7 +1192,6 @@ class RestoreManager:
             Dictionary with restoration results
         """
         import shutil
-        import winreg
         import subprocess
         
         # Use extracted path for compressed backups
@@ -1261,6 +1397,52 @@ class RestoreManager:
         
         return None
     
+    def _read_list_file(self, list_file: str) -> List[str]:
+        """
+        Read a one-entry-per-line list file (extensions.txt, plugins.txt, packages.txt)
+        
+        The whole file is read in a single call and split at C level instead of
+        iterating the buffered text reader line by line.
+        
+        Args:
+            list_file: Path to the list file
+            
+        Returns:
+            List of non-empty, stripped entries
+        """
+        data = Path(list_file).read_bytes().decode('utf-8', 'replace')
+        return [line.strip() for line in data.splitlines() if line.strip()]
+    
+    def _is_command_available(self, command: str) -> bool:
+        """
+        Check whether a CLI command (e.g. code, code-insiders) can be run
+        
+        The `--version` probe starts a full editor process, so the result is
+        cached on the class and only probed once per process.
+        
+        Args:
+            command: Command name to probe
+            
+        Returns:
+            True if `<command> --version` exits successfully
+        """
+        import subprocess
+        
+        cache = RestoreManager._command_available
+        if command not in cache:
+            try:
+                check = subprocess.run(
+                    [command, '--version'],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    timeout=10
+                )
+                cache[command] = check.returncode == 0
+            except (OSError, subprocess.TimeoutExpired):
+                cache[command] = False
+        
+        return cache[command]
+    
     def _restore_vscode_extensions(self, backup_path: str, command: str, folder_name: str) -> Dict:
         """
         Restore VS Code/Insiders extensions from backup
@@ -1273,6 +1455,9 @@ class RestoreManager:
         Returns:
             Dictionary with installation results
         """
+        import subprocess
+        from concurrent.futures import ThreadPoolExecutor
+        
         results = {
             'installed': [],
             'failed': [],
@@ -1288,27 +1473,19 @@ class RestoreManager:
         
         try:
             # Read extensions list
-            with open(extensions_file, 'r', encoding='utf-8') as f:
-                extensions = [line.strip() for line in f if line.strip()]
+            extensions = self._read_list_file(extensions_file)
             
             if not extensions:
                 results['skipped'].append("No extensions in backup")
                 return results
             
             # Check if command is available
-            check = subprocess.run(
-                [command, '--version'],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            
-            if check.returncode != 0:
+            if not self._is_command_available(command):
                 results['skipped'].append(f"'{command}' command not available in PATH")
                 return results
             
-            # Install each extension
-            for ext in extensions:
+            def install_extension(ext: str):
+                """Install one extension, returning (ext, error) with error None on success"""
                 try:
                     result = subprocess.run(
                         [command, '--install-extension', ext, '--force'],
@@ -1318,14 +1495,23 @@ class RestoreManager:
                     )
                     
                     if result.returncode == 0:
-                        results['installed'].append(f"Extension: {ext}")
-                    else:
-                        results['failed'].append(f"Extension {ext}: {result.stderr.strip()}")
+                        return ext, None
+                    return ext, result.stderr.strip()
                         
                 except subprocess.TimeoutExpired:
-                    results['failed'].append(f"Extension {ext}: Installation timeout")
+                    return ext, "Installation timeout"
                 except Exception as e:
-                    results['failed'].append(f"Extension {ext}: {str(e)}")
+                    return ext, str(e)
+            
+            # Install extensions a few at a time - each call starts a full editor
+            # process, so running them side by side overlaps the startup cost.
+            # map() keeps the results in the same order as extensions.txt.
+            with ThreadPoolExecutor(max_workers=EXTENSION_INSTALL_WORKERS) as executor:
+                for ext, error in executor.map(install_extension, extensions):
+                    if error is None:
+                        results['installed'].append(f"Extension: {ext}")
+                    else:
+                        results['failed'].append(f"Extension {ext}: {error}")
             
         except Exception as e:
             results['failed'].append(f"Error reading extensions list: {str(e)}")
@@ -1357,8 +1543,7 @@ class RestoreManager:
         
         if os.path.exists(plugins_file):
             try:
-                with open(plugins_file, 'r', encoding='utf-8') as f:
-                    plugins = [line.strip() for line in f if line.strip()]
+                plugins = self._read_list_file(plugins_file)
                 
                 if plugins:
                     results['installed'].append(f"Plugins restored with config ({len(plugins)} plugins)")
@@ -1394,8 +1579,7 @@ class RestoreManager:
         
         if os.path.exists(packages_file):
             try:
-                with open(packages_file, 'r', encoding='utf-8') as f:
-                    packages = [line.strip() for line in f if line.strip()]
+                packages = self._read_list_file(packages_file)
                 
                 if packages:
                     results['installed'].append(f"Packages restored with config ({len(packages)} packages)")
@@ -1518,6 +1702,11 @@ class RestoreManager:
             newest_path = os.path.join(sqldeveloper_path, newest)
             source_path = os.path.join(sqldeveloper_path, source)
             
+            # Sentinel dropped after a previous migration - skips the tree walk below
+            sentinel = os.path.join(newest_path, '.rebuild_migrated')
+            if os.path.exists(sentinel):
+                return True
+            
             # Check if newest already has connections (skip if already migrated)
             connections_check = None
             for root, dirs, files in os.walk(newest_path):
@@ -1525,13 +1714,19 @@ class RestoreManager:
                     connections_check = os.path.join(root, 'connections.json')
                     break
             
-            if connections_check and os.path.exists(connections_check):
-                # Check if file has content (size > 10 bytes)
-                if os.path.getsize(connections_check) > 10:
-                    return True  # Already migrated
+            if connections_check:
+                # Check if file has content (size > 10 bytes) - os.walk just listed it,
+                # so a single stat covers both existence and size
+                try:
+                    if os.stat(connections_check).st_size > 10:
+                        return True  # Already migrated
+                except OSError:
+                    pass
             
             # Copy ALL important folders and files from old version to new version
             # This includes: connections, preferences, NLS settings, fonts, line numbers, etc.
+            # shutil.copy skips the per-file timestamp/permission copy that copy2 does -
+            # migrated files don't need the old version's metadata.
             
             # 1. Copy all o.sqldeveloper.* folders (contains product-preferences.xml with NLS, fonts, line numbers)
             for item in os.listdir(source_path):
@@ -1542,7 +1737,7 @@ class RestoreManager:
                     if os.path.isdir(source_folder):
                         if os.path.exists(dest_folder):
                             shutil.rmtree(dest_folder, ignore_errors=True)
-                        shutil.copytree(source_folder, dest_folder, dirs_exist_ok=True)
+                        shutil.copytree(source_folder, dest_folder, dirs_exist_ok=True, copy_function=shutil.copy)
             
             # 2. Copy all o.jdeveloper.* folders (contains connections.json)
             for item in os.listdir(source_path):
@@ -1553,7 +1748,7 @@ class RestoreManager:
                     if os.path.isdir(source_folder):
                         if os.path.exists(dest_folder):
                             shutil.rmtree(dest_folder, ignore_errors=True)
-                        shutil.copytree(source_folder, dest_folder, dirs_exist_ok=True)
+                        shutil.copytree(source_folder, dest_folder, dirs_exist_ok=True, copy_function=shutil.copy)
             
             # 3. Copy all o.ide.* folders (contains IDE preferences)
             for item in os.listdir(source_path):
@@ -1564,7 +1759,7 @@ class RestoreManager:
                     if os.path.isdir(source_folder):
                         if os.path.exists(dest_folder):
                             shutil.rmtree(dest_folder, ignore_errors=True)
-                        shutil.copytree(source_folder, dest_folder, dirs_exist_ok=True)
+                        shutil.copytree(source_folder, dest_folder, dirs_exist_ok=True, copy_function=shutil.copy)
             
             # 4. Copy system_cache folder (contains additional preferences)
             system_cache_src = os.path.join(source_path, 'system_cache')
@@ -1572,7 +1767,7 @@ class RestoreManager:
             if os.path.exists(system_cache_src):
                 if os.path.exists(system_cache_dest):
                     shutil.rmtree(system_cache_dest, ignore_errors=True)
-                shutil.copytree(system_cache_src, system_cache_dest, dirs_exist_ok=True)
+                shutil.copytree(system_cache_src, system_cache_dest, dirs_exist_ok=True, copy_function=shutil.copy)
             
             # 5. Copy UserSnippets folder if exists
             snippets_src = os.path.join(source_path, 'UserSnippets')
@@ -1580,7 +1775,10 @@ class RestoreManager:
             if os.path.exists(snippets_src):
                 if os.path.exists(snippets_dest):
                     shutil.rmtree(snippets_dest, ignore_errors=True)
-                shutil.copytree(snippets_src, snippets_dest, dirs_exist_ok=True)
+                shutil.copytree(snippets_src, snippets_dest, dirs_exist_ok=True, copy_function=shutil.copy)
+            
+            # Mark newest version as migrated so later restores skip the scan
+            open(sentinel, 'w').close()
             
             return True
             
@@ -1631,10 +1829,106 @@ class RestoreManager:
         """
         return self.install_tool_via_winget(tool_name, winget_id)
     
+    def _read_user_env_var(self, var_name: str) -> Optional[str]:
+        r"""
+        Read a user environment variable from HKEY_CURRENT_USER\Environment
+        
+        Args:
+            var_name: Name of the environment variable
+            
+        Returns:
+            Stored (unexpanded) value, or None if the variable is not set
+        """
+        if winreg is None:
+            return None
+        
+        with winreg.OpenKey(winreg.HKEY_CURRENT_USER, 'Environment') as key:
+            try:
+                value, _ = winreg.QueryValueEx(key, var_name)
+            except FileNotFoundError:
+                return None
+        return value
+    
+    def _broadcast_environment_change(self) -> None:
+        """
+        Notify running applications (Explorer, new shells) that the environment changed
+        
+        Sends WM_SETTINGCHANGE with "Environment" - the same notification setx sends.
+        SMTO_ABORTIFHUNG keeps a hung window from stalling the restore.
+        """
+        HWND_BROADCAST = 0xFFFF
+        WM_SETTINGCHANGE = 0x001A
+        SMTO_ABORTIFHUNG = 0x0002
+        
+        try:
+            result = ctypes.c_ulong()
+            ctypes.windll.user32.SendMessageTimeoutW(
+                HWND_BROADCAST, WM_SETTINGCHANGE, 0, 'Environment',
+                SMTO_ABORTIFHUNG, 100, ctypes.byref(result)
+            )
+        except (AttributeError, OSError):
+            pass  # Value is saved; only already-running programs miss the update
+    
+    def restore_environment_variables(self, env_vars: Dict[str, str]) -> Dict[str, Dict]:
+        r"""
+        Restore several environment variables in one registry session
+        
+        HKCU\Environment is opened once, every value is written, and
+        WM_SETTINGCHANGE is broadcast once at the end - instead of one setx
+        process and one broadcast per variable. Values containing %VAR%
+        references are stored as REG_EXPAND_SZ, everything else as REG_SZ.
+        Variables that cannot be written to the registry fall back to setx.
+        
+        Args:
+            env_vars: Mapping of variable name to value
+            
+        Returns:
+            Mapping of variable name to its restoration result dictionary
+        """
+        results = {}
+        
+        try:
+            if winreg is not None:
+                with winreg.OpenKey(winreg.HKEY_CURRENT_USER, 'Environment', 0, winreg.KEY_SET_VALUE) as key:
+                    for var_name, var_value in env_vars.items():
+                        value_type = winreg.REG_EXPAND_SZ if '%' in var_value else winreg.REG_SZ
+                        try:
+                            winreg.SetValueEx(key, var_name, 0, value_type, var_value)
+                        except OSError:
+                            continue  # Retried with setx below
+                        results[var_name] = {
+                            'success': True,
+                            'message': f'Successfully set {var_name}'
+                        }
+        except OSError:
+            pass  # Fall back to setx for everything not written yet
+        
+        if results:
+            self._broadcast_environment_change()
+        
+        for var_name, var_value in env_vars.items():
+            if var_name not in results:
+                results[var_name] = self._set_env_var_with_setx(var_name, var_value)
+        
+        return results
+    
     def restore_environment_variable(self, var_name: str, var_value: str) -> Dict:
         """
         Restore an environment variable
         
+        Args:
+            var_name: Name of the environment variable
+            var_value: Value to set
+            
+        Returns:
+            Dictionary with restoration results
+        """
+        return self.restore_environment_variables({var_name: var_value})[var_name]
+    
+    def _set_env_var_with_setx(self, var_name: str, var_value: str) -> Dict:
+        """
+        Set a user environment variable with setx (fallback when the registry write fails)
+        
         Args:
             var_name: Name of the environment variable
             var_value: Value to set
@@ -1653,29 +1947,34 @@ class RestoreManager:
                     'error': f'Value too long ({len(var_value)} chars). Maximum is 1024 characters for setx.'
                 }
             
-            # Escape quotes in the value
-            escaped_value = var_value.replace('"', '\\"')
-            
-            # Use shell=True and shorter timeout
-            # Note: setx writes success message to stdout, not stderr
-            result = subprocess.run(
-                f'setx {var_name} "{escaped_value}"',
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=10,
+            # Run setx.exe directly with an argument list - no cmd.exe wrapper process,
+            # and subprocess handles quoting of the value
+            # Note: setx writes its success message to stdout, which is discarded -
+            # only stderr is captured, and only decoded on failure
+            process = subprocess.Popen(
+                ['setx', var_name, var_value],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 creationflags=subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0
             )
+            try:
+                _, stderr = process.communicate(timeout=SETX_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                # setx is a single registry write + broadcast; if it is still running
+                # it is stuck on the broadcast - stop it and check the registry below
+                process.kill()
+                process.wait()
+                raise
             
             # setx returns 0 on success and writes "SUCCESS: Specified value was saved." to stdout
-            if result.returncode == 0:
+            if process.returncode == 0:
                 return {
                     'success': True,
                     'message': f'Successfully set {var_name}'
                 }
             else:
                 # On error, setx writes to stderr
-                error_msg = result.stderr.strip() if result.stderr else result.stdout.strip()
+                error_msg = stderr.decode('mbcs', 'replace').strip() if stderr else ''
                 return {
                     'success': False,
                     'error': error_msg or 'Unknown error setting environment variable'
@@ -1684,27 +1983,20 @@ class RestoreManager:
         except subprocess.TimeoutExpired:
             # Even if it times out, the variable might have been set
             # Try to verify by reading it back
-            import os
             try:
-                # Check if variable was actually set
-                test_result = subprocess.run(
-                    f'echo %{var_name}%',
-                    shell=True,
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                if test_result.returncode == 0 and var_value in test_result.stdout:
+                # Check if variable was actually set - read what setx wrote to the
+                # registry rather than a child shell's inherited environment
+                if self._read_user_env_var(var_name) == var_value:
                     return {
                         'success': True,
                         'message': f'Successfully set {var_name} (verified after timeout)'
                     }
-            except:
+            except OSError:
                 pass
             
             return {
                 'success': False,
-                'error': 'Command timed out after 10 seconds. Variable may or may not have been set.'
+                'error': f'Command timed out after {SETX_TIMEOUT} seconds. Variable may or may not have been set.'
             }
         except Exception as e:
             return {
@@ -0,0 +1,83 @@
+"""
+W-Rebuild Utilities Module
+Registry, filesystem and other system helpers shared by the core modules
+"""
+
+import os
+from operator import itemgetter
+from typing import Dict, List, Tuple
+
+try:
+    import winreg
+except ImportError:
+    winreg = None  # Non-Windows platforms
+
+# Registry locations of persistent environment variables, lowest precedence first
+ENVIRONMENT_REGISTRY_KEYS = [
+    ('System', 'HKEY_LOCAL_MACHINE', r"SYSTEM\CurrentControlSet\Control\Session Manager\Environment"),
+    ('User', 'HKEY_CURRENT_USER', r"Environment"),
+]
+
+
+def read_registry_environment() -> Dict[str, Tuple[str, str, str]]:
+    """
+    Read persistent environment variables from the registry
+
+    Each key is opened once and enumerated in a single pass.
+
+    Returns:
+        Dict mapping upper-cased name to (name, value, scope); user values
+        override system values of the same name
+    """
+    variables = {}
+    if winreg is None:
+        return variables
+
+    for scope, hive_name, key_path in ENVIRONMENT_REGISTRY_KEYS:
+        try:
+            with winreg.OpenKey(getattr(winreg, hive_name), key_path) as key:
+                index = 0
+                while True:
+                    try:
+                        name, value, _ = winreg.EnumValue(key, index)
+                    except OSError:
+                        break  # No more values
+                    index += 1
+                    if isinstance(value, str):
+                        variables[name.upper()] = (name, value, scope)
+        except OSError:
+            continue  # Key missing or access denied
+
+    return variables
+
+
+def collect_environment_variables() -> List[Tuple[str, str, str]]:
+    """
+    Snapshot environment variables from the process and the registry
+
+    Process values win, since they are what running tools actually see.
+    Variables saved to the registry after this process started are included
+    with their raw registry value.
+
+    Returns:
+        List of (name, value, scope) tuples sorted by name, where scope is
+        'User', 'System' or 'Process'
+    """
+    registry_vars = read_registry_environment()
+
+    # Decorate with the upper-cased name computed for the registry lookup,
+    # so sorting does not upper-case every name a second time
+    decorated = []
+    seen = set()
+    for name, value in os.environ.copy().items():
+        key = name.upper()
+        seen.add(key)
+        scope = registry_vars[key][2] if key in registry_vars else 'Process'
+        decorated.append((key, name, value, scope))
+
+    for key, (name, value, scope) in registry_vars.items():
+        if key not in seen:
+            decorated.append((key, name, value, scope))
+
+    decorated.sort(key=itemgetter(0))
+    return [(name, value, scope) for _, name, value, scope in decorated]
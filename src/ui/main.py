@@ -5,73 +5,665 @@ Entry point for the PySide6 desktop application
 
 import sys
 import os
+import time
+import threading
 
 # Suppress Qt display warnings (harmless Qt/Windows monitor query errors)
 os.environ['QT_LOGGING_RULES'] = 'qt.qpa.screen=false'
 
 from pathlib import Path
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import cached_property, lru_cache
+from itertools import islice
 from datetime import datetime
+from string import Template
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, 
     QHBoxLayout, QPushButton, QLabel, QStatusBar,
-    QTableWidget, QTableWidgetItem, QHeaderView,
+    QTableWidget, QTableWidgetItem, QTableView, QHeaderView,
     QProgressBar, QToolBar, QMessageBox, QTabWidget,
-    QTextEdit, QSplitter, QGroupBox, QLineEdit, QSizePolicy
+    QTextEdit, QSplitter, QGroupBox, QLineEdit, QSizePolicy,
+    QStyle, QStyledItemDelegate, QStyleOptionViewItem, QStyleOptionButton,
+    QDialog, QDialogButtonBox, QPlainTextEdit
 )
-from PySide6.QtCore import Qt, QThread, Signal, QSize
-from PySide6.QtGui import QIcon, QAction, QFont, QScreen
+from PySide6.QtCore import (
+    Qt, QObject, QRunnable, QThreadPool, Signal, QSize, QRect, QFile, QIODevice,
+    QAbstractTableModel, QModelIndex, QSortFilterProxyModel, QTimer, QUrl
+)
+from PySide6.QtGui import QIcon, QAction, QFont, QScreen, QColor, QBrush, QDesktopServices
+
+# Add project root to path when run as a script (python src\ui\main.py)
+if not __package__:
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+# Compiled Qt resources (stylesheet, icons) served from ":/". Regenerate after
+# editing src/ui/resources:
+#   pyside6-rcc --compress-algo zlib src/ui/resources/resources.qrc -o src/ui/resources_rc.py
+from src.ui import resources_rc  # noqa: F401  (registers the resources on import)
+
+# Seconds a registry/process environment snapshot is reused before re-reading
+ENV_SNAPSHOT_TTL = 30
+
+# Backup rows added to the restore table per event-loop tick
+BACKUP_ROWS_PER_BATCH = 200
+
+# Rendered backup details kept for re-selection, most recently viewed last
+BACKUP_HTML_CACHE_SIZE = 32
+
+# Lines kept in the installation log before the oldest are dropped
+INSTALL_LOG_MAX_BLOCKS = 2000
+
+# Core managers (src.core.*) are imported by MainWindow's lazy manager properties,
+# so neither importing this module nor opening the window pulls in the detector,
+# backup and restore stacks
+
+
+@lru_cache(maxsize=None)
+def _app_qss_template() -> Template:
+    """
+    Load the application stylesheet from the compiled resources
+
+    Widgets are matched by object name; the sheet is substituted in
+    _build_stylesheets() and applied once in apply_styles(), so each widget
+    is polished once instead of once per setStyleSheet() call.
+    """
+    qss_file = QFile(":/styles/main.qss")
+    qss_file.open(QIODevice.OpenModeFlag.ReadOnly)
+    try:
+        return Template(bytes(qss_file.readAll()).decode('utf-8'))
+    finally:
+        qss_file.close()
+
+
+# Responsive sizes for a screen width bucket
+DimensionProfile = namedtuple('DimensionProfile', [
+    'window_width_percent', 'window_height_percent',
+    'font_size_title', 'font_size_normal', 'font_size_small',
+    'button_height', 'button_min_width', 'table_row_height', 'padding'
+])
+
+# CSS size strings used by the backup details HTML
+SizeTokens = namedtuple('SizeTokens', [
+    'icon_size', 'padding_lg', 'padding_md', 'padding_sm', 'margin_section',
+    'h3_size', 'h4_size', 'text_size', 'small_size'
+])
+
+# Opening tags of the backup details HTML; only their sizes vary, so they are
+# rendered once per SizeTokens by _build_size_tokens()
+_DETAILS_TAG_TEMPLATES = {
+    'root': "<div style='font-family: Segoe UI, Arial; padding: {padding_sm};'>",
+    'header': "<div style='background-color: #E3F2FD; padding: {padding_md}; border-radius: 6px; margin-bottom: {margin_section};'>",
+    'title': "<h3 style='margin: 0; color: #0078D4; font-size: {h3_size};'>",
+    'subtitle': "<p style='margin: 5px 0 0 0; color: #666; font-size: {small_size};'>",
+    'icon': "<span style='font-size: {icon_size};'>",
+    'section': "<div style='margin-bottom: {margin_section};'>",
+    'heading': "<h4 style='color: #0078D4; margin: 0 0 10px 0; border-bottom: 2px solid #0078D4; padding-bottom: 5px; font-size: {h4_size};'>",
+    'tool_cell': "<td style='padding: {padding_sm} 5px;'>",
+    'tool_name': "<div style='font-weight: bold; color: #333; font-size: {text_size};'>",
+    'tool_version': "<div style='font-size: {small_size}; color: #666;'>",
+    'tool_count': "<div style='font-size: {small_size}; color: #28A745;'>",
+    'empty': "<p style='color: #999; font-style: italic; font-size: {text_size};'>",
+    'env_box': "<div style='background-color: #F5F5F5; padding: {padding_sm}; border-radius: 4px;'>",
+    'env_row': "<div style='padding: 3px 0; font-family: Consolas, monospace; font-size: {small_size};'>",
+    'env_more': "<div style='padding: 8px 0; color: #666; font-style: italic; font-size: {small_size};'>",
+    'error': "<div style='color: red; padding: {padding_lg};'>",
+    'error_title': "<p style='font-size: {text_size};'>",
+    'error_text': "<p style='font-size: {small_size};'>",
+}
+DetailsTags = namedtuple('DetailsTags', _DETAILS_TAG_TEMPLATES)
+
+
+@lru_cache(maxsize=8)
+def _dimension_profile(screen_width: int) -> DimensionProfile:
+    """Return responsive window, font and control sizes for a screen width"""
+    if screen_width >= 2560:  # 4K/Ultra-wide monitor
+        return DimensionProfile(
+            window_width_percent=0.65, window_height_percent=0.70,
+            font_size_title=20, font_size_normal=13, font_size_small=12,
+            button_height=44, button_min_width=200,
+            table_row_height=38, padding=25
+        )
+    elif screen_width >= 1920:  # Desktop/Large monitor (1080p)
+        return DimensionProfile(
+            window_width_percent=0.70, window_height_percent=0.75,
+            font_size_title=18, font_size_normal=12, font_size_small=11,
+            button_height=40, button_min_width=180,
+            table_row_height=36, padding=20
+        )
+    elif screen_width >= 1366:  # Laptop/Medium screen
+        return DimensionProfile(
+            window_width_percent=0.80, window_height_percent=0.80,
+            font_size_title=14, font_size_normal=10, font_size_small=9,
+            button_height=36, button_min_width=160,
+            table_row_height=32, padding=15
+        )
+    else:  # Small laptop/tablet
+        return DimensionProfile(
+            window_width_percent=0.90, window_height_percent=0.85,
+            font_size_title=13, font_size_normal=9, font_size_small=8,
+            button_height=32, button_min_width=140,
+            table_row_height=30, padding=10
+        )
+
+
+@lru_cache(maxsize=1)
+def _available_screen_geometry() -> QRect:
+    """
+    Return the primary screen's available geometry
+
+    The value is cached for the process and cleared whenever a screen is
+    added or removed, the primary screen changes, or a work area changes.
+    """
+    global _screen_cache_hooked
+    app = QApplication.instance()
+    if not _screen_cache_hooked:
+        for screen in app.screens():
+            screen.availableGeometryChanged.connect(_invalidate_screen_geometry)
+        app.screenAdded.connect(_on_screen_added)
+        app.screenRemoved.connect(_invalidate_screen_geometry)
+        app.primaryScreenChanged.connect(_invalidate_screen_geometry)
+        _screen_cache_hooked = True
+    
+    return QRect(app.primaryScreen().availableGeometry())
+
+
+def _on_screen_added(screen):
+    screen.availableGeometryChanged.connect(_invalidate_screen_geometry)
+    _invalidate_screen_geometry()
+
+
+def _invalidate_screen_geometry(*_):
+    _available_screen_geometry.cache_clear()
+
+
+_screen_cache_hooked = False
+
+
+@lru_cache(maxsize=None)
+def _icon(name: str) -> QIcon:
+    """Load a button icon from the compiled resources (cached per name)"""
+    return QIcon(f":/icons/{name}.svg")
+
+
+def _set_style_property(widget, name: str, value):
+    """Set a property used by stylesheet selectors and re-polish the widget if it changed"""
+    if widget.property(name) == value:
+        return
+    widget.setProperty(name, value)
+    widget.style().unpolish(widget)
+    widget.style().polish(widget)
+
+
+def _set_button_icon(button: QPushButton, name: str):
+    """Show an icon next to a button's text instead of an emoji glyph"""
+    button.setIcon(_icon(name))
+    button.setIconSize(QSize(16, 16))
+
+
+def _checkbox_item(state) -> QTableWidgetItem:
+    """Create a centred, user-checkable table cell with the given check state"""
+    item = QTableWidgetItem()
+    item.setFlags(Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled)
+    item.setCheckState(state)
+    item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+    return item
+
+
+class _TextTooltipItem(QTableWidgetItem):
+    """Table cell whose tooltip is its own text, resolved only when hovered"""
+
+    def data(self, role):
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return self.text()
+        return super().data(role)
+
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+def _checked_rows(table) -> list:
+    """Return the rows of a QTableWidget whose column-0 checkbox is checked"""
+    get_item = table.item
+    checked = Qt.CheckState.Checked
+    rows = []
+    for row in range(table.rowCount()):
+        item = get_item(row, 0)
+        if item is not None and item.checkState() == checked:
+            rows.append(row)
+    return rows
 
-from src.core.detector import SystemDetector, DetectedTool
-from src.core.backup import BackupManager
-from src.core.restore import RestoreManager
 
+@contextmanager
+def _bulk_table_update(table):
+    """
+    Suspend sorting, signals and repaints while a table is being filled or cleared
+    
+    Without this every setItem() on a checkable row emits itemChanged and
+    re-sorts the table, turning an O(n) fill into O(n^2) work.
+    """
+    sorting_enabled = table.isSortingEnabled()
+    table.setSortingEnabled(False)
+    signals_blocked = table.blockSignals(True)
+    table.setUpdatesEnabled(False)
+    try:
+        yield table
+    finally:
+        table.setUpdatesEnabled(True)
+        table.blockSignals(signals_blocked)
+        table.setSortingEnabled(sorting_enabled)
 
-class BackupWorker(QThread):
-    """Worker thread for running backup without blocking UI"""
+
+def _format_backup_datetime(backup: dict) -> str:
+    """Format a backup's ISO datetime for display, falling back to its raw timestamp"""
+    datetime_str = backup.get('datetime', backup['timestamp'])
+    if not datetime_str:
+        return backup['timestamp']
+    if datetime_str.endswith('Z'):
+        datetime_str = datetime_str[:-1] + '+00:00'
+    try:
+        return datetime.fromisoformat(datetime_str).strftime("%Y-%m-%d %H:%M:%S")
+    except ValueError:
+        return datetime_str
+
+
+class WorkerSignals(QObject):
+    """Signals emitted by pooled workers (QRunnable cannot define signals itself)"""
     
-    finished = Signal(dict)  # Emits backup results
+    finished = Signal(object)  # Emits the worker result
     error = Signal(str)  # Emits error message
     progress = Signal(str)  # Emits progress messages
+
+
+class BackupWorkerSignals(WorkerSignals):
+    """Backup worker signals; finished also carries the text summary built off the UI thread"""
     
-    def __init__(self, backup_manager: BackupManager, selected_tools: list, selected_env_vars: list):
+    finished = Signal(dict, str)  # Emits the backup results and their summary
+
+
+class BackupWorker(QRunnable):
+    """Pooled worker for running backup without blocking UI"""
+    
+    def __init__(self, backup_manager: 'BackupManager', selected_tools: list, selected_env_vars: list):
         super().__init__()
+        
+        self.signals = BackupWorkerSignals()
         self.backup_manager = backup_manager
         self.selected_tools = selected_tools
         self.selected_env_vars = selected_env_vars
+        self.cancel_event = threading.Event()
+        self.setAutoDelete(True)
+    
+    def cancel(self):
+        """Ask the backup to stop before the next tool"""
+        self.cancel_event.set()
     
     def run(self):
-        """Run backup in background thread"""
+        """Run backup in a pool thread"""
         try:
-            self.progress.emit("Initializing backup...")
+            self.signals.progress.emit("Initializing backup...")
             results = self.backup_manager.create_backup(
                 self.selected_tools,
-                self.selected_env_vars
+                self.selected_env_vars,
+                cancel_event=self.cancel_event
             )
-            self.finished.emit(results)
+            # Build the details text here so completion only has to show it
+            summary = self.backup_manager.get_backup_summary(results) if results.get('success') else ''
+            self.signals.finished.emit(results, summary)
         except Exception as e:
-            self.error.emit(str(e))
+            self.signals.error.emit(str(e))
 
 
-class DetectionWorker(QThread):
-    """Worker thread for running detection without blocking UI"""
+class DetectionWorker(QRunnable):
+    """Pooled worker for running detection without blocking UI"""
     
-    finished = Signal(list)  # Emits list of DetectedTool objects
-    error = Signal(str)  # Emits error message
-    
-    def __init__(self, detector: SystemDetector):
+    def __init__(self, detector: 'SystemDetector'):
         super().__init__()
+        self.signals = WorkerSignals()
         self.detector = detector
+        self.setAutoDelete(True)
     
     def run(self):
-        """Run detection in background thread"""
+        """Run detection in a pool thread"""
         try:
             tools = self.detector.detect_all_tools(force_refresh=True)
-            self.finished.emit(tools)
+            self.signals.finished.emit(tools)
         except Exception as e:
-            self.error.emit(str(e))
+            self.signals.error.emit(str(e))
+
+
+class InstallWorkerSignals(WorkerSignals):
+    """Install worker signals; stage reports a tool's progress record as it advances"""
+    
+    stage = Signal(str, dict)  # Emits the stage name and the tool's progress record
+
+
+class InstallWorker(QRunnable):
+    """Pooled worker that installs selected tools and restores their configs"""
+    
+    def __init__(self, restore_manager: 'RestoreManager', backup_path: str, selected_tools: list,
+                 is_compressed: bool, extracted_path: str):
+        super().__init__()
+        self.signals = InstallWorkerSignals()
+        self.restore_manager = restore_manager
+        self.backup_path = backup_path
+        self.selected_tools = selected_tools
+        self.is_compressed = is_compressed
+        self.extracted_path = extracted_path
+        self.setAutoDelete(True)
+    
+    def run(self):
+        """Install tools one by one in a pool thread, then clean up the extracted backup"""
+        try:
+            # Installers run one at a time (Windows Installer rejects concurrent installs),
+            # but each tool's config restore overlaps with the next tool's install
+            with ThreadPoolExecutor(max_workers=1) as restore_pool:
+                restores = [self._install_tool(i, tool, restore_pool) for i, tool in enumerate(self.selected_tools)]
+                for restore in restores:
+                    if restore is not None:
+                        restore.result()  # Re-raise restore errors
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        finally:
+            if self.is_compressed and self.extracted_path:
+                self.restore_manager._cleanup_extracted_backup(self.extracted_path)
+            self.signals.finished.emit(len(self.selected_tools))
+    
+    def _install_tool(self, i: int, tool: dict, restore_pool):
+        """Install one tool, emitting each stage, and queue its config restore
+        
+        Returns:
+            Future of the config restore, or None if the tool has no backed up configs
+        """
+        emit_stage = self.signals.stage.emit
+        restore_manager = self.restore_manager
+        tool_name = tool['name']
+        tool_version = tool.get('version')
+        tool_backup_data = tool.get('backup_data', {})
+        
+        # Missing tools arrive already resolved by compare_tools_with_system(), even when the answer is None
+        if 'winget_id' in tool:
+            winget_id = tool['winget_id']
+        else:
+            winget_id = restore_manager.get_winget_package_id(tool_name)
+        if 'download_url' in tool:
+            download_url = tool['download_url']
+        else:
+            download_url = restore_manager.get_download_url(tool_name, tool_version)
+        
+        # One progress record per tool; each stage fills in its fields before
+        # emitting, and the UI only reads fields set by earlier stages
+        info = {
+            'index': i + 1,
+            'tool_name': tool_name,
+            'version': tool_version,
+            'winget_id': winget_id,
+            'download_url': download_url,
+            'result': None,
+            'restore_result': None
+        }
+        
+        # Immediately show what we're starting
+        emit_stage('starting', info)
+        
+        # Step 1: Install the tool
+        install_success = False
+        
+        if winget_id:
+            emit_stage('installing', info)
+            install_result = restore_manager.install_tool_via_winget(tool_name, winget_id)
+            install_success = install_result['success']
+        elif download_url:
+            emit_stage('installing', info)
+            install_result = restore_manager.install_tool_via_url(tool_name, download_url)
+            install_success = install_result['success']
+        else:
+            install_result = {'success': False, 'message': 'Manual installation required'}
+        
+        # Show installation result
+        info['result'] = install_result
+        emit_stage('install_complete', info)
+        
+        # Step 2: Restore configurations
+        # Restore configs even if installation failed (for manual installs like Oracle SQL Developer)
+        if not tool_backup_data:
+            return None
+        return restore_pool.submit(self._restore_configs, info, tool_backup_data, install_success)
+    
+    def _restore_configs(self, info: dict, tool_backup_data: dict, install_success: bool):
+        """Restore one tool's configs on the restore thread, emitting each stage"""
+        emit_stage = self.signals.stage.emit
+        install_result = info['result']
+        emit_stage('restoring', info)
+        
+        # Give a fresh install a moment to create its config folders; returns as soon as they exist
+        if install_success and not install_result.get('already_installed'):
+            self.restore_manager.wait_for_config_targets(tool_backup_data)
+        
+        info['restore_result'] = self.restore_manager.restore_tool_configs(
+            self.backup_path, info['tool_name'], tool_backup_data, self.is_compressed, self.extracted_path
+        )
+        info['manual_install'] = not install_success and install_result.get('requires_manual', False)
+        emit_stage('complete', info)
+
+
+class EnvVarModel(QAbstractTableModel):
+    """Checkable table model for environment variables
+    
+    Names, values, scopes and check states are kept in parallel lists, so a row
+    costs a few list slots instead of three QTableWidgetItem objects. Checked rows are
+    also tracked in an insertion-ordered dict so counts never need a full scan, and
+    each row's lowercased "name\0value" is kept for EnvFilterProxyModel.
+    """
+    
+    HEADERS = ["Select", "Variable Name", "Value"]
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.names = []
+        self.values = []
+        self.scopes = []
+        self.checked = []
+        self.checked_rows = {}  # row -> None, in the order rows were checked
+        self.search_keys = []  # Lowercased "name\0value" per row
+        self._name_font = QFont("Segoe UI", 9, QFont.Weight.Bold)
+    
+    def set_variables(self, env_vars):
+        """Replace the model contents with (name, value, scope) tuples, all unchecked"""
+        self.beginResetModel()
+        self.names = [name for name, _, _ in env_vars]
+        self.values = [value for _, value, _ in env_vars]
+        self.scopes = [scope for _, _, scope in env_vars]
+        self.search_keys = [f"{name}\0{value}".lower() for name, value, _ in env_vars]
+        self.checked = [False] * len(self.names)
+        self.checked_rows = {}
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.names)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row, column = index.row(), index.column()
+        
+        if column == 0:
+            if role == Qt.ItemDataRole.CheckStateRole:
+                return Qt.CheckState.Checked if self.checked[row] else Qt.CheckState.Unchecked
+            if role == Qt.ItemDataRole.TextAlignmentRole:
+                return Qt.AlignmentFlag.AlignCenter
+        elif column == 1:
+            if role == Qt.ItemDataRole.DisplayRole:
+                return self.names[row]
+            if role == Qt.ItemDataRole.FontRole:
+                return self._name_font
+            if role == Qt.ItemDataRole.ForegroundRole:
+                return Qt.GlobalColor.darkBlue
+            if role == Qt.ItemDataRole.ToolTipRole:
+                return f"{self.scopes[row]} variable"
+        elif column == 2:
+            if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole):
+                return self.values[row]  # Tooltip shows full value on hover
+        return None
+    
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if not index.isValid() or index.column() != 0 or role != Qt.ItemDataRole.CheckStateRole:
+            return False
+        self._set_row_checked(index.row(), Qt.CheckState(value) == Qt.CheckState.Checked)
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.CheckStateRole])
+        return True
+    
+    def flags(self, index):
+        if index.column() == 0:
+            return Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+    
+    def set_rows_checked(self, rows, checked: bool):
+        """Set the check state of several rows with a single dataChanged signal"""
+        rows = list(rows)
+        if not rows:
+            return
+        for row in rows:
+            self._set_row_checked(row, checked)
+        self.dataChanged.emit(self.index(min(rows), 0), self.index(max(rows), 0),
+                              [Qt.ItemDataRole.CheckStateRole])
+    
+    def _set_row_checked(self, row: int, checked: bool):
+        self.checked[row] = checked
+        if checked:
+            self.checked_rows[row] = None
+        else:
+            self.checked_rows.pop(row, None)
+    
+    def checked_names(self, limit: int = None) -> list:
+        """Return names of checked rows in the order they were checked"""
+        return [self.names[row] for row in islice(self.checked_rows, limit)]
+    
+    def checked_variables(self) -> list:
+        """Return (name, value) pairs for all checked rows"""
+        return [(self.names[row], self.values[row]) for row in sorted(self.checked_rows)]
+
+
+class EnvFilterProxyModel(QSortFilterProxyModel):
+    """Case-insensitive name/value filter over EnvVarModel
+    
+    Matches against the model's pre-lowercased search keys with one substring test
+    per row, instead of fetching and case-folding every column through data().
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._needle = ""
+    
+    def set_search_text(self, text: str):
+        """Show only rows whose name or value contains text (any case)"""
+        needle = text.lower()
+        if needle != self._needle:
+            self.beginFilterChange()
+            self._needle = needle
+            self.endFilterChange(QSortFilterProxyModel.Direction.Rows)
+    
+    def filterAcceptsRow(self, source_row, source_parent):
+        return not self._needle or self._needle in self.sourceModel().search_keys[source_row]
+
+
+class TableRowDelegate(QStyledItemDelegate):
+    """
+    Paints plain text and checkbox cells directly with QPainter
+
+    Used for the dataTable views instead of QSS ::item rules, so painting a
+    cell does not go through the stylesheet cascade.
+    """
+    
+    SELECTED_COLOR = QColor("#E3F2FD")
+    
+    def __init__(self, padding: int, parent=None):
+        super().__init__(parent)
+        self.padding = padding
+    
+    def _paint_background(self, painter, option):
+        """Fill a cell with the selection, alternating row or base colour"""
+        if option.state & QStyle.StateFlag.State_Selected:
+            painter.fillRect(option.rect, self.SELECTED_COLOR)
+        elif option.features & QStyleOptionViewItem.ViewItemFeature.Alternate:
+            painter.fillRect(option.rect, option.palette.alternateBase())
+        else:
+            painter.fillRect(option.rect, option.palette.base())
+    
+    def paint(self, painter, option, index):
+        painter.save()
+        self._paint_background(painter, option)
+        
+        text_rect = option.rect.adjusted(self.padding, 0, -self.padding, 0)
+        
+        # Checkbox at the position editorEvent() hit-tests against
+        if index.data(Qt.ItemDataRole.CheckStateRole) is not None:
+            check_option = QStyleOptionViewItem(option)
+            self.initStyleOption(check_option, index)
+            widget = option.widget
+            style = widget.style() if widget else QApplication.style()
+            check_option.rect = style.subElementRect(
+                QStyle.SubElement.SE_ItemViewItemCheckIndicator, check_option, widget
+            )
+            check_option.state &= ~(QStyle.StateFlag.State_On | QStyle.StateFlag.State_Off)
+            if check_option.checkState == Qt.CheckState.Checked:
+                check_option.state |= QStyle.StateFlag.State_On
+            else:
+                check_option.state |= QStyle.StateFlag.State_Off
+            style.drawPrimitive(QStyle.PrimitiveElement.PE_IndicatorItemViewItemCheck, check_option, painter, widget)
+            text_rect.setLeft(check_option.rect.right() + self.padding)
+        
+        text = index.data(Qt.ItemDataRole.DisplayRole)
+        if text:
+            foreground = index.data(Qt.ItemDataRole.ForegroundRole)
+            painter.setPen(QBrush(foreground).color() if foreground is not None else QColor("#000000"))
+            font = index.data(Qt.ItemDataRole.FontRole)
+            painter.setFont(font if font is not None else option.font)
+            alignment = index.data(Qt.ItemDataRole.TextAlignmentRole)
+            if alignment is None:
+                alignment = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+            elided = option.fontMetrics.elidedText(str(text), Qt.TextElideMode.ElideRight, text_rect.width())
+            painter.drawText(text_rect, Qt.AlignmentFlag(alignment), elided)
+        
+        painter.restore()
+
+
+class SelectionRadioDelegate(TableRowDelegate):
+    """
+    Paints a radio mark that follows the view's row selection
+
+    The backups table's Select column has no items; the mark is drawn from
+    the selection state, so changing the selected backup writes nothing to
+    the model and only the two affected rows repaint.
+    """
+    
+    def paint(self, painter, option, index):
+        painter.save()
+        self._paint_background(painter, option)
+        
+        widget = option.widget
+        style = widget.style() if widget else QApplication.style()
+        radio_option = QStyleOptionButton()
+        radio_option.rect = QRect(
+            0, 0,
+            style.pixelMetric(QStyle.PixelMetric.PM_ExclusiveIndicatorWidth, None, widget),
+            style.pixelMetric(QStyle.PixelMetric.PM_ExclusiveIndicatorHeight, None, widget)
+        )
+        radio_option.rect.moveCenter(option.rect.center())
+        radio_option.state = QStyle.StateFlag.State_Enabled
+        if option.state & QStyle.StateFlag.State_Selected:
+            radio_option.state |= QStyle.StateFlag.State_On
+        else:
+            radio_option.state |= QStyle.StateFlag.State_Off
+        style.drawPrimitive(QStyle.PrimitiveElement.PE_IndicatorRadioButton, radio_option, painter, widget)
+        
+        painter.restore()
 
 
 class MainWindow(QMainWindow):
@@ -83,14 +675,25 @@ class MainWindow(QMainWindow):
     
     def __init__(self):
         super().__init__()
-        self.detector = SystemDetector()
-        self.backup_manager = BackupManager()
-        self.restore_manager = RestoreManager()
+        # detector, backup_manager and restore_manager are created on first use
         self.detection_worker = None
         self.backup_worker = None
+        self.env_model = None  # Created with the environment variables tab
+        self._env_snapshot = None  # (monotonic time, variables) from the last registry read
+        
+        # Checked tools/browsers as {'name', 'version', 'path'} records,
+        # keyed by (name, path) and kept in check order
+        self._selected_tools = {}
+        self._selected_browsers = {}
+        # Set while select/deselect-all toggles rows, so slots skip per-row summary refreshes
+        self._suppress_checkbox_signals = False
+        self._last_summary = {}  # Summary label -> text it currently shows
+        self._backup_html_cache = OrderedDict()  # backup_path -> rendered details HTML, reset per scan
+        self._last_details_row = -1  # backups_table row whose details are shown, reset per scan
         self.detected_tools = []
         self.detected_browsers = []
         self.available_backups = []
+        self._backup_rows = iter(())  # (row, backup) pairs not yet added to backups_table
         
         # Connect restore progress signal
         self.restore_progress_signal.connect(self._handle_restore_progress)
@@ -101,69 +704,95 @@ class MainWindow(QMainWindow):
         
         self.init_ui()
     
+    @cached_property
+    def detector(self) -> 'SystemDetector':
+        """System detector, imported and created on first detection"""
+        from src.core.detector import SystemDetector
+        return SystemDetector()
+    
+    @cached_property
+    def backup_manager(self) -> 'BackupManager':
+        """Backup manager, imported and created on first backup"""
+        from src.core.backup import BackupManager
+        return BackupManager()
+    
+    @cached_property
+    def restore_manager(self) -> 'RestoreManager':
+        """Restore manager, imported and created on first backup scan or restore"""
+        from src.core.restore import RestoreManager
+        return RestoreManager()
+    
     def setup_screen_dimensions(self):
         """Calculate responsive dimensions based on screen size"""
-        screen = QApplication.primaryScreen()
-        screen_geometry = screen.availableGeometry()
+        screen_geometry = _available_screen_geometry()
         self.screen_width = screen_geometry.width()
         self.screen_height = screen_geometry.height()
         
         # Determine device type and set responsive sizes with better scaling
-        if self.screen_width >= 2560:  # 4K/Ultra-wide monitor
-            self.window_width_percent = 0.65
-            self.window_height_percent = 0.70
-            self.font_size_title = 20
-            self.font_size_normal = 13
-            self.font_size_small = 12
-            self.button_height = 44
-            self.button_min_width = 200
-            self.table_row_height = 38
-            self.padding = 25
-        elif self.screen_width >= 1920:  # Desktop/Large monitor (1080p)
-            self.window_width_percent = 0.70
-            self.window_height_percent = 0.75
-            self.font_size_title = 18
-            self.font_size_normal = 12
-            self.font_size_small = 11
-            self.button_height = 40
-            self.button_min_width = 180
-            self.table_row_height = 36
-            self.padding = 20
-        elif self.screen_width >= 1366:  # Laptop/Medium screen
-            self.window_width_percent = 0.80
-            self.window_height_percent = 0.80
-            self.font_size_title = 14
-            self.font_size_normal = 10
-            self.font_size_small = 9
-            self.button_height = 36
-            self.button_min_width = 160
-            self.table_row_height = 32
-            self.padding = 15
-        else:  # Small laptop/tablet
-            self.window_width_percent = 0.90
-            self.window_height_percent = 0.85
-            self.font_size_title = 13
-            self.font_size_normal = 9
-            self.font_size_small = 8
-            self.button_height = 32
-            self.button_min_width = 140
-            self.table_row_height = 30
-            self.padding = 10
+        profile = _dimension_profile(self.screen_width)
+        self.__dict__.update(profile._asdict())
         
         # Calculate actual window size
         self.window_width = int(self.screen_width * self.window_width_percent)
         self.window_height = int(self.screen_height * self.window_height_percent)
+        
+        self._build_fonts()
+        self._build_stylesheets()
+        self._build_size_tokens()
+    
+    def _build_size_tokens(self):
+        """Precompute the CSS size strings and styled tags used by the backup details HTML"""
+        if self.screen_width >= 2560:  # 4K monitors
+            icon_size, padding_lg, padding_md, padding_sm, margin_section = "22px", "20px", "16px", "12px", "25px"
+        elif self.screen_width >= 1920:  # 1080p monitors
+            icon_size, padding_lg, padding_md, padding_sm, margin_section = "20px", "18px", "14px", "10px", "22px"
+        elif self.screen_width >= 1366:  # Laptop screens
+            icon_size, padding_lg, padding_md, padding_sm, margin_section = "16px", "12px", "10px", "8px", "15px"
+        else:  # Small screens
+            icon_size, padding_lg, padding_md, padding_sm, margin_section = "14px", "10px", "8px", "6px", "12px"
+        
+        self._size_tokens = SizeTokens(
+            icon_size=icon_size, padding_lg=padding_lg, padding_md=padding_md,
+            padding_sm=padding_sm, margin_section=margin_section,
+            h3_size=f"{self.font_size_title + 2}px",
+            h4_size=f"{self.font_size_title - 1}px",
+            text_size=f"{self.font_size_normal}px",
+            small_size=f"{self.font_size_small}px"
+        )
+        tokens = self._size_tokens._asdict()
+        self._details_tags = DetailsTags(**{
+            name: template.format_map(tokens) for name, template in _DETAILS_TAG_TEMPLATES.items()
+        })
+        
+        # Rendered details embed these sizes
+        self._backup_html_cache.clear()
+    
+    def _build_fonts(self):
+        """Create the fonts shared by tab titles and bold table cells"""
+        self._title_font = QFont("Segoe UI", self.font_size_title, QFont.Weight.Bold)
+        self._title_font.setHintingPreference(QFont.HintingPreference.PreferFullHinting)
+        self._bold_item_font = QFont("Segoe UI", 9, QFont.Weight.Bold)
+        self._bold_name_font = QFont("Segoe UI", 10, QFont.Weight.Bold)
+    
+    def _build_stylesheets(self):
+        """Substitute the application stylesheet for the current font sizes"""
+        self._app_qss = _app_qss_template().substitute(
+            fs_normal=self.font_size_normal,
+            fs_small=self.font_size_small,
+            fs_button=self.font_size_normal + 1,
+            fs_restore=self.font_size_title - 2
+        )
     
     def init_ui(self):
         """Initialize the user interface"""
         self.setWindowTitle("W-Rebuild - System Detection & Backup Tool")
         
-        # Set responsive window size
-        self.resize(self.window_width, self.window_height)
+        # Set responsive window size, centered on screen
         self.setMinimumSize(800, 500)
+        self.center_window(max(self.window_width, 800), max(self.window_height, 500))
         
-        # Center window on screen
-        self.center_window()
+        # Shared cell painter for the dataTable views
+        self._row_delegate = TableRowDelegate(10, self)
         
         # Create central widget and main layout
         central_widget = QWidget()
@@ -180,29 +809,10 @@ class MainWindow(QMainWindow):
         header_layout.setContentsMargins(0, 0, 0, 5)
         
         # Scan button (left side)
-        self.scan_button = QPushButton("🔍 Scan System")
+        self.scan_button = QPushButton("Scan System")
+        _set_button_icon(self.scan_button, "scan")
         self.scan_button.setMinimumHeight(self.button_height - 5)
-        self.scan_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: #0078D4;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 20px;
-                font-size: {self.font_size_normal}px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: #005A9E;
-            }}
-            QPushButton:pressed {{
-                background-color: #004578;
-            }}
-            QPushButton:disabled {{
-                background-color: #CCCCCC;
-                color: #666666;
-            }}
-        """)
+        self.scan_button.setObjectName("primaryButton")
         self.scan_button.clicked.connect(self.start_detection)
         header_layout.addWidget(self.scan_button)
         
@@ -210,7 +820,7 @@ class MainWindow(QMainWindow):
         
         # Compact info label
         self.info_label = QLabel("Ready to scan")
-        self.info_label.setStyleSheet(f"color: #666666; font-size: {self.font_size_small}px; padding: 5px;")
+        self.info_label.setObjectName("mutedLabel")
         header_layout.addWidget(self.info_label)
         
         header_layout.addStretch()
@@ -221,154 +831,93 @@ class MainWindow(QMainWindow):
         self.progress_bar.setMaximum(0)
         self.progress_bar.setMaximumHeight(6)
         self.progress_bar.setVisible(False)
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: none;
-                background-color: #E0E0E0;
-                border-radius: 3px;
-            }
-            QProgressBar::chunk {
-                background-color: #0078D4;
-                border-radius: 3px;
-            }
-        """)
+        self.progress_bar.setObjectName("scanProgress")
         header_layout.addWidget(self.progress_bar)
         
         main_layout.addLayout(header_layout)
         
         # Create tab widget for different views
         self.tab_widget = QTabWidget()
-        self.tab_widget.setStyleSheet("""
-            QTabWidget::pane {
-                border: 1px solid #DDDDDD;
-                border-radius: 4px;
-                background-color: white;
-            }
-            QTabBar::tab {
-                background-color: #F5F5F5;
-                padding: 10px 20px;
-                margin-right: 2px;
-                border-top-left-radius: 4px;
-                border-top-right-radius: 4px;
-            }
-            QTabBar::tab:selected {
-                background-color: white;
-                border-bottom: 2px solid #0078D4;
-            }
-            QTabBar::tab:hover {
-                background-color: #E8E8E8;
-            }
-        """)
+        self.tab_widget.setObjectName("mainTabs")
         
         # Create tabs in order: User Profile, Detected Tools, Browsers, Environment Variables, Restore
         self.create_environment_tab()
         self.create_tools_tab()
         self.create_browsers_tab()
-        self.create_env_variables_tab()
-        self.create_restore_tab()
+        
+        # The environment variables and restore tabs are built on first visit
+        self._tab_builders = {}
+        self._add_lazy_tab(self.create_env_variables_tab, "🌍 Environment Variables")
+        self._add_lazy_tab(self.create_restore_tab, "♻️ Restore")
+        self.tab_widget.currentChanged.connect(self._ensure_tab_built)
         
         main_layout.addWidget(self.tab_widget)
         
         # Horizontal Backup Summary section
         backup_section = QGroupBox("Backup Summary")
-        backup_section.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                font-size: 11px;
-                border: 2px solid #0078D4;
-                border-radius: 6px;
-                margin-top: 6px;
-                padding-top: 12px;
-                background-color: #F0F8FF;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                color: #0078D4;
-            }
-        """)
+        backup_section.setObjectName("summaryGroup")
         backup_layout = QHBoxLayout(backup_section)
         backup_layout.setSpacing(15)
         backup_layout.setContentsMargins(15, 10, 15, 10)
         
         # Tools info (compact)
         self.tools_info_label = QLabel("🔧 <b>0</b> Tools")
-        self.tools_info_label.setStyleSheet(f"font-size: {self.font_size_normal}px; color: #333333;")
+        self.tools_info_label.setObjectName("summaryCount")
         self.tools_info_label.setMinimumWidth(110)
         backup_layout.addWidget(self.tools_info_label)
         
         # Tools list (scrollable)
         self.tools_list_label = QLabel("None selected")
-        self.tools_list_label.setStyleSheet(f"font-size: {self.font_size_small}px; color: #666666; padding: 2px 8px;")
+        self.tools_list_label.setObjectName("summaryList")
         self.tools_list_label.setWordWrap(False)
         backup_layout.addWidget(self.tools_list_label, 1)
         
         # Separator
         separator1 = QLabel("|")
-        separator1.setStyleSheet("color: #CCCCCC; font-size: 18px;")
+        separator1.setObjectName("separator")
         backup_layout.addWidget(separator1)
         
         # Browsers info (compact)
         self.browsers_info_label = QLabel("🌐 <b>0</b> Browsers")
-        self.browsers_info_label.setStyleSheet(f"font-size: {self.font_size_normal}px; color: #333333;")
+        self.browsers_info_label.setObjectName("summaryCount")
         self.browsers_info_label.setMinimumWidth(130)
         backup_layout.addWidget(self.browsers_info_label)
         
         # Browsers list (scrollable)
         self.browsers_list_label = QLabel("None selected")
-        self.browsers_list_label.setStyleSheet(f"font-size: {self.font_size_small}px; color: #666666; padding: 2px 8px;")
+        self.browsers_list_label.setObjectName("summaryList")
         self.browsers_list_label.setWordWrap(False)
         backup_layout.addWidget(self.browsers_list_label, 1)
         
         # Separator
         separator2 = QLabel("|")
-        separator2.setStyleSheet("color: #CCCCCC; font-size: 18px;")
+        separator2.setObjectName("separator")
         backup_layout.addWidget(separator2)
         
         # Environment variables info (compact)
         self.env_info_label = QLabel("🌍 <b>0</b> Variables")
-        self.env_info_label.setStyleSheet(f"font-size: {self.font_size_normal}px; color: #333333;")
+        self.env_info_label.setObjectName("summaryCount")
         self.env_info_label.setMinimumWidth(120)
         backup_layout.addWidget(self.env_info_label)
         
         # Environment variables list (scrollable)
         self.env_list_label = QLabel("None selected")
-        self.env_list_label.setStyleSheet(f"font-size: {self.font_size_small}px; color: #666666; padding: 2px 8px;")
+        self.env_list_label.setObjectName("summaryList")
         self.env_list_label.setWordWrap(False)
         backup_layout.addWidget(self.env_list_label, 1)
         
         # Separator
         separator2 = QLabel("|")
-        separator2.setStyleSheet("color: #CCCCCC; font-size: 18px;")
+        separator2.setObjectName("separator")
         backup_layout.addWidget(separator2)
         
         # Backup button (compact)
-        self.unified_backup_btn = QPushButton("💾 Create Backup")
+        self.unified_backup_btn = QPushButton("Create Backup")
+        _set_button_icon(self.unified_backup_btn, "backup")
         self.unified_backup_btn.setMinimumHeight(self.button_height - 4)
         self.unified_backup_btn.setMinimumWidth(self.button_min_width)
         self.unified_backup_btn.clicked.connect(self.backup_selected_items)
-        self.unified_backup_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: #0078D4;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 20px;
-                font-size: {self.font_size_normal + 1}px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: #005A9E;
-            }}
-            QPushButton:pressed {{
-                background-color: #004578;
-            }}
-            QPushButton:disabled {{
-                background-color: #CCCCCC;
-                color: #666666;
-            }}
-        """)
+        self.unified_backup_btn.setObjectName("backupButton")
         backup_layout.addWidget(self.unified_backup_btn)
         
         main_layout.addWidget(backup_section)
@@ -381,8 +930,32 @@ class MainWindow(QMainWindow):
         # Apply modern styling
         self.apply_styles()
         
-        # Load environment variables on startup
-        self.load_environment_variables()
+        # Load user profile on startup
+        self.load_user_profile()
+        self.update_backup_summary()
+    
+    def _add_lazy_tab(self, builder, title: str):
+        """Add a placeholder tab whose contents are built by builder() on first visit"""
+        index = self.tab_widget.addTab(QWidget(), title)
+        self._tab_builders[index] = builder
+    
+    def _ensure_tab_built(self, index: int):
+        """Replace a placeholder tab with its real contents"""
+        builder = self._tab_builders.pop(index, None)
+        if builder is None:
+            return
+        
+        title = self.tab_widget.tabText(index)
+        placeholder = self.tab_widget.widget(index)
+        widget = builder()
+        
+        # Removing the current tab moves the selection; keep that from building other tabs
+        self.tab_widget.blockSignals(True)
+        self.tab_widget.removeTab(index)
+        self.tab_widget.insertTab(index, widget, title)
+        self.tab_widget.setCurrentIndex(index)
+        self.tab_widget.blockSignals(False)
+        placeholder.deleteLater()
     
     def create_tools_tab(self):
         """Create the tools detection tab"""
@@ -400,48 +973,26 @@ class MainWindow(QMainWindow):
         actions_layout.setSpacing(10)
         
         # Select All button
-        self.select_all_btn = QPushButton("✓ Select All")
+        self.select_all_btn = QPushButton("Select All")
+        _set_button_icon(self.select_all_btn, "check")
         self.select_all_btn.setMinimumHeight(self.button_height - 8)
         self.select_all_btn.clicked.connect(self.select_all_tools)
-        self.select_all_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: #E8E8E8;
-                color: #333333;
-                border: 1px solid #CCCCCC;
-                border-radius: 4px;
-                padding: 6px 16px;
-                font-size: {self.font_size_normal}px;
-            }}
-            QPushButton:hover {{
-                background-color: #D8D8D8;
-            }}
-        """)
+        self.select_all_btn.setObjectName("secondaryButton")
         actions_layout.addWidget(self.select_all_btn)
         
         # Deselect All button
-        self.deselect_all_btn = QPushButton("✗ Deselect All")
+        self.deselect_all_btn = QPushButton("Deselect All")
+        _set_button_icon(self.deselect_all_btn, "cross")
         self.deselect_all_btn.setMinimumHeight(self.button_height - 8)
         self.deselect_all_btn.clicked.connect(self.deselect_all_tools)
-        self.deselect_all_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: #E8E8E8;
-                color: #333333;
-                border: 1px solid #CCCCCC;
-                border-radius: 4px;
-                padding: 6px 16px;
-                font-size: {self.font_size_normal}px;
-            }}
-            QPushButton:hover {{
-                background-color: #D8D8D8;
-            }}
-        """)
+        self.deselect_all_btn.setObjectName("secondaryButton")
         actions_layout.addWidget(self.deselect_all_btn)
         
         actions_layout.addStretch()
         
         # Selected count label
         self.selected_count_label = QLabel("Selected: 0")
-        self.selected_count_label.setStyleSheet(f"color: #666666; font-size: {self.font_size_normal}px; padding: 5px;")
+        self.selected_count_label.setObjectName("countLabel")
         actions_layout.addWidget(self.selected_count_label)
         
         tools_layout.addLayout(actions_layout)
@@ -484,30 +1035,7 @@ class MainWindow(QMainWindow):
         self.browsers_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
         self.browsers_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
         self.browsers_table.verticalHeader().setVisible(False)
-        self.browsers_table.setStyleSheet(f"""
-            QTableWidget {{
-                border: 2px solid #E0E0E0;
-                border-radius: 6px;
-                background-color: white;
-                gridline-color: #F0F0F0;
-                font-size: {self.font_size_small}px;
-            }}
-            QTableWidget::item {{
-                padding: 8px;
-            }}
-            QTableWidget::item:selected {{
-                background-color: #E3F2FD;
-                color: #000000;
-            }}
-            QHeaderView::section {{
-                background-color: #F8F9FA;
-                padding: 10px;
-                border: none;
-                border-bottom: 3px solid #0078D4;
-                font-weight: bold;
-                font-size: {self.font_size_normal}px;
-            }}
-        """)
+        self.browsers_table.setObjectName("compactTable")
         self.browsers_table.itemChanged.connect(self.on_browser_checkbox_changed)
         browsers_layout.addWidget(self.browsers_table)
         
@@ -516,48 +1044,26 @@ class MainWindow(QMainWindow):
         browsers_actions_layout.setSpacing(10)
         
         # Select All button
-        self.select_all_browsers_btn = QPushButton("✓ Select All")
+        self.select_all_browsers_btn = QPushButton("Select All")
+        _set_button_icon(self.select_all_browsers_btn, "check")
         self.select_all_browsers_btn.setMinimumHeight(self.button_height - 8)
         self.select_all_browsers_btn.clicked.connect(self.select_all_browsers)
-        self.select_all_browsers_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: #E8E8E8;
-                color: #333333;
-                border: 1px solid #CCCCCC;
-                border-radius: 4px;
-                padding: 6px 16px;
-                font-size: {self.font_size_normal}px;
-            }}
-            QPushButton:hover {{
-                background-color: #D8D8D8;
-            }}
-        """)
+        self.select_all_browsers_btn.setObjectName("secondaryButton")
         browsers_actions_layout.addWidget(self.select_all_browsers_btn)
         
         # Deselect All button
-        self.deselect_all_browsers_btn = QPushButton("✗ Deselect All")
+        self.deselect_all_browsers_btn = QPushButton("Deselect All")
+        _set_button_icon(self.deselect_all_browsers_btn, "cross")
         self.deselect_all_browsers_btn.setMinimumHeight(self.button_height - 8)
         self.deselect_all_browsers_btn.clicked.connect(self.deselect_all_browsers)
-        self.deselect_all_browsers_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: #E8E8E8;
-                color: #333333;
-                border: 1px solid #CCCCCC;
-                border-radius: 4px;
-                padding: 6px 16px;
-                font-size: {self.font_size_normal}px;
-            }}
-            QPushButton:hover {{
-                background-color: #D8D8D8;
-            }}
-        """)
+        self.deselect_all_browsers_btn.setObjectName("secondaryButton")
         browsers_actions_layout.addWidget(self.deselect_all_browsers_btn)
         
         browsers_actions_layout.addStretch()
         
         # Selected count label
         self.selected_browsers_count_label = QLabel("Selected: 0")
-        self.selected_browsers_count_label.setStyleSheet(f"color: #666666; font-size: {self.font_size_normal}px; padding: 5px;")
+        self.selected_browsers_count_label.setObjectName("countLabel")
         browsers_actions_layout.addWidget(self.selected_browsers_count_label)
         
         browsers_layout.addLayout(browsers_actions_layout)
@@ -573,13 +1079,13 @@ class MainWindow(QMainWindow):
         
         # Header
         profile_header = QLabel("👤 User Profile Information")
-        profile_header.setFont(QFont("Segoe UI", self.font_size_title, QFont.Weight.Bold))
-        profile_header.setStyleSheet("color: #0078D4; padding: 5px;")
+        profile_header.setFont(self._title_font)
+        profile_header.setObjectName("titleLabel")
         profile_layout.addWidget(profile_header)
         
         # Description
         desc_label = QLabel("System and user account information")
-        desc_label.setStyleSheet(f"color: #666666; font-size: {self.font_size_small}px; padding-left: 5px;")
+        desc_label.setObjectName("descriptionLabel")
         profile_layout.addWidget(desc_label)
         
         # Profile table
@@ -597,30 +1103,8 @@ class MainWindow(QMainWindow):
         self.profile_table.setAlternatingRowColors(True)
         self.profile_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
         self.profile_table.verticalHeader().setVisible(False)
-        self.profile_table.setStyleSheet(f"""
-            QTableWidget {{
-                border: 2px solid #E0E0E0;
-                border-radius: 6px;
-                background-color: white;
-                gridline-color: #F0F0F0;
-                font-size: {self.font_size_small}px;
-            }}
-            QTableWidget::item {{
-                padding: 10px;
-            }}
-            QTableWidget::item:selected {{
-                background-color: #E3F2FD;
-                color: #000000;
-            }}
-            QHeaderView::section {{
-                background-color: #F8F9FA;
-                padding: 10px;
-                border: none;
-                border-bottom: 3px solid #0078D4;
-                font-weight: bold;
-                font-size: {self.font_size_normal}px;
-            }}
-        """)
+        self.profile_table.setObjectName("dataTable")
+        self.profile_table.setItemDelegate(self._row_delegate)
         profile_layout.addWidget(self.profile_table)
         
         self.tab_widget.addTab(profile_widget, "👤 User Profile")
@@ -635,8 +1119,8 @@ class MainWindow(QMainWindow):
         # Header with search
         env_header = QHBoxLayout()
         env_title = QLabel("🌍 Environment Variables")
-        env_title.setFont(QFont("Segoe UI", self.font_size_title, QFont.Weight.Bold))
-        env_title.setStyleSheet("color: #0078D4; padding: 5px;")
+        env_title.setFont(self._title_font)
+        env_title.setObjectName("titleLabel")
         env_header.addWidget(env_title)
         
         env_header.addStretch()
@@ -646,32 +1130,30 @@ class MainWindow(QMainWindow):
         self.env_search.setPlaceholderText("🔍 Search variables...")
         search_width = 350 if self.screen_width >= 1920 else 300 if self.screen_width >= 1366 else 250
         self.env_search.setMinimumWidth(search_width)
-        self.env_search.textChanged.connect(self.filter_environment_variables)
-        self.env_search.setStyleSheet(f"""
-            QLineEdit {{
-                padding: 10px 15px;
-                border: 2px solid #E0E0E0;
-                border-radius: 6px;
-                font-size: {self.font_size_normal}px;
-                background-color: white;
-            }}
-            QLineEdit:focus {{
-                border-color: #0078D4;
-            }}
-        """)
+        
+        # Debounce filtering so only the final query of a burst of keystrokes runs
+        self._env_filter_timer = QTimer(self)
+        self._env_filter_timer.setSingleShot(True)
+        self._env_filter_timer.setInterval(150)
+        self._env_filter_timer.timeout.connect(self._apply_env_filter)
+        self.env_search.textChanged.connect(lambda _text: self._env_filter_timer.start())
+        self.env_search.setObjectName("searchBox")
         env_header.addWidget(self.env_search)
         
         env_layout.addLayout(env_header)
         
         # Description
         desc_label = QLabel("System and user environment variables (PATH, JAVA_HOME, etc.)")
-        desc_label.setStyleSheet(f"color: #666666; font-size: {self.font_size_small}px; padding-left: 5px;")
+        desc_label.setObjectName("descriptionLabel")
         env_layout.addWidget(desc_label)
         
         # Environment table
-        self.env_table = QTableWidget()
-        self.env_table.setColumnCount(3)
-        self.env_table.setHorizontalHeaderLabels(["Select", "Variable Name", "Value"])
+        self.env_model = EnvVarModel(self)
+        self.env_proxy = EnvFilterProxyModel(self)
+        self.env_proxy.setSourceModel(self.env_model)
+        
+        self.env_table = QTableView()
+        self.env_table.setModel(self.env_proxy)
         self.env_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Fixed)
         self.env_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Fixed)
         self.env_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
@@ -683,34 +1165,12 @@ class MainWindow(QMainWindow):
         self.env_table.verticalHeader().setDefaultSectionSize(self.table_row_height)
         
         self.env_table.setAlternatingRowColors(True)
-        self.env_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.env_table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
         self.env_table.verticalHeader().setVisible(False)
         self.env_table.setSortingEnabled(True)
-        self.env_table.setStyleSheet(f"""
-            QTableWidget {{
-                border: 2px solid #E0E0E0;
-                border-radius: 6px;
-                background-color: white;
-                gridline-color: #F0F0F0;
-                font-size: {self.font_size_small}px;
-            }}
-            QTableWidget::item {{
-                padding: 10px;
-            }}
-            QTableWidget::item:selected {{
-                background-color: #E3F2FD;
-                color: #000000;
-            }}
-            QHeaderView::section {{
-                background-color: #F8F9FA;
-                padding: 10px;
-                border: none;
-                border-bottom: 3px solid #0078D4;
-                font-weight: bold;
-                font-size: {self.font_size_normal}px;
-            }}
-        """)
-        self.env_table.itemChanged.connect(self.on_env_checkbox_changed)
+        self.env_table.setObjectName("dataTable")
+        self.env_table.setItemDelegate(self._row_delegate)
+        self.env_model.dataChanged.connect(self.on_env_checkbox_changed)
         env_layout.addWidget(self.env_table)
         
         # Action buttons at bottom
@@ -718,58 +1178,37 @@ class MainWindow(QMainWindow):
         env_actions_layout.setSpacing(10)
         
         # Select All button
-        self.select_all_env_btn = QPushButton("✓ Select All")
+        self.select_all_env_btn = QPushButton("Select All")
+        _set_button_icon(self.select_all_env_btn, "check")
         self.select_all_env_btn.setMinimumHeight(self.button_height - 8)
         self.select_all_env_btn.clicked.connect(self.select_all_env_vars)
-        self.select_all_env_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: #E8E8E8;
-                color: #333333;
-                border: 1px solid #CCCCCC;
-                border-radius: 4px;
-                padding: 6px 16px;
-                font-size: {self.font_size_normal}px;
-            }}
-            QPushButton:hover {{
-                background-color: #D8D8D8;
-            }}
-        """)
+        self.select_all_env_btn.setObjectName("secondaryButton")
         env_actions_layout.addWidget(self.select_all_env_btn)
         
         # Deselect All button
-        self.deselect_all_env_btn = QPushButton("✗ Deselect All")
+        self.deselect_all_env_btn = QPushButton("Deselect All")
+        _set_button_icon(self.deselect_all_env_btn, "cross")
         self.deselect_all_env_btn.setMinimumHeight(self.button_height - 8)
         self.deselect_all_env_btn.clicked.connect(self.deselect_all_env_vars)
-        self.deselect_all_env_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: #E8E8E8;
-                color: #333333;
-                border: 1px solid #CCCCCC;
-                border-radius: 4px;
-                padding: 6px 16px;
-                font-size: {self.font_size_normal}px;
-            }}
-            QPushButton:hover {{
-                background-color: #D8D8D8;
-            }}
-        """)
+        self.deselect_all_env_btn.setObjectName("secondaryButton")
         env_actions_layout.addWidget(self.deselect_all_env_btn)
         
         env_actions_layout.addStretch()
         
         # Variable count label
         self.env_count_label = QLabel("Total variables: 0")
-        self.env_count_label.setStyleSheet(f"color: #666666; font-size: {self.font_size_normal}px; padding: 5px;")
+        self.env_count_label.setObjectName("countLabel")
         env_actions_layout.addWidget(self.env_count_label)
         
         # Selected count label
         self.selected_env_count_label = QLabel("Selected: 0")
-        self.selected_env_count_label.setStyleSheet(f"color: #666666; font-size: {self.font_size_normal}px; padding: 5px;")
+        self.selected_env_count_label.setObjectName("countLabel")
         env_actions_layout.addWidget(self.selected_env_count_label)
         
         env_layout.addLayout(env_actions_layout)
         
-        self.tab_widget.addTab(env_widget, "🌍 Environment Variables")
+        self.load_environment_variables()
+        return env_widget
     
     def create_restore_tab(self):
         """Create the restore tab for restoring from backups"""
@@ -784,32 +1223,17 @@ class MainWindow(QMainWindow):
         # Header with actions
         restore_header = QHBoxLayout()
         restore_title = QLabel("💾 Restore from Backup")
-        restore_title.setFont(QFont("Segoe UI", self.font_size_title, QFont.Weight.Bold))
-        restore_title.setStyleSheet("color: #0078D4; padding: 5px;")
+        restore_title.setFont(self._title_font)
+        restore_title.setObjectName("titleLabel")
         restore_header.addWidget(restore_title)
         
         restore_header.addStretch()
         
         # Scan for backups button
-        self.scan_backups_btn = QPushButton("🔍 Scan for Backups")
+        self.scan_backups_btn = QPushButton("Scan for Backups")
+        _set_button_icon(self.scan_backups_btn, "scan")
         self.scan_backups_btn.setMinimumHeight(self.button_height - 5)
-        self.scan_backups_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: #0078D4;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 20px;
-                font-size: {self.font_size_normal}px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: #005A9E;
-            }}
-            QPushButton:pressed {{
-                background-color: #004578;
-            }}
-        """)
+        self.scan_backups_btn.setObjectName("primaryButton")
         self.scan_backups_btn.clicked.connect(self.scan_for_backups)
         restore_header.addWidget(self.scan_backups_btn)
         
@@ -817,27 +1241,12 @@ class MainWindow(QMainWindow):
         
         # Description
         desc_label = QLabel("Select a backup to restore your tools and environment variables")
-        desc_label.setStyleSheet(f"color: #666666; font-size: {self.font_size_small}px; padding-left: 5px;")
+        desc_label.setObjectName("descriptionLabel")
         restore_layout.addWidget(desc_label)
         
         # Backup selection section
         backup_selection = QGroupBox("Available Backups")
-        backup_selection.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                font-size: 11px;
-                border: 2px solid #0078D4;
-                border-radius: 6px;
-                margin-top: 6px;
-                padding-top: 12px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                color: #0078D4;
-            }
-        """)
+        backup_selection.setObjectName("backupsGroup")
         backup_selection_layout = QVBoxLayout(backup_selection)
         
         # Backups table
@@ -859,30 +1268,9 @@ class MainWindow(QMainWindow):
         self.backups_table.setAlternatingRowColors(True)
         self.backups_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
         self.backups_table.verticalHeader().setVisible(False)
-        self.backups_table.setStyleSheet(f"""
-            QTableWidget {{
-                border: 2px solid #E0E0E0;
-                border-radius: 6px;
-                background-color: white;
-                gridline-color: #F0F0F0;
-                font-size: {self.font_size_small}px;
-            }}
-            QTableWidget::item {{
-                padding: 10px;
-            }}
-            QTableWidget::item:selected {{
-                background-color: #E3F2FD;
-                color: #000000;
-            }}
-            QHeaderView::section {{
-                background-color: #F8F9FA;
-                padding: 10px;
-                border: none;
-                border-bottom: 3px solid #0078D4;
-                font-weight: bold;
-                font-size: {self.font_size_normal}px;
-            }}
-        """)
+        self.backups_table.setObjectName("dataTable")
+        self.backups_table.setItemDelegate(self._row_delegate)
+        self.backups_table.setItemDelegateForColumn(0, SelectionRadioDelegate(10, self.backups_table))
         self.backups_table.itemSelectionChanged.connect(self.on_backup_selected)
         backup_selection_layout.addWidget(self.backups_table)
         
@@ -890,22 +1278,7 @@ class MainWindow(QMainWindow):
         
         # Backup details section
         details_section = QGroupBox("Backup Contents")
-        details_section.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                font-size: 11px;
-                border: 2px solid #28A745;
-                border-radius: 6px;
-                margin-top: 6px;
-                padding-top: 12px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                color: #28A745;
-            }
-        """)
+        details_section.setObjectName("detailsGroup")
         details_layout = QVBoxLayout(details_section)
         
         # Backup details text display
@@ -916,17 +1289,7 @@ class MainWindow(QMainWindow):
         size_policy = QSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         self.backup_details_text.setSizePolicy(size_policy)
         
-        self.backup_details_text.setStyleSheet(f"""
-            QTextEdit {{
-                border: 1px solid #DDDDDD;
-                border-radius: 4px;
-                background-color: white;
-                font-family: 'Segoe UI', Arial, sans-serif;
-                font-size: {self.font_size_normal}px;
-                padding: 15px;
-                line-height: 1.6;
-            }}
-        """)
+        self.backup_details_text.setObjectName("detailsText")
         self.backup_details_text.setHtml(
             f"<div style='color: #666666; padding: 20px; text-align: center;'>"
             f"<p style='font-size: {self.font_size_title}px;'><b>📦 No backup selected</b></p>"
@@ -945,72 +1308,27 @@ class MainWindow(QMainWindow):
         self.restore_btn.setMinimumHeight(self.button_height)
         self.restore_btn.setMinimumWidth(self.button_min_width + 70)
         self.restore_btn.setEnabled(False)
-        self.restore_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: #28A745;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 10px 30px;
-                font-size: {self.font_size_title - 2}px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: #218838;
-            }}
-            QPushButton:pressed {{
-                background-color: #1E7E34;
-            }}
-            QPushButton:disabled {{
-                background-color: #CCCCCC;
-                color: #666666;
-            }}
-        """)
+        self.restore_btn.setObjectName("restoreButton")
         self.restore_btn.clicked.connect(self.restore_selected_backup)
         restore_actions.addWidget(self.restore_btn)
         
         restore_actions.addStretch()
         restore_layout.addLayout(restore_actions)
         
-        self.tab_widget.addTab(restore_widget, "♻️ Restore")
-        
         # Setup tab change handler for cleanup
         def on_tab_changed(index):
             if self.tab_widget.widget(index) != restore_widget:
                 self._cleanup_all_extracted_backups()
         
         self.tab_widget.currentChanged.connect(on_tab_changed)
+        return restore_widget
     
     def style_table(self, table):
         """Apply consistent styling to tables with responsive font sizes"""
-        table.setStyleSheet(f"""
-            QTableWidget {{
-                border: 1px solid #DDDDDD;
-                border-radius: 4px;
-                background-color: white;
-                gridline-color: #F0F0F0;
-                font-size: {self.font_size_small}px;
-            }}
-            QTableWidget::item {{
-                padding: 8px;
-            }}
-            QTableWidget::item:selected {{
-                background-color: #E3F2FD;
-                color: #000000;
-            }}
-            QHeaderView::section {{
-                background-color: #F5F5F5;
-                padding: 8px;
-                border: none;
-                border-bottom: 2px solid #0078D4;
-                font-weight: bold;
-                font-size: {self.font_size_normal}px;
-            }}
-        """)
+        table.setObjectName("resultsTable")
     
-    def load_environment_variables(self):
-        """Load and display environment variables and user profile"""
-        # Load user profile information
+    def load_user_profile(self):
+        """Load and display user profile information"""
         profile_data = [
             ("Username", os.environ.get("USERNAME", "N/A")),
             ("Computer Name", os.environ.get("COMPUTERNAME", "N/A")),
@@ -1023,57 +1341,45 @@ class MainWindow(QMainWindow):
             ("Processor", os.environ.get("PROCESSOR_IDENTIFIER", "N/A")),
         ]
         
-        self.profile_table.setRowCount(len(profile_data))
-        for row, (key, value) in enumerate(profile_data):
-            key_item = QTableWidgetItem(key)
-            key_item.setFont(QFont("Segoe UI", 9, QFont.Weight.Bold))
-            self.profile_table.setItem(row, 0, key_item)
-            
-            value_item = QTableWidgetItem(value)
-            self.profile_table.setItem(row, 1, value_item)
-        
-        # Load all environment variables
-        self.all_env_vars = sorted(os.environ.items(), key=lambda x: x[0].upper())
-        self.display_environment_variables(self.all_env_vars)
+        with _bulk_table_update(self.profile_table):
+            self.profile_table.setRowCount(len(profile_data))
+            for row, (key, value) in enumerate(profile_data):
+                key_item = QTableWidgetItem(key)
+                key_item.setFont(self._bold_item_font)
+                self.profile_table.setItem(row, 0, key_item)
+                
+                value_item = QTableWidgetItem(value)
+                self.profile_table.setItem(row, 1, value_item)
+    
+    def load_environment_variables(self):
+        """Load and display all environment variables"""
+        self.display_environment_variables(self._get_env_snapshot())
+    
+    def _get_env_snapshot(self) -> list:
+        """Return (name, value, scope) tuples, re-reading at most every ENV_SNAPSHOT_TTL seconds"""
+        now = time.monotonic()
+        if self._env_snapshot is None or now - self._env_snapshot[0] > ENV_SNAPSHOT_TTL:
+            from src.core.utils import collect_environment_variables
+            self._env_snapshot = (now, collect_environment_variables())
+        return self._env_snapshot[1]
     
     def display_environment_variables(self, env_vars):
         """Display environment variables in the table"""
-        self.env_table.setSortingEnabled(False)  # Disable sorting while populating
-        self.env_table.setRowCount(len(env_vars))
-        
-        for row, (key, value) in enumerate(env_vars):
-            # Checkbox for selection
-            checkbox_item = QTableWidgetItem()
-            checkbox_item.setFlags(Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled)
-            checkbox_item.setCheckState(Qt.CheckState.Unchecked)
-            checkbox_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.env_table.setItem(row, 0, checkbox_item)
-            
-            # Variable name
-            key_item = QTableWidgetItem(key)
-            key_item.setFont(QFont("Segoe UI", 9, QFont.Weight.Bold))
-            key_item.setForeground(Qt.GlobalColor.darkBlue)
-            self.env_table.setItem(row, 1, key_item)
-            
-            # Variable value
-            value_item = QTableWidgetItem(value)
-            value_item.setToolTip(value)  # Show full value on hover
-            self.env_table.setItem(row, 2, value_item)
-        
-        self.env_table.setSortingEnabled(True)  # Re-enable sorting
-        # Update count label
-        self.env_count_label.setText(f"Total variables: {len(env_vars)}")
+        self.env_model.set_variables(env_vars)
+        
+        # Update count labels once; a model reset does not emit dataChanged
+        self.env_count_label.setText(f"Total variables: {self.env_proxy.rowCount()}")
+        self.update_selected_env_count()
+    
+    def _apply_env_filter(self):
+        """Apply the search box text once typing has paused"""
+        self.filter_environment_variables(self.env_search.text())
     
     def filter_environment_variables(self, text):
         """Filter environment variables based on search text"""
-        if not text:
-            self.display_environment_variables(self.all_env_vars)
-            return
-        
-        text_lower = text.lower()
-        filtered = [(k, v) for k, v in self.all_env_vars 
-                   if text_lower in k.lower() or text_lower in v.lower()]
-        self.display_environment_variables(filtered)
+        # Filtering hides rows in the proxy, so check states survive a search
+        self.env_proxy.set_search_text(text)
+        self.env_count_label.setText(f"Total variables: {self.env_proxy.rowCount()}")
     
     def create_toolbar(self):
         """Create application toolbar"""
@@ -1131,37 +1437,22 @@ class MainWindow(QMainWindow):
         self.style_table(self.results_table)
     
     def apply_styles(self):
-        """Apply modern styling to the window"""
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #F8F9FA;
-            }
-            QLabel {
-                color: #333333;
-            }
-            QToolBar {
-                background-color: #FFFFFF;
-                border-bottom: 1px solid #DDDDDD;
-                padding: 5px;
-                spacing: 10px;
-            }
-            QStatusBar {
-                background-color: #F5F5F5;
-                border-top: 1px solid #DDDDDD;
-            }
-        """)
+        """Apply the application stylesheet once, after all startup widgets exist"""
+        QApplication.instance().setStyleSheet(self._app_qss)
     
     def start_detection(self):
         """Start the detection process"""
-        if self.detection_worker and self.detection_worker.isRunning():
+        if self.detection_worker is not None:
             return  # Already running
         
         # Switch to Detected Tools tab (2nd tab, index 1)
         self.tab_widget.setCurrentIndex(1)
         
         # Clear previous results
-        self.results_table.setRowCount(0)
+        with _bulk_table_update(self.results_table):
+            self.results_table.setRowCount(0)
         self.detected_tools.clear()
+        self._selected_tools.clear()
         
         # Update UI
         self.scan_button.setEnabled(False)
@@ -1171,12 +1462,14 @@ class MainWindow(QMainWindow):
         
         # Start detection in background thread
         self.detection_worker = DetectionWorker(self.detector)
-        self.detection_worker.finished.connect(self.on_detection_complete)
-        self.detection_worker.error.connect(self.on_detection_error)
-        self.detection_worker.start()
+        self.detection_worker.signals.finished.connect(self.on_detection_complete)
+        self.detection_worker.signals.error.connect(self.on_detection_error)
+        QThreadPool.globalInstance().start(self.detection_worker)
     
     def on_detection_complete(self, tools: list):
         """Handle detection completion"""
+        self.detection_worker = None
+        
         # Separate browsers from other tools
         browsers = [t for t in tools if t.tool_type == "Browser"]
         other_tools = [t for t in tools if t.tool_type != "Browser"]
@@ -1202,6 +1495,7 @@ class MainWindow(QMainWindow):
     
     def on_detection_error(self, error_msg: str):
         """Handle detection error"""
+        self.detection_worker = None
         self.scan_button.setEnabled(True)
         self.progress_bar.setVisible(False)
         self.status_bar.showMessage("Detection failed")
@@ -1215,298 +1509,270 @@ class MainWindow(QMainWindow):
     
     def populate_results_table(self, tools: list):
         """Populate the results table with detected tools"""
-        self.results_table.setSortingEnabled(False)  # Disable sorting while populating
-        self.results_table.setRowCount(len(tools))
-        
-        for row, tool in enumerate(tools):
-            # Checkbox for selection
-            checkbox_item = QTableWidgetItem()
-            checkbox_item.setFlags(Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled)
-            checkbox_item.setCheckState(Qt.CheckState.Unchecked)
-            checkbox_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.results_table.setItem(row, 0, checkbox_item)
-            
-            # Tool name
-            name_item = QTableWidgetItem(tool.name)
-            name_item.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
-            self.results_table.setItem(row, 1, name_item)
-            
-            # Version
-            version_item = QTableWidgetItem(tool.version)
-            self.results_table.setItem(row, 2, version_item)
-            
-            # Type
-            type_item = QTableWidgetItem(tool.tool_type)
-            type_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.results_table.setItem(row, 3, type_item)
-            
-            # Path
-            path_item = QTableWidgetItem(tool.path)
-            path_item.setForeground(Qt.GlobalColor.darkGray)
-            self.results_table.setItem(row, 4, path_item)
-        
-        self.results_table.setSortingEnabled(True)  # Re-enable sorting
+        table = self.results_table
+        set_item = table.setItem
+        
+        # Cells share their styling per column; clone configured prototypes
+        # per row and only set the text
+        checkbox_proto = _checkbox_item(Qt.CheckState.Unchecked)
+        name_proto = self._name_cell_prototype()
+        type_proto = QTableWidgetItem()
+        type_proto.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+        path_proto = self._path_cell_prototype()
+        
+        with _bulk_table_update(table):
+            table.setRowCount(len(tools))
+            
+            for row, tool in enumerate(tools):
+                # Checkbox for selection
+                set_item(row, 0, checkbox_proto.clone())
+                
+                # Tool name
+                name_item = name_proto.clone()
+                name_item.setText(tool.name)
+                set_item(row, 1, name_item)
+                
+                # Version
+                set_item(row, 2, QTableWidgetItem(tool.version))
+                
+                # Type
+                type_item = type_proto.clone()
+                type_item.setText(tool.tool_type)
+                set_item(row, 3, type_item)
+                
+                # Path
+                path_item = path_proto.clone()
+                path_item.setText(tool.path)
+                set_item(row, 4, path_item)
+        
+        self._selected_tools.clear()
+        self.selected_count_label.setText("Selected: 0")
+    
+    def _name_cell_prototype(self) -> QTableWidgetItem:
+        """Empty bold name cell to clone for each detected tool or browser row"""
+        item = QTableWidgetItem()
+        item.setFont(self._bold_name_font)
+        return item
+    
+    def _path_cell_prototype(self) -> QTableWidgetItem:
+        """Empty greyed path cell to clone for each detected tool or browser row"""
+        item = QTableWidgetItem()
+        item.setForeground(Qt.GlobalColor.darkGray)
+        return item
     
     def select_all_tools(self):
         """Select all tools in the table"""
-        for row in range(self.results_table.rowCount()):
-            item = self.results_table.item(row, 0)
-            if item:
-                item.setCheckState(Qt.CheckState.Checked)
+        self._set_all_checked(self.results_table, Qt.CheckState.Checked)
         self.update_selected_count()
     
     def deselect_all_tools(self):
         """Deselect all tools in the table"""
-        for row in range(self.results_table.rowCount()):
-            item = self.results_table.item(row, 0)
-            if item:
-                item.setCheckState(Qt.CheckState.Unchecked)
+        self._set_all_checked(self.results_table, Qt.CheckState.Unchecked)
         self.update_selected_count()
     
+    def _set_all_checked(self, table, state):
+        """Set every checkbox in a table; the caller refreshes counts once afterwards"""
+        get_item = table.item
+        self._suppress_checkbox_signals = True
+        try:
+            for row in range(table.rowCount()):
+                item = get_item(row, 0)
+                if item:
+                    item.setCheckState(state)
+        finally:
+            self._suppress_checkbox_signals = False
+    
     def update_selected_count(self):
         """Update the selected count label for tools"""
-        count = 0
-        selected_names = []
-        for row in range(self.results_table.rowCount()):
-            item = self.results_table.item(row, 0)
-            if item and item.checkState() == Qt.CheckState.Checked:
-                count += 1
-                tool_name = self.results_table.item(row, 1).text()
-                selected_names.append(tool_name)
-        
-        self.selected_count_label.setText(f"Selected: {count}")
+        self.selected_count_label.setText(f"Selected: {len(self._selected_tools)}")
         self.update_backup_summary()
     
     def on_tool_checkbox_changed(self, item):
         """Handle tool checkbox state change"""
         if item and item.column() == 0:  # Only for checkbox column
-            self.update_selected_count()
+            self._track_checked_row(self._selected_tools, self.results_table, item, path_column=4)
+            if not self._suppress_checkbox_signals:
+                self.update_selected_count()
+    
+    def _track_checked_row(self, selected: dict, table, item, path_column: int):
+        """Add or remove a toggled row in a live selection dict"""
+        row = item.row()
+        name_item = table.item(row, 1)
+        path_item = table.item(row, path_column)
+        if name_item is None:
+            return
+        key = (name_item.text(), path_item.text() if path_item else '')
+        if item.checkState() == Qt.CheckState.Checked:
+            version_item = table.item(row, 2)
+            selected[key] = {
+                'name': key[0],
+                'version': version_item.text() if version_item else '',
+                'path': key[1]
+            }
+        else:
+            selected.pop(key, None)
     
     def select_all_env_vars(self):
-        """Select all environment variables in the table"""
-        for row in range(self.env_table.rowCount()):
-            item = self.env_table.item(row, 0)
-            if item:
-                item.setCheckState(Qt.CheckState.Checked)
-        self.update_selected_env_count()
+        """Select all environment variables currently shown in the table"""
+        self._set_visible_env_vars_checked(True)
     
     def deselect_all_env_vars(self):
-        """Deselect all environment variables in the table"""
-        for row in range(self.env_table.rowCount()):
-            item = self.env_table.item(row, 0)
-            if item:
-                item.setCheckState(Qt.CheckState.Unchecked)
-        self.update_selected_env_count()
+        """Deselect all environment variables currently shown in the table"""
+        self._set_visible_env_vars_checked(False)
+    
+    def _set_visible_env_vars_checked(self, checked: bool):
+        """Set the check state of every row that passes the current filter"""
+        rows = [self.env_proxy.mapToSource(self.env_proxy.index(row, 0)).row()
+                for row in range(self.env_proxy.rowCount())]
+        self.env_model.set_rows_checked(rows, checked)
     
     def update_selected_env_count(self):
         """Update the selected count label for environment variables"""
-        count = 0
-        for row in range(self.env_table.rowCount()):
-            item = self.env_table.item(row, 0)
-            if item and item.checkState() == Qt.CheckState.Checked:
-                count += 1
+        count = len(self.env_model.checked_rows)
         self.selected_env_count_label.setText(f"Selected: {count}")
         self.update_backup_summary()
     
-    def on_env_checkbox_changed(self, item):
+    def _checked_env_variables(self) -> list:
+        """Return checked (name, value) pairs, or none if the tab was never opened"""
+        if self.env_model is None:
+            return []
+        return self.env_model.checked_variables()
+    
+    def on_env_checkbox_changed(self, top_left, bottom_right, roles=None):
         """Handle environment variable checkbox state change"""
-        if item and item.column() == 0:  # Only for checkbox column
+        if top_left.column() == 0:  # Only for checkbox column
             self.update_selected_env_count()
     
     def populate_browsers_table(self, browsers: list):
         """Populate the browsers table with detected browsers"""
-        # Temporarily disconnect signal to avoid triggering during population
-        self.browsers_table.itemChanged.disconnect(self.on_browser_checkbox_changed)
-        
-        self.browsers_table.setSortingEnabled(False)
-        self.browsers_table.setRowCount(len(browsers))
-        
-        for row, browser in enumerate(browsers):
-            # Checkbox for selection
-            checkbox_item = QTableWidgetItem()
-            checkbox_item.setFlags(Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled)
-            checkbox_item.setCheckState(Qt.CheckState.Checked)  # Default to checked
-            checkbox_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.browsers_table.setItem(row, 0, checkbox_item)
-            
-            # Browser name
-            name_item = QTableWidgetItem(browser.name)
-            name_item.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
-            self.browsers_table.setItem(row, 1, name_item)
-            
-            # Version
-            version_item = QTableWidgetItem(browser.version)
-            self.browsers_table.setItem(row, 2, version_item)
-            
-            # Path
-            path_item = QTableWidgetItem(browser.path)
-            path_item.setForeground(Qt.GlobalColor.darkGray)
-            self.browsers_table.setItem(row, 3, path_item)
-            
-            # Config Status
-            status_item = QTableWidgetItem("✓ Ready")
-            status_item.setForeground(Qt.GlobalColor.darkGreen)
-            status_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.browsers_table.setItem(row, 4, status_item)
-        
-        self.browsers_table.setSortingEnabled(True)
-        
-        # Reconnect signal after population
-        self.browsers_table.itemChanged.connect(self.on_browser_checkbox_changed)
+        table = self.browsers_table
+        set_item = table.setItem
+        
+        # Cells share their styling per column; clone configured prototypes per row
+        checkbox_proto = _checkbox_item(Qt.CheckState.Checked)  # Default to checked
+        name_proto = self._name_cell_prototype()
+        path_proto = self._path_cell_prototype()
+        status_proto = QTableWidgetItem("✓ Ready")
+        status_proto.setForeground(Qt.GlobalColor.darkGreen)
+        status_proto.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+        
+        with _bulk_table_update(table):
+            table.setRowCount(len(browsers))
+            
+            for row, browser in enumerate(browsers):
+                # Checkbox for selection
+                set_item(row, 0, checkbox_proto.clone())
+                
+                # Browser name
+                name_item = name_proto.clone()
+                name_item.setText(browser.name)
+                set_item(row, 1, name_item)
+                
+                # Version
+                set_item(row, 2, QTableWidgetItem(browser.version))
+                
+                # Path
+                path_item = path_proto.clone()
+                path_item.setText(browser.path)
+                set_item(row, 3, path_item)
+                
+                # Config Status
+                set_item(row, 4, status_proto.clone())
+        
+        # All browsers start checked
+        self._selected_browsers = {
+            (browser.name, browser.path): {'name': browser.name, 'version': browser.version, 'path': browser.path}
+            for browser in browsers
+        }
         
         # Now update counts
         self.update_browsers_count()
     
     def select_all_browsers(self):
         """Select all browsers in the table"""
-        for row in range(self.browsers_table.rowCount()):
-            item = self.browsers_table.item(row, 0)
-            if item:
-                item.setCheckState(Qt.CheckState.Checked)
+        self._set_all_checked(self.browsers_table, Qt.CheckState.Checked)
         self.update_browsers_count()
     
     def deselect_all_browsers(self):
         """Deselect all browsers in the table"""
-        for row in range(self.browsers_table.rowCount()):
-            item = self.browsers_table.item(row, 0)
-            if item:
-                item.setCheckState(Qt.CheckState.Unchecked)
+        self._set_all_checked(self.browsers_table, Qt.CheckState.Unchecked)
         self.update_browsers_count()
     
     def update_browsers_count(self):
         """Update the selected count label for browsers"""
-        count = 0
-        for row in range(self.browsers_table.rowCount()):
-            item = self.browsers_table.item(row, 0)
-            if item and item.checkState() == Qt.CheckState.Checked:
-                count += 1
-        self.selected_browsers_count_label.setText(f"Selected: {count}")
+        self.selected_browsers_count_label.setText(f"Selected: {len(self._selected_browsers)}")
         self.update_backup_summary()
     
     def on_browser_checkbox_changed(self, item):
         """Handle browser checkbox state change"""
         if item and item.column() == 0:  # Only for checkbox column
-            self.update_browsers_count()
+            self._track_checked_row(self._selected_browsers, self.browsers_table, item, path_column=3)
+            if not self._suppress_checkbox_signals:
+                self.update_browsers_count()
     
     def update_backup_summary(self):
         """Update the unified backup summary section"""
-        # Get selected tools
-        selected_tools = []
-        for row in range(self.results_table.rowCount()):
-            checkbox = self.results_table.item(row, 0)
-            if checkbox and checkbox.checkState() == Qt.CheckState.Checked:
-                tool_name_item = self.results_table.item(row, 1)
-                if tool_name_item:
-                    selected_tools.append(tool_name_item.text())
-        
-        # Get selected browsers
-        selected_browsers = []
-        for row in range(self.browsers_table.rowCount()):
-            checkbox = self.browsers_table.item(row, 0)
-            if checkbox and checkbox.checkState() == Qt.CheckState.Checked:
-                browser_name_item = self.browsers_table.item(row, 1)
-                if browser_name_item:
-                    selected_browsers.append(browser_name_item.text())
-        
-        # Get selected environment variables
-        selected_vars = []
-        for row in range(self.env_table.rowCount()):
-            checkbox = self.env_table.item(row, 0)
-            if checkbox and checkbox.checkState() == Qt.CheckState.Checked:
-                var_name_item = self.env_table.item(row, 1)
-                if var_name_item:
-                    selected_vars.append(var_name_item.text())
-        
+        # Selections are tracked live by the checkbox handlers, so no table scans here
         # Update tools info (compact)
-        tools_count = len(selected_tools)
-        self.tools_info_label.setText(f"🔧 <b>{tools_count}</b> Tools")
-        if tools_count > 0:
-            tools_display = ", ".join(selected_tools[:3])
-            if tools_count > 3:
-                tools_display += f" +{tools_count - 3} more"
-            self.tools_list_label.setText(tools_display)
-            self.tools_list_label.setStyleSheet("font-size: 10px; color: #0078D4; font-weight: bold;")
-        else:
-            self.tools_list_label.setText("None selected")
-            self.tools_list_label.setStyleSheet("font-size: 10px; color: #666666;")
+        tools_count = len(self._selected_tools)
+        self._update_summary_section(
+            self.tools_info_label, self.tools_list_label, f"🔧 <b>{tools_count}</b> Tools",
+            tools_count, (tool['name'] for tool in islice(self._selected_tools.values(), 3)), 3
+        )
         
         # Update browsers info (compact)
-        browsers_count = len(selected_browsers)
-        self.browsers_info_label.setText(f"🌐 <b>{browsers_count}</b> Browsers")
-        if browsers_count > 0:
-            browsers_display = ", ".join(selected_browsers[:3])
-            if browsers_count > 3:
-                browsers_display += f" +{browsers_count - 3} more"
-            self.browsers_list_label.setText(browsers_display)
-            self.browsers_list_label.setStyleSheet("font-size: 10px; color: #0078D4; font-weight: bold;")
-        else:
-            self.browsers_list_label.setText("None selected")
-            self.browsers_list_label.setStyleSheet("font-size: 10px; color: #666666;")
+        browsers_count = len(self._selected_browsers)
+        self._update_summary_section(
+            self.browsers_info_label, self.browsers_list_label, f"🌐 <b>{browsers_count}</b> Browsers",
+            browsers_count, (browser['name'] for browser in islice(self._selected_browsers.values(), 3)), 3
+        )
         
         # Update environment variables info (compact)
-        env_count = len(selected_vars)
-        self.env_info_label.setText(f"🌍 <b>{env_count}</b> Variables")
-        if env_count > 0:
-            env_display = ", ".join(selected_vars[:4])
-            if env_count > 4:
-                env_display += f" +{env_count - 4} more"
-            self.env_list_label.setText(env_display)
-            self.env_list_label.setStyleSheet("font-size: 10px; color: #0078D4; font-weight: bold;")
-        else:
-            self.env_list_label.setText("None selected")
-            self.env_list_label.setStyleSheet("font-size: 10px; color: #666666;")
+        env_count = len(self.env_model.checked_rows) if self.env_model is not None else 0
+        self._update_summary_section(
+            self.env_info_label, self.env_list_label, f"🌍 <b>{env_count}</b> Variables",
+            env_count, self.env_model.checked_names(4) if env_count else (), 4
+        )
         
         # Enable/disable backup button
         total_selected = tools_count + browsers_count + env_count
         self.unified_backup_btn.setEnabled(total_selected > 0)
     
+    def _update_summary_section(self, info_label, list_label, info_text: str, count: int, preview, limit: int):
+        """Show a count and a capped name preview in one backup summary column"""
+        self._set_summary_text(info_label, info_text)
+        if count > 0:
+            display = ", ".join(preview)
+            if count > limit:
+                display += f" +{count - limit} more"
+        else:
+            display = "None selected"
+        self._set_summary_text(list_label, display)
+        _set_style_property(list_label, 'active', count > 0)
+    
+    def _set_summary_text(self, label, text: str):
+        """Set a summary label's text only if it differs from what it last showed"""
+        if self._last_summary.get(label) != text:
+            self._last_summary[label] = text
+            label.setText(text)
+    
     def backup_selected_items(self):
         """Backup selected tools, browsers, and environment variables together"""
-        if self.backup_worker and self.backup_worker.isRunning():
+        if self.backup_worker is not None:
             return  # Backup already in progress
         
-        # Get selected tools
-        selected_tools = []
-        for row in range(self.results_table.rowCount()):
-            checkbox = self.results_table.item(row, 0)
-            if checkbox and checkbox.checkState() == Qt.CheckState.Checked:
-                tool_name = self.results_table.item(row, 1).text()
-                tool_version = self.results_table.item(row, 2).text()
-                tool_path = self.results_table.item(row, 4).text()
-                selected_tools.append({
-                    'name': tool_name,
-                    'version': tool_version,
-                    'path': tool_path
-                })
-        
-        # Get selected browsers
-        selected_browsers = []
-        for row in range(self.browsers_table.rowCount()):
-            checkbox = self.browsers_table.item(row, 0)
-            if checkbox and checkbox.checkState() == Qt.CheckState.Checked:
-                browser_name = self.browsers_table.item(row, 1).text()
-                browser_version = self.browsers_table.item(row, 2).text()
-                browser_path = self.browsers_table.item(row, 3).text()
-                selected_browsers.append({
-                    'name': browser_name,
-                    'version': browser_version,
-                    'path': browser_path
-                })
+        # Checked rows are tracked live by the checkbox slots, so no table scans here
+        selected_tools = [dict(tool) for tool in self._selected_tools.values()]
+        selected_browsers = [dict(browser) for browser in self._selected_browsers.values()]
         
         # Combine tools and browsers for backup
         all_tools = selected_tools + selected_browsers
         
         # Get selected environment variables
-        selected_vars = []
-        for row in range(self.env_table.rowCount()):
-            checkbox = self.env_table.item(row, 0)
-            if checkbox and checkbox.checkState() == Qt.CheckState.Checked:
-                var_name = self.env_table.item(row, 1).text()
-                var_value = self.env_table.item(row, 2).text()
-                selected_vars.append({
-                    'name': var_name,
-                    'value': var_value
-                })
+        selected_vars = [
+            {'name': var_name, 'value': var_value}
+            for var_name, var_value in self._checked_env_variables()
+        ]
         
         if not all_tools and not selected_vars:
             QMessageBox.warning(
@@ -1533,21 +1799,9 @@ class MainWindow(QMainWindow):
         # Disable all controls during backup
         self.set_controls_enabled(False)
         self.unified_backup_btn.setEnabled(True)  # Keep backup button enabled for cancel
-        self.unified_backup_btn.setText("⏹ Cancel Backup")
-        self.unified_backup_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #D32F2F;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 20px;
-                font-size: 12px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #B71C1C;
-            }
-        """)
+        self.unified_backup_btn.setText("Cancel Backup")
+        _set_button_icon(self.unified_backup_btn, "stop")
+        _set_style_property(self.unified_backup_btn, 'cancelling', True)
         self.unified_backup_btn.clicked.disconnect()
         self.unified_backup_btn.clicked.connect(self.cancel_backup)
         
@@ -1557,25 +1811,24 @@ class MainWindow(QMainWindow):
         
         # Start backup in background thread
         self.backup_worker = BackupWorker(self.backup_manager, all_tools, selected_vars)
-        self.backup_worker.finished.connect(self.on_backup_complete)
-        self.backup_worker.error.connect(self.on_backup_error)
-        self.backup_worker.progress.connect(self.on_backup_progress)
-        self.backup_worker.start()
+        self.backup_worker.signals.finished.connect(self.on_backup_complete)
+        self.backup_worker.signals.error.connect(self.on_backup_error)
+        self.backup_worker.signals.progress.connect(self.on_backup_progress)
+        QThreadPool.globalInstance().start(self.backup_worker)
     
     def on_backup_progress(self, message: str):
         """Handle backup progress updates"""
         self.status_bar.showMessage(message)
     
-    def on_backup_complete(self, results: dict):
-        """Handle backup completion"""
+    def on_backup_complete(self, results: dict, summary: str):
+        """Handle backup completion; summary is the details text built by the worker"""
+        self.backup_worker = None
         self.restore_backup_button()
         self.set_controls_enabled(True)
         self.progress_bar.setVisible(False)
         self.setWindowTitle("W-Rebuild - System Detection & Backup Tool")
         
         if results.get('success'):
-            summary = self.backup_manager.get_backup_summary(results)
-            
             # Show success dialog with details
             msg_box = QMessageBox(self)
             msg_box.setWindowTitle("Backup Complete")
@@ -1599,13 +1852,15 @@ class MainWindow(QMainWindow):
             )
             
             if reply == QMessageBox.StandardButton.Yes:
-                import subprocess
-                subprocess.Popen(f'explorer "{results["backup_dir"]}"')
+                QDesktopServices.openUrl(QUrl.fromLocalFile(results["backup_dir"]))
+        elif results.get('cancelled'):
+            self.status_bar.showMessage("Backup cancelled", 3000)
         else:
             self.status_bar.showMessage("Backup failed", 5000)
     
     def on_backup_error(self, error_msg: str):
         """Handle backup error"""
+        self.backup_worker = None
         self.restore_backup_button()
         self.set_controls_enabled(True)
         self.progress_bar.setVisible(False)
@@ -1622,45 +1877,27 @@ class MainWindow(QMainWindow):
         """Enable or disable all interactive controls"""
         self.scan_button.setEnabled(enabled)
         self.results_table.setEnabled(enabled)
-        self.env_table.setEnabled(enabled)
         self.select_all_btn.setEnabled(enabled)
         self.deselect_all_btn.setEnabled(enabled)
-        self.select_all_env_btn.setEnabled(enabled)
-        self.deselect_all_env_btn.setEnabled(enabled)
+        if self.env_model is not None:
+            self.env_table.setEnabled(enabled)
+            self.select_all_env_btn.setEnabled(enabled)
+            self.deselect_all_env_btn.setEnabled(enabled)
         self.tab_widget.setEnabled(enabled)
     
     def restore_backup_button(self):
         """Restore backup button to its original state"""
         self.unified_backup_btn.clicked.disconnect()
         self.unified_backup_btn.clicked.connect(self.backup_selected_items)
-        self.unified_backup_btn.setText("💾 Create Backup")
-        self.unified_backup_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #0078D4;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 20px;
-                font-size: 12px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #005A9E;
-            }
-            QPushButton:pressed {
-                background-color: #004578;
-            }
-            QPushButton:disabled {
-                background-color: #CCCCCC;
-                color: #666666;
-            }
-        """)
+        self.unified_backup_btn.setText("Create Backup")
+        _set_button_icon(self.unified_backup_btn, "backup")
+        _set_style_property(self.unified_backup_btn, 'cancelling', False)
         # Update enabled state based on selection
         self.update_backup_summary()
     
     def cancel_backup(self):
         """Cancel the ongoing backup operation"""
-        if self.backup_worker and self.backup_worker.isRunning():
+        if self.backup_worker is not None:
             reply = QMessageBox.question(
                 self,
                 "Cancel Backup",
@@ -1669,13 +1906,11 @@ class MainWindow(QMainWindow):
             )
             
             if reply == QMessageBox.StandardButton.Yes:
-                self.backup_worker.terminate()
-                self.backup_worker.wait()
-                self.restore_backup_button()
-                self.set_controls_enabled(True)
-                self.progress_bar.setVisible(False)
-                self.setWindowTitle("W-Rebuild - System Detection & Backup Tool")
-                self.status_bar.showMessage("Backup cancelled", 3000)
+                # Pool threads cannot be terminated; the worker stops before the next
+                # tool and on_backup_complete restores the UI
+                self.backup_worker.cancel()
+                self.unified_backup_btn.setEnabled(False)
+                self.status_bar.showMessage("Cancelling backup...")
     
     def scan_for_backups(self):
         """Scan for available backups in the backup folder"""
@@ -1683,57 +1918,28 @@ class MainWindow(QMainWindow):
         
         # Cleanup any previously extracted backups
         self._cleanup_all_extracted_backups()
+        self._backup_html_cache.clear()
         
         try:
             # Get list of available backups
             self.available_backups = self.restore_manager.list_available_backups()
             
-            # Clear existing table
-            self.backups_table.setRowCount(0)
+            # Clear existing table and drop any rows a previous scan had not added yet
+            self._backup_rows = iter(())
+            self._last_details_row = -1
+            with _bulk_table_update(self.backups_table):
+                self.backups_table.setRowCount(0)
             
             if not self.available_backups:
                 self.backup_details_text.setPlainText("No backups found in:\n" + str(self.restore_manager.backup_root))
                 self.status_bar.showMessage("No backups found", 3000)
                 return
             
-            # Populate table with backups
+            # Size the table up front and fill it in batches, yielding to the
+            # event loop between them so large backup folders do not freeze the UI
             self.backups_table.setRowCount(len(self.available_backups))
-            
-            for row, backup in enumerate(self.available_backups):
-                # Radio button for selection
-                radio_item = QTableWidgetItem()
-                radio_item.setFlags(Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled)
-                radio_item.setCheckState(Qt.CheckState.Checked if row == 0 else Qt.CheckState.Unchecked)
-                self.backups_table.setItem(row, 0, radio_item)
-                
-                # Backup name
-                name_item = QTableWidgetItem(backup['backup_name'])
-                self.backups_table.setItem(row, 1, name_item)
-                
-                # Date/time
-                datetime_str = backup.get('datetime', backup['timestamp'])
-                if datetime_str:
-                    try:
-                        # Format datetime nicely
-                        dt = datetime.fromisoformat(datetime_str.replace('Z', '+00:00'))
-                        formatted_dt = dt.strftime("%Y-%m-%d %H:%M:%S")
-                    except:
-                        formatted_dt = datetime_str
-                else:
-                    formatted_dt = backup['timestamp']
-                
-                datetime_item = QTableWidgetItem(formatted_dt)
-                self.backups_table.setItem(row, 2, datetime_item)
-                
-                # Tools count
-                tools_item = QTableWidgetItem(str(backup['tools_count']))
-                tools_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.backups_table.setItem(row, 3, tools_item)
-                
-                # Env vars count
-                env_item = QTableWidgetItem(str(backup['env_vars_count']))
-                env_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.backups_table.setItem(row, 4, env_item)
+            self._backup_rows = enumerate(self.available_backups)
+            self._populate_backup_batch()
             
             # Select the first (most recent) backup by default
             if self.available_backups:
@@ -1750,24 +1956,59 @@ class MainWindow(QMainWindow):
             )
             self.status_bar.showMessage("Scan failed", 3000)
     
+    def _populate_backup_batch(self):
+        """Add the next batch of scanned backups to the table and schedule the rest"""
+        batch = list(islice(self._backup_rows, BACKUP_ROWS_PER_BATCH))
+        if not batch:
+            return
+        
+        # Format dates in one pass before touching the table
+        formatted_dates = [_format_backup_datetime(backup) for _, backup in batch]
+        
+        table = self.backups_table
+        set_item = table.setItem
+        align_center = Qt.AlignmentFlag.AlignCenter
+        
+        with _bulk_table_update(table):
+            for (row, backup), formatted_date in zip(batch, formatted_dates):
+                # Column 0 has no item; SelectionRadioDelegate draws the radio mark
+                
+                # Backup name
+                set_item(row, 1, QTableWidgetItem(backup['backup_name']))
+                
+                # Date/time
+                set_item(row, 2, QTableWidgetItem(formatted_date))
+                
+                # Tools count
+                tools_item = QTableWidgetItem(str(backup['tools_count']))
+                tools_item.setTextAlignment(align_center)
+                set_item(row, 3, tools_item)
+                
+                # Env vars count
+                env_item = QTableWidgetItem(str(backup['env_vars_count']))
+                env_item.setTextAlignment(align_center)
+                set_item(row, 4, env_item)
+        
+        if len(batch) == BACKUP_ROWS_PER_BATCH:
+            # A rescan replaces _backup_rows, so a tick pending from it continues the new scan
+            QTimer.singleShot(0, self._populate_backup_batch)
+    
     def on_backup_selected(self):
         """Handle backup selection change"""
         selected_rows = self.backups_table.selectionModel().selectedRows()
         
         if selected_rows:
             row = selected_rows[0].row()
-            
-            # Update radio buttons
-            for r in range(self.backups_table.rowCount()):
-                item = self.backups_table.item(r, 0)
-                if item:
-                    item.setCheckState(Qt.CheckState.Checked if r == row else Qt.CheckState.Unchecked)
+            if row == self._last_details_row:
+                return  # Selection signal without a new row; details are already shown
+            self._last_details_row = row
             
             if 0 <= row < len(self.available_backups):
                 backup = self.available_backups[row]
                 self.show_backup_details(backup)
                 self.restore_btn.setEnabled(True)
         else:
+            self._last_details_row = -1
             self.restore_btn.setEnabled(False)
     
     def _cleanup_all_extracted_backups(self):
@@ -1779,6 +2020,17 @@ class MainWindow(QMainWindow):
     
     def show_backup_details(self, backup):
         """Display detailed information about a selected backup in HTML format"""
+        # Re-selecting a backup reuses its rendered details (and skips re-reading the manifest)
+        cached_html = self._backup_html_cache.get(backup['backup_path'])
+        if cached_html is not None:
+            self._backup_html_cache.move_to_end(backup['backup_path'])
+            self.backup_details_text.setHtml(cached_html)
+            return
+        
+        # Styled tags precomputed for the screen size by setup_screen_dimensions()
+        tags = self._details_tags
+        icon = tags.icon
+        
         try:
             backup_path = backup['backup_path']
             is_compressed = backup.get('is_compressed', False)
@@ -1786,111 +2038,102 @@ class MainWindow(QMainWindow):
             
             details = self.restore_manager.load_backup_details(backup_path, is_compressed, extracted_path)
             
-            # Enhanced responsive sizing variables with better scaling
-            if self.screen_width >= 2560:  # 4K monitors
-                icon_size = "22px"
-                padding_lg = "20px"
-                padding_md = "16px"
-                padding_sm = "12px"
-                margin_section = "25px"
-            elif self.screen_width >= 1920:  # 1080p monitors
-                icon_size = "20px"
-                padding_lg = "18px"
-                padding_md = "14px"
-                padding_sm = "10px"
-                margin_section = "22px"
-            elif self.screen_width >= 1366:  # Laptop screens
-                icon_size = "16px"
-                padding_lg = "12px"
-                padding_md = "10px"
-                padding_sm = "8px"
-                margin_section = "15px"
-            else:  # Small screens
-                icon_size = "14px"
-                padding_lg = "10px"
-                padding_md = "8px"
-                padding_sm = "6px"
-                margin_section = "12px"
-            
-            h3_size = f"{self.font_size_title + 2}px"
-            h4_size = f"{self.font_size_title - 1}px"
-            text_size = f"{self.font_size_normal}px"
-            small_size = f"{self.font_size_small}px"
-            
             if not details:
                 self.backup_details_text.setHtml(
-                    f"<div style='color: red; padding: {padding_lg};'>"
-                    f"<p style='font-size: {text_size};'><b>⚠️ Error loading backup details</b></p>"
-                    f"<p style='font-size: {small_size};'>Manifest file may be corrupted or missing.</p>"
+                    f"{tags.error}"
+                    f"{tags.error_title}<b>⚠️ Error loading backup details</b></p>"
+                    f"{tags.error_text}Manifest file may be corrupted or missing.</p>"
                     "</div>"
                 )
                 return
             
-            # Build HTML content with responsive sizing
-            html = f"<div style='font-family: Segoe UI, Arial; padding: {padding_sm};'>"
+            # Build HTML content with responsive sizing; fragments are joined once at the end
+            parts = [tags.root]
+            append = parts.append
+            extend = parts.extend
             
             # Header section
-            html += f"<div style='background-color: #E3F2FD; padding: {padding_md}; border-radius: 6px; margin-bottom: {margin_section};'>"
-            html += f"<h3 style='margin: 0; color: #0078D4; font-size: {h3_size};'>"
-            html += f"<span style='font-size: {icon_size};'>📦</span> {details['backup_name']}</h3>"
-            html += f"<p style='margin: 5px 0 0 0; color: #666; font-size: {small_size};'>"
-            html += f"<span style='font-size: {icon_size};'>🕐</span> Created: {details['datetime'][:19] if details['datetime'] else details['timestamp']}</p>"
-            html += f"</div>"
+            extend((
+                tags.header,
+                tags.title,
+                f"{icon}📦</span> {details['backup_name']}</h3>",
+                tags.subtitle,
+                f"{icon}🕐</span> Created: {details['datetime'][:19] if details['datetime'] else details['timestamp']}</p>",
+                "</div>",
+            ))
             
             # Tools section
-            html += f"<div style='margin-bottom: {margin_section};'>"
-            html += f"<h4 style='color: #0078D4; margin: 0 0 10px 0; border-bottom: 2px solid #0078D4; padding-bottom: 5px; font-size: {h4_size};'>"
-            html += f"<span style='font-size: {icon_size};'>🔧</span> Tools ({details['tools_count']})</h4>"
+            extend((
+                tags.section,
+                tags.heading,
+                f"{icon}🔧</span> Tools ({details['tools_count']})</h4>",
+            ))
             
             if details['tools']:
-                html += "<table style='width: 100%; border-collapse: collapse;'>"
+                append("<table style='width: 100%; border-collapse: collapse;'>")
+                tool_cell, tool_name, tool_version, tool_count = (
+                    tags.tool_cell, tags.tool_name, tags.tool_version, tags.tool_count
+                )
                 for tool in details['tools']:
-                    html += "<tr style='border-bottom: 1px solid #E0E0E0;'>"
-                    html += f"<td style='padding: {padding_sm} 5px;'>"
-                    html += f"<div style='font-weight: bold; color: #333; font-size: {text_size};'>{tool['name']}</div>"
-                    html += f"<div style='font-size: {small_size}; color: #666;'>Version: {tool['version']}</div>"
-                    html += f"<div style='font-size: {small_size}; color: #28A745;'>✓ {tool['backed_up_count']} item(s) backed up</div>"
-                    html += "</td>"
-                    html += "</tr>"
-                html += "</table>"
+                    extend((
+                        "<tr style='border-bottom: 1px solid #E0E0E0;'>",
+                        tool_cell,
+                        f"{tool_name}{tool['name']}</div>",
+                        f"{tool_version}Version: {tool['version']}</div>",
+                        f"{tool_count}✓ {tool['backed_up_count']} item(s) backed up</div>",
+                        "</td>",
+                        "</tr>",
+                    ))
+                append("</table>")
             else:
-                html += f"<p style='color: #999; font-style: italic; font-size: {text_size};'>No tools backed up</p>"
+                append(f"{tags.empty}No tools backed up</p>")
             
-            html += "</div>"
+            append("</div>")
             
             # Environment Variables section
-            html += "<div>"
-            html += f"<h4 style='color: #0078D4; margin: 0 0 10px 0; border-bottom: 2px solid #0078D4; padding-bottom: 5px; font-size: {h4_size};'>"
-            html += f"<span style='font-size: {icon_size};'>🌍</span> Environment Variables ({details['env_vars_count']})</h4>"
+            extend((
+                "<div>",
+                tags.heading,
+                f"{icon}🌍</span> Environment Variables ({details['env_vars_count']})</h4>",
+            ))
             
             if details['environment_variables']:
-                html += f"<div style='background-color: #F5F5F5; padding: {padding_sm}; border-radius: 4px;'>"
+                append(tags.env_box)
+                env_row = tags.env_row
                 # Show first 10 variables
-                for i, env_var in enumerate(details['environment_variables'][:10]):
-                    html += f"<div style='padding: 3px 0; font-family: Consolas, monospace; font-size: {small_size};'>"
-                    html += f"<span style='color: #0078D4; font-weight: bold;'>{env_var['name']}</span>"
-                    html += f"<span style='color: #666;'> = {env_var['value'][:50]}{'...' if len(env_var['value']) > 50 else ''}</span>"
-                    html += "</div>"
+                for env_var in details['environment_variables'][:10]:
+                    value = env_var['value']
+                    extend((
+                        env_row,
+                        f"<span style='color: #0078D4; font-weight: bold;'>{env_var['name']}</span>",
+                        f"<span style='color: #666;'> = {value[:50]}{'...' if len(value) > 50 else ''}</span>",
+                        "</div>",
+                    ))
                 
                 if details['env_vars_count'] > 10:
-                    html += f"<div style='padding: 8px 0; color: #666; font-style: italic; font-size: {small_size};'>"
-                    html += f"... and {details['env_vars_count'] - 10} more variables"
-                    html += "</div>"
+                    extend((
+                        tags.env_more,
+                        f"... and {details['env_vars_count'] - 10} more variables",
+                        "</div>",
+                    ))
                 
-                html += "</div>"
+                append("</div>")
             else:
-                html += f"<p style='color: #999; font-style: italic; font-size: {text_size};'>No environment variables backed up</p>"
+                append(f"{tags.empty}No environment variables backed up</p>")
             
-            html += "</div>"
-            html += "</div>"
+            extend(("</div>", "</div>"))
             
+            html = "".join(parts)
+            self._backup_html_cache[backup_path] = html
+            if len(self._backup_html_cache) > BACKUP_HTML_CACHE_SIZE:
+                self._backup_html_cache.popitem(last=False)
             self.backup_details_text.setHtml(html)
             
         except Exception as e:
             self.backup_details_text.setHtml(
-                f"<div style='color: red; padding: {padding_lg};'>"
-                f"<p style='font-size: {text_size};'><b>⚠️ Error loading backup details</b></p>"
-                f"<p style='font-size: {small_size};'>{str(e)}</p>"
+                f"{tags.error}"
+                f"{tags.error_title}<b>⚠️ Error loading backup details</b></p>"
+                f"{tags.error_text}{str(e)}</p>"
                 "</div>"
             )
     
@@ -1958,7 +2201,6 @@ class MainWindow(QMainWindow):
     
     def show_installation_dialog(self, backup, backup_path, missing_tools, installed_tools, version_mismatch):
         """Show dialog for selecting tools to install and configurations to restore"""
-        from PySide6.QtWidgets import QDialog, QDialogButtonBox, QTabWidget
         
         # Load backup details to get environment variables
         is_compressed = backup.get('is_compressed', False)
@@ -1994,32 +2236,36 @@ class MainWindow(QMainWindow):
         missing_other_tools = [t for t in missing_tools if t not in missing_browsers]
         
         # Status summary
-        status_text = f"<p><b>Status Summary:</b></p><ul>"
+        status_parts = ["<p><b>Status Summary:</b></p><ul>"]
         
         if installed_other_tools:
-            status_text += f"<li>✅ <b>{len(installed_other_tools)}</b> tool(s) already installed (configs can be restored)</li>"
+            status_parts.append(f"<li>✅ <b>{len(installed_other_tools)}</b> tool(s) already installed (configs can be restored)</li>")
         
         if installed_browsers:
-            status_text += f"<li>🌐 <b>{len(installed_browsers)}</b> browser(s) already installed (configs can be restored)</li>"
+            status_parts.append(f"<li>🌐 <b>{len(installed_browsers)}</b> browser(s) already installed (configs can be restored)</li>")
         
         if missing_other_tools:
-            status_text += f"<li>❌ <b>{len(missing_other_tools)}</b> tool(s) need installation</li>"
+            status_parts.append(f"<li>❌ <b>{len(missing_other_tools)}</b> tool(s) need installation</li>")
         
         if missing_browsers:
-            status_text += f"<li>❌ <b>{len(missing_browsers)}</b> browser(s) need installation</li>"
+            status_parts.append(f"<li>❌ <b>{len(missing_browsers)}</b> browser(s) need installation</li>")
         
         if version_mismatch:
-            status_text += f"<li>⚠️ <b>{len(version_mismatch)}</b> tool(s) have version mismatch</li>"
+            status_parts.append(f"<li>⚠️ <b>{len(version_mismatch)}</b> tool(s) have version mismatch</li>")
         
-        status_text += f"<li>🌍 <b>{len(env_vars)}</b> environment variable(s) available</li>"
-        status_text += "</ul>"
+        status_parts.append(f"<li>🌍 <b>{len(env_vars)}</b> environment variable(s) available</li>")
+        status_parts.append("</ul>")
         
-        status_label = QLabel(status_text)
+        status_label = QLabel("".join(status_parts))
         layout.addWidget(status_label)
         
         # Create tabs for different restore options
         tabs = QTabWidget()
         
+        # Every selection table starts with all rows checked
+        checkable = Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled
+        checked = Qt.CheckState.Checked
+        
         # Tab 1: Missing Tools (need installation)
         if missing_tools:
             missing_tab = QWidget()
@@ -2043,43 +2289,48 @@ class MainWindow(QMainWindow):
             self.missing_tools_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
             self.missing_tools_table.verticalHeader().setVisible(False)
             
-            self.missing_tools_table.setRowCount(len(missing_tools))
-            
-            for row, tool in enumerate(missing_tools):
-                # Checkbox
-                check_item = QTableWidgetItem()
-                check_item.setFlags(Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled)
-                check_item.setCheckState(Qt.CheckState.Checked)
-                self.missing_tools_table.setItem(row, 0, check_item)
-                
-                # Tool name
-                name_item = QTableWidgetItem(tool['name'])
-                self.missing_tools_table.setItem(row, 1, name_item)
-                
-                # Version
-                version_item = QTableWidgetItem(tool['version'])
-                self.missing_tools_table.setItem(row, 2, version_item)
-                
-                # Install method
-                winget_id = tool.get('winget_id')
-                if winget_id:
-                    method_text = f"winget ({winget_id})"
-                else:
-                    method_text = "Manual"
+            set_item = self.missing_tools_table.setItem
+            with _bulk_table_update(self.missing_tools_table):
+                self.missing_tools_table.setRowCount(len(missing_tools))
                 
-                method_item = QTableWidgetItem(method_text)
-                self.missing_tools_table.setItem(row, 3, method_item)
+                for row, tool in enumerate(missing_tools):
+                    # Checkbox
+                    check_item = QTableWidgetItem()
+                    check_item.setFlags(checkable)
+                    check_item.setCheckState(checked)
+                    set_item(row, 0, check_item)
+                    
+                    # Tool name
+                    name_item = QTableWidgetItem(tool['name'])
+                    set_item(row, 1, name_item)
+                    
+                    # Version
+                    version_item = QTableWidgetItem(tool['version'])
+                    set_item(row, 2, version_item)
+                    
+                    # Install method
+                    winget_id = tool.get('winget_id')
+                    if winget_id:
+                        method_text = f"winget ({winget_id})"
+                    else:
+                        method_text = "Manual"
+                    
+                    method_item = QTableWidgetItem(method_text)
+                    set_item(row, 3, method_item)
             
             self.style_table(self.missing_tools_table)
             missing_layout.addWidget(self.missing_tools_table)
             
             # Select all/none buttons
             button_layout = QHBoxLayout()
-            select_all_btn = QPushButton("✓ Select All")
+            select_all_btn = QPushButton("Select All")
+            _set_button_icon(select_all_btn, "check")
             select_all_btn.clicked.connect(lambda: self.toggle_all_checkboxes(self.missing_tools_table, True))
             button_layout.addWidget(select_all_btn)
             
-            select_none_btn = QPushButton("✗ Deselect All")
+            select_none_btn = QPushButton("Deselect All")
+            
+            _set_button_icon(select_none_btn, "cross")
             select_none_btn.clicked.connect(lambda: self.toggle_all_checkboxes(self.missing_tools_table, False))
             button_layout.addWidget(select_none_btn)
             
@@ -2111,38 +2362,43 @@ class MainWindow(QMainWindow):
             self.installed_tools_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
             self.installed_tools_table.verticalHeader().setVisible(False)
             
-            self.installed_tools_table.setRowCount(len(installed_tools))
-            
-            for row, tool in enumerate(installed_tools):
-                # Checkbox
-                check_item = QTableWidgetItem()
-                check_item.setFlags(Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled)
-                check_item.setCheckState(Qt.CheckState.Checked)
-                self.installed_tools_table.setItem(row, 0, check_item)
-                
-                # Tool name
-                name_item = QTableWidgetItem(tool['name'])
-                self.installed_tools_table.setItem(row, 1, name_item)
+            set_item = self.installed_tools_table.setItem
+            with _bulk_table_update(self.installed_tools_table):
+                self.installed_tools_table.setRowCount(len(installed_tools))
                 
-                # Version
-                version_item = QTableWidgetItem(tool['version'])
-                self.installed_tools_table.setItem(row, 2, version_item)
-                
-                # Status
-                status_item = QTableWidgetItem("✓ Already Installed")
-                status_item.setForeground(Qt.GlobalColor.darkGreen)
-                self.installed_tools_table.setItem(row, 3, status_item)
+                for row, tool in enumerate(installed_tools):
+                    # Checkbox
+                    check_item = QTableWidgetItem()
+                    check_item.setFlags(checkable)
+                    check_item.setCheckState(checked)
+                    set_item(row, 0, check_item)
+                    
+                    # Tool name
+                    name_item = QTableWidgetItem(tool['name'])
+                    set_item(row, 1, name_item)
+                    
+                    # Version
+                    version_item = QTableWidgetItem(tool['version'])
+                    set_item(row, 2, version_item)
+                    
+                    # Status
+                    status_item = QTableWidgetItem("✓ Already Installed")
+                    status_item.setForeground(Qt.GlobalColor.darkGreen)
+                    set_item(row, 3, status_item)
             
             self.style_table(self.installed_tools_table)
             installed_layout.addWidget(self.installed_tools_table)
             
             # Select all/none buttons
             button_layout2 = QHBoxLayout()
-            select_all_btn2 = QPushButton("✓ Select All")
+            select_all_btn2 = QPushButton("Select All")
+            _set_button_icon(select_all_btn2, "check")
             select_all_btn2.clicked.connect(lambda: self.toggle_all_checkboxes(self.installed_tools_table, True))
             button_layout2.addWidget(select_all_btn2)
             
-            select_none_btn2 = QPushButton("✗ Deselect All")
+            select_none_btn2 = QPushButton("Deselect All")
+            
+            _set_button_icon(select_none_btn2, "cross")
             select_none_btn2.clicked.connect(lambda: self.toggle_all_checkboxes(self.installed_tools_table, False))
             button_layout2.addWidget(select_none_btn2)
             
@@ -2172,35 +2428,39 @@ class MainWindow(QMainWindow):
             self.env_vars_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
             self.env_vars_table.verticalHeader().setVisible(False)
             
-            self.env_vars_table.setRowCount(len(env_vars))
-            
-            for row, env_var in enumerate(env_vars):
-                # Checkbox
-                check_item = QTableWidgetItem()
-                check_item.setFlags(Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled)
-                check_item.setCheckState(Qt.CheckState.Checked)
-                self.env_vars_table.setItem(row, 0, check_item)
-                
-                # Variable name
-                name_item = QTableWidgetItem(env_var['name'])
-                name_item.setFont(QFont("Segoe UI", 9, QFont.Weight.Bold))
-                self.env_vars_table.setItem(row, 1, name_item)
+            set_item = self.env_vars_table.setItem
+            with _bulk_table_update(self.env_vars_table):
+                self.env_vars_table.setRowCount(len(env_vars))
                 
-                # Value
-                value_item = QTableWidgetItem(env_var['value'])
-                value_item.setToolTip(env_var['value'])
-                self.env_vars_table.setItem(row, 2, value_item)
+                for row, env_var in enumerate(env_vars):
+                    # Checkbox
+                    check_item = QTableWidgetItem()
+                    check_item.setFlags(checkable)
+                    check_item.setCheckState(checked)
+                    set_item(row, 0, check_item)
+                    
+                    # Variable name
+                    name_item = QTableWidgetItem(env_var['name'])
+                    name_item.setFont(self._bold_item_font)
+                    set_item(row, 1, name_item)
+                    
+                    # Value
+                    value_item = _TextTooltipItem(env_var['value'])
+                    set_item(row, 2, value_item)
             
             self.style_table(self.env_vars_table)
             env_layout.addWidget(self.env_vars_table)
             
             # Select all/none buttons
             button_layout3 = QHBoxLayout()
-            select_all_btn3 = QPushButton("✓ Select All")
+            select_all_btn3 = QPushButton("Select All")
+            _set_button_icon(select_all_btn3, "check")
             select_all_btn3.clicked.connect(lambda: self.toggle_all_checkboxes(self.env_vars_table, True))
             button_layout3.addWidget(select_all_btn3)
             
-            select_none_btn3 = QPushButton("✗ Deselect All")
+            select_none_btn3 = QPushButton("Deselect All")
+            
+            _set_button_icon(select_none_btn3, "cross")
             select_none_btn3.clicked.connect(lambda: self.toggle_all_checkboxes(self.env_vars_table, False))
             button_layout3.addWidget(select_none_btn3)
             
@@ -2230,26 +2490,17 @@ class MainWindow(QMainWindow):
         # Get selected missing tools
         selected_missing = []
         if hasattr(self, 'missing_tools_table'):
-            for row in range(self.missing_tools_table.rowCount()):
-                check_item = self.missing_tools_table.item(row, 0)
-                if check_item and check_item.checkState() == Qt.CheckState.Checked:
-                    selected_missing.append(missing_tools[row])
+            selected_missing = [missing_tools[row] for row in _checked_rows(self.missing_tools_table)]
         
         # Get selected installed tools (for config restore)
         selected_installed = []
         if hasattr(self, 'installed_tools_table'):
-            for row in range(self.installed_tools_table.rowCount()):
-                check_item = self.installed_tools_table.item(row, 0)
-                if check_item and check_item.checkState() == Qt.CheckState.Checked:
-                    selected_installed.append(installed_tools[row])
+            selected_installed = [installed_tools[row] for row in _checked_rows(self.installed_tools_table)]
         
         # Get selected environment variables
         selected_env_vars = []
         if hasattr(self, 'env_vars_table'):
-            for row in range(self.env_vars_table.rowCount()):
-                check_item = self.env_vars_table.item(row, 0)
-                if check_item and check_item.checkState() == Qt.CheckState.Checked:
-                    selected_env_vars.append(env_vars[row])
+            selected_env_vars = [env_vars[row] for row in _checked_rows(self.env_vars_table)]
         
         if not selected_missing and not selected_installed and not selected_env_vars:
             QMessageBox.warning(dialog, "No Selection", "Please select at least one item to install or restore.")
@@ -2263,7 +2514,6 @@ class MainWindow(QMainWindow):
     
     def show_restore_progress(self, backup_path, selected_missing, selected_installed, selected_env_vars, is_compressed, extracted_path):
         """Show installation and restore progress dialog"""
-        from PySide6.QtWidgets import QDialog, QDialogButtonBox, QTextEdit, QTabWidget
         
         total_items = len(selected_missing) + len(selected_installed) + len(selected_env_vars)
         
@@ -2292,29 +2542,13 @@ class MainWindow(QMainWindow):
         # Summary tab (original summary display)
         self.restore_log_text = QTextEdit()
         self.restore_log_text.setReadOnly(True)
-        self.restore_log_text.setStyleSheet(f"""
-            QTextEdit {{
-                background-color: #1E1E1E;
-                color: #D4D4D4;
-                font-family: Consolas, monospace;
-                font-size: {self.font_size_small}px;
-                border: 1px solid #444;
-            }}
-        """)
+        self.restore_log_text.setObjectName("consoleLog")
         tab_widget.addTab(self.restore_log_text, "📋 Summary")
         
         # Detailed Logs tab (new detailed logs display)
         self.restore_detailed_log_text = QTextEdit()
         self.restore_detailed_log_text.setReadOnly(True)
-        self.restore_detailed_log_text.setStyleSheet(f"""
-            QTextEdit {{
-                background-color: #1E1E1E;
-                color: #D4D4D4;
-                font-family: Consolas, monospace;
-                font-size: {self.font_size_small}px;
-                border: 1px solid #444;
-            }}
-        """)
+        self.restore_detailed_log_text.setObjectName("consoleLog")
         tab_widget.addTab(self.restore_detailed_log_text, "🔍 Detailed Logs")
         
         # Close button (disabled during restore)
@@ -2333,7 +2567,6 @@ class MainWindow(QMainWindow):
     def restore_items_background(self, backup_path, selected_missing, selected_installed, selected_env_vars, 
                                  is_compressed, extracted_path, progress_dialog):
         """Restore items in background thread"""
-        import threading
         
         self.restore_results = []
         self.restore_current = 0
@@ -2548,6 +2781,14 @@ class MainWindow(QMainWindow):
                 self.update_restore_progress("-" * 70, "info")
                 self.update_restore_detailed_log(f"\n[PHASE 3] Restoring {len(selected_env_vars)} environment variable(s)", "debug")
                 
+                # Write all variables in one registry session with a single change broadcast
+                try:
+                    env_results = self.restore_manager.restore_environment_variables(
+                        {env_var['name']: env_var['value'] for env_var in selected_env_vars}
+                    )
+                except Exception as e:
+                    env_results = {env_var['name']: {'success': False, 'error': str(e)} for env_var in selected_env_vars}
+                
                 for i, env_var in enumerate(selected_env_vars):
                     self.restore_current = len(selected_missing) + len(selected_installed) + i + 1
                     var_name = env_var['name']
@@ -2561,20 +2802,15 @@ class MainWindow(QMainWindow):
                     self.update_restore_progress(f"  → Restoring...", "info")
                     self.update_restore_detailed_log(f"  [Restore] Setting environment variable", "debug")
                     
-                    try:
-                        result = self.restore_manager.restore_environment_variable(var_name, env_var['value'])
-                        if result.get('success'):
-                            self.update_restore_progress(f"  ✓ Restored successfully", "success")
-                            self.update_restore_detailed_log(f"  [Success] {var_name} restored successfully", "success")
-                            self.restore_stats['restored_env_vars'] += 1
-                        else:
-                            error_msg = result.get('error', 'Unknown error')
-                            self.update_restore_progress(f"  ✗ Failed: {error_msg}", "error")
-                            self.update_restore_detailed_log(f"  [Error] Failed to restore {var_name}: {error_msg}", "error")
-                    except Exception as e:
-                        error_msg = str(e)
-                        self.update_restore_progress(f"  ✗ Error: {error_msg}", "error")
-                        self.update_restore_detailed_log(f"  [Exception] Error setting {var_name}: {error_msg}", "error")
+                    result = env_results[var_name]
+                    if result.get('success'):
+                        self.update_restore_progress(f"  ✓ Restored successfully", "success")
+                        self.update_restore_detailed_log(f"  [Success] {var_name} restored successfully", "success")
+                        self.restore_stats['restored_env_vars'] += 1
+                    else:
+                        error_msg = result.get('error', 'Unknown error')
+                        self.update_restore_progress(f"  ✗ Failed: {error_msg}", "error")
+                        self.update_restore_detailed_log(f"  [Error] Failed to restore {var_name}: {error_msg}", "error")
                     
                     self.update_restore_progress("", "info")
             
@@ -2632,7 +2868,6 @@ class MainWindow(QMainWindow):
             greeting = random.choice(greeting_messages)
             
             # Emit signal to show popup from main thread
-            from PySide6.QtCore import QTimer
             QTimer.singleShot(500, lambda: self._show_completion_popup(greeting, progress_dialog))
         
         thread = threading.Thread(target=restore_worker, daemon=True)
@@ -2692,9 +2927,6 @@ class MainWindow(QMainWindow):
     
     def _show_completion_popup(self, greeting_message, progress_dialog):
         """Show completion popup with greeting and close prompt"""
-        from PySide6.QtWidgets import QDialog, QVBoxLayout, QLabel, QPushButton
-        from PySide6.QtCore import Qt
-        from PySide6.QtGui import QFont
         
         # Create completion dialog
         completion_dialog = QDialog(self)
@@ -2702,28 +2934,7 @@ class MainWindow(QMainWindow):
         completion_dialog.setMinimumWidth(500)
         completion_dialog.setMinimumHeight(250)
         completion_dialog.setModal(True)
-        completion_dialog.setStyleSheet("""
-            QDialog {
-                background-color: #1E1E1E;
-            }
-            QLabel {
-                color: #D4D4D4;
-            }
-            QPushButton {
-                background-color: #0E639C;
-                color: #FFFFFF;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #1177BB;
-            }
-            QPushButton:pressed {
-                background-color: #0D5A96;
-            }
-        """)
+        completion_dialog.setObjectName("completionDialog")
         
         layout = QVBoxLayout(completion_dialog)
         layout.setSpacing(20)
@@ -2783,19 +2994,18 @@ class MainWindow(QMainWindow):
     def toggle_all_checkboxes(self, table, checked):
         """Toggle all checkboxes in the table"""
         state = Qt.CheckState.Checked if checked else Qt.CheckState.Unchecked
-        for row in range(table.rowCount()):
-            item = table.item(row, 0)
-            if item:
-                item.setCheckState(state)
+        get_item = table.item
+        # Nothing listens to these tables' itemChanged; skip the per-row emissions and repaints
+        with _bulk_table_update(table):
+            for row in range(table.rowCount()):
+                item = get_item(row, 0)
+                if item:
+                    item.setCheckState(state)
     
     def start_installation(self, dialog, backup_path, tools_table, missing_tools):
         """Start installing selected tools"""
         # Get selected tools
-        selected_tools = []
-        for row in range(tools_table.rowCount()):
-            check_item = tools_table.item(row, 0)
-            if check_item and check_item.checkState() == Qt.CheckState.Checked:
-                selected_tools.append(missing_tools[row])
+        selected_tools = [missing_tools[row] for row in _checked_rows(tools_table)]
         
         if not selected_tools:
             QMessageBox.warning(dialog, "No Selection", "Please select at least one tool to install.")
@@ -2809,7 +3019,6 @@ class MainWindow(QMainWindow):
     
     def show_installation_progress(self, backup_path, selected_tools):
         """Show installation progress dialog"""
-        from PySide6.QtWidgets import QDialog, QDialogButtonBox, QTextEdit
         
         # Create progress dialog
         progress_dialog = QDialog(self)
@@ -2829,18 +3038,11 @@ class MainWindow(QMainWindow):
         self.install_progress_bar.setValue(0)
         layout.addWidget(self.install_progress_bar)
         
-        # Log text area
-        self.install_log_text = QTextEdit()
+        # Log text area (plain text, capped so long runs do not re-layout an ever-growing document)
+        self.install_log_text = QPlainTextEdit()
         self.install_log_text.setReadOnly(True)
-        self.install_log_text.setStyleSheet(f"""
-            QTextEdit {{
-                background-color: #1E1E1E;
-                color: #D4D4D4;
-                font-family: Consolas, monospace;
-                font-size: {self.font_size_small}px;
-                border: 1px solid #444;
-            }}
-        """)
+        self.install_log_text.setMaximumBlockCount(INSTALL_LOG_MAX_BLOCKS)
+        self.install_log_text.setObjectName("consoleLog")
         layout.addWidget(self.install_log_text)
         
         # Close button (disabled during installation)
@@ -2856,10 +3058,7 @@ class MainWindow(QMainWindow):
         progress_dialog.exec()
     
     def install_selected_tools_background(self, backup_path, selected_tools, progress_dialog):
-        """Install tools in background thread"""
-        from PySide6.QtCore import QTimer
-        import threading
-        
+        """Install tools in a pool thread; the UI updates from its stage signals"""
         # Get backup info for cleanup
         current_backup = None
         for backup in self.available_backups:
@@ -2870,243 +3069,135 @@ class MainWindow(QMainWindow):
         is_compressed = current_backup.get('is_compressed', False) if current_backup else False
         extracted_path = current_backup.get('extracted_path', None) if current_backup else None
         
-        # Store results for UI updates
-        self.install_results = []
-        self.install_current = 0
         self.install_total = len(selected_tools)
+        self.install_current = 0  # Index of the tool whose install stages are showing
         
-        def install_worker():
-            for i, tool in enumerate(selected_tools):
-                tool_name = tool['name']
-                tool_version = tool.get('version')
-                tool_backup_data = tool.get('backup_data', {})
-                winget_id = tool.get('winget_id') or self.restore_manager.get_winget_package_id(tool_name)
-                download_url = tool.get('download_url') or self.restore_manager.get_download_url(tool_name, tool_version)
-                
-                # Store progress info
-                self.install_current = i + 1
-                
-                # Immediately show what we're starting
-                progress_info = {
-                    'index': i + 1,
-                    'tool_name': tool_name,
-                    'version': tool_version,
-                    'winget_id': winget_id,
-                    'download_url': download_url,
-                    'restore_result': None,
-                    'stage': 'starting'
-                }
-                self.install_results.append(progress_info)
-                
-                # Step 1: Install the tool
-                install_success = False
-                install_result = None
-                
-                if winget_id:
-                    # Show installing status
-                    progress_info = {
-                        'index': i + 1,
-                        'tool_name': tool_name,
-                        'version': tool_version,
-                        'winget_id': winget_id,
-                        'download_url': download_url,
-                        'stage': 'installing',
-                        'result': None,
-                        'restore_result': None
-                    }
-                    self.install_results.append(progress_info)
-                    
-                    # Install via winget
-                    install_result = self.restore_manager.install_tool_via_winget(tool_name, winget_id)
-                    install_success = install_result['success']
-                    
-                elif download_url:
-                    # Show installing status
-                    progress_info = {
-                        'index': i + 1,
-                        'tool_name': tool_name,
-                        'version': tool_version,
-                        'winget_id': winget_id,
-                        'download_url': download_url,
-                        'stage': 'installing',
-                        'result': None,
-                        'restore_result': None
-                    }
-                    self.install_results.append(progress_info)
-                    
-                    # Install via URL download
-                    install_result = self.restore_manager.install_tool_via_url(tool_name, download_url)
-                    install_success = install_result['success']
+        self.install_worker = InstallWorker(
+            self.restore_manager, backup_path, selected_tools, is_compressed, extracted_path
+        )
+        self.install_worker.signals.stage.connect(self.on_install_stage)
+        self.install_worker.signals.error.connect(self.on_install_error)
+        self.install_worker.signals.finished.connect(self.on_install_complete)
+        QThreadPool.globalInstance().start(self.install_worker)
+    
+    def on_install_stage(self, stage: str, info: dict):
+        """Show one installation stage for a tool"""
+        # Lines for this stage are appended as one block
+        lines = []
+        log = lines.append
+        log_all = lines.extend
+        
+        if stage == 'starting':
+            # Initial message
+            self.install_current = info['index']
+            self.install_progress_label.setText(
+                f"Starting {info['index']} of {self.install_total}: {info['tool_name']}..."
+            )
+            log(f"\n{'='*60}")
+            log(f"📦 {info['index']}/{self.install_total}: {info['tool_name']} v{info['version']}")
+            
+        elif stage == 'installing':
+            # Show installation starting
+            self.install_progress_label.setText(
+                f"Installing {info['index']} of {self.install_total}: {info['tool_name']}..."
+            )
+            
+            if info.get('winget_id'):
+                log(f"   🔽 Installing via winget...")
+                log(f"      ID: {info['winget_id']}")
+            elif info.get('download_url'):
+                log(f"   🔽 Downloading from URL...")
+                log(f"      {info['download_url']}")
+            
+        elif stage == 'install_complete':
+            # Show installation result
+            result = info.get('result', {})
+            already_installed = result.get('already_installed', False)
+            
+            if result.get('success'):
+                if already_installed:
+                    log(f"   ℹ️  Already installed - skipping installation")
                 else:
-                    install_result = {'success': False, 'message': 'Manual installation required'}
-                
-                # Show installation result
-                progress_info = {
-                    'index': i + 1,
-                    'tool_name': tool_name,
-                    'version': tool_version,
-                    'winget_id': winget_id,
-                    'download_url': download_url,
-                    'stage': 'install_complete',
-                    'result': install_result,
-                    'restore_result': None
-                }
-                self.install_results.append(progress_info)
-                
-                # Step 2: Restore configurations
-                # Restore configs even if installation failed (for manual installs like Oracle SQL Developer)
-                if tool_backup_data:
-                    # Show restoring status
-                    progress_info = {
-                        'index': i + 1,
-                        'tool_name': tool_name,
-                        'version': tool_version,
-                        'stage': 'restoring',
-                        'result': install_result,
-                        'restore_result': None
-                    }
-                    self.install_results.append(progress_info)
-                    
-                    # Wait for successful installations to complete fully
-                    if install_success:
-                        import time
-                        time.sleep(3)
-                    
-                    restore_result = self.restore_manager.restore_tool_configs(
-                        backup_path, tool_name, tool_backup_data, is_compressed, extracted_path
-                    )
-                    
-                    # Show restore result
-                    progress_info = {
-                        'index': i + 1,
-                        'tool_name': tool_name,
-                        'version': tool_version,
-                        'stage': 'complete',
-                        'result': install_result,
-                        'restore_result': restore_result,
-                        'manual_install': not install_success and install_result.get('requires_manual', False)
-                    }
-                    self.install_results.append(progress_info)
-        
-        # Timer to update UI from main thread
-        def update_ui():
-            if self.install_results:
-                info = self.install_results.pop(0)
-                
-                stage = info.get('stage', 'complete')
-                
-                if stage == 'starting':
-                    # Initial message
+                    log(f"   ✅ Installation successful")
+            else:
+                log(f"   ❌ Installation failed: {result.get('message', 'Unknown error')}")
+                # Show additional output if available
+                if 'output' in result and result['output']:
+                    output_lines = result['output'].strip().split('\n')
+                    for line in output_lines[:3]:
+                        if line.strip():
+                            log(f"      {line.strip()}")
+            
+        elif stage == 'restoring':
+            # Show restoration starting; restores overlap the next tool's install,
+            # so the label only follows them once no later install has started
+            result = info.get('result', {})
+            manual_install = result.get('requires_manual', False)
+            show_label = info['index'] == self.install_current
+            
+            if manual_install:
+                if show_label:
                     self.install_progress_label.setText(
-                        f"Starting {info['index']} of {self.install_total}: {info['tool_name']}..."
+                        f"Pre-restoring configs {info['index']} of {self.install_total}: {info['tool_name']}..."
                     )
-                    self.install_log_text.append(f"\n{'='*60}")
-                    self.install_log_text.append(f"📦 {info['index']}/{self.install_total}: {info['tool_name']} v{info['version']}")
-                    
-                elif stage == 'installing':
-                    # Show installation starting
+                log(f"   🔧 Pre-restoring {info['tool_name']} configurations for manual installation...")
+                log(f"      (Configs will be ready when you install the tool)")
+            else:
+                if show_label:
                     self.install_progress_label.setText(
-                        f"Installing {info['index']} of {self.install_total}: {info['tool_name']}..."
+                        f"Restoring configs {info['index']} of {self.install_total}: {info['tool_name']}..."
                     )
-                    
-                    if info.get('winget_id'):
-                        self.install_log_text.append(f"   🔽 Installing via winget...")
-                        self.install_log_text.append(f"      ID: {info['winget_id']}")
-                    elif info.get('download_url'):
-                        self.install_log_text.append(f"   🔽 Downloading from URL...")
-                        self.install_log_text.append(f"      {info['download_url']}")
-                    
-                elif stage == 'install_complete':
-                    # Show installation result
-                    result = info.get('result', {})
-                    already_installed = result.get('already_installed', False)
-                    
-                    if result.get('success'):
-                        if already_installed:
-                            self.install_log_text.append(f"   ℹ️  Already installed - skipping installation")
-                        else:
-                            self.install_log_text.append(f"   ✅ Installation successful")
-                    else:
-                        self.install_log_text.append(f"   ❌ Installation failed: {result.get('message', 'Unknown error')}")
-                        # Show additional output if available
-                        if 'output' in result and result['output']:
-                            output_lines = result['output'].strip().split('\n')
-                            for line in output_lines[:3]:
-                                if line.strip():
-                                    self.install_log_text.append(f"      {line.strip()}")
-                    
-                elif stage == 'restoring':
-                    # Show restoration starting
-                    result = info.get('result', {})
-                    manual_install = result.get('requires_manual', False)
-                    
+                log(f"   🔧 Restoring {info['tool_name']} configurations...")
+            
+        elif stage == 'complete':
+            # Show final restoration results
+            manual_install = info.get('manual_install', False)
+            restore = info.get('restore_result')
+            
+            if restore:
+                restored = restore['restored_items']
+                failed = restore['failed_items']
+                skipped = restore['skipped_items']
+                
+                if restored:
                     if manual_install:
-                        self.install_progress_label.setText(
-                            f"Pre-restoring configs {info['index']} of {self.install_total}: {info['tool_name']}..."
-                        )
-                        self.install_log_text.append(f"   🔧 Pre-restoring configurations for manual installation...")
-                        self.install_log_text.append(f"      (Configs will be ready when you install the tool)")
+                        log(f"   ✅ Pre-restored {len(restored)} {info['tool_name']} item(s) (ready for when you install):")
                     else:
-                        self.install_progress_label.setText(
-                            f"Restoring configs {info['index']} of {self.install_total}: {info['tool_name']}..."
-                        )
-                        self.install_log_text.append(f"   🔧 Restoring configurations...")
-                    
-                elif stage == 'complete':
-                    # Show final restoration results
-                    manual_install = info.get('manual_install', False)
-                    restore = info.get('restore_result')
-                    
-                    if restore:
-                        if restore['restored_items']:
-                            if manual_install:
-                                self.install_log_text.append(f"   ✅ Pre-restored {len(restore['restored_items'])} item(s) (ready for when you install):")
-                            else:
-                                self.install_log_text.append(f"   ✅ Restored {len(restore['restored_items'])} item(s):")
-                            
-                            for item in restore['restored_items'][:3]:
-                                self.install_log_text.append(f"      • {item}")
-                            if len(restore['restored_items']) > 3:
-                                self.install_log_text.append(f"      • ... and {len(restore['restored_items']) - 3} more")
-                        
-                        if restore['failed_items']:
-                            self.install_log_text.append(f"   ⚠️  Failed {len(restore['failed_items'])} item(s):")
-                            for item in restore['failed_items'][:2]:
-                                self.install_log_text.append(f"      • {item}")
-                        
-                        if restore['skipped_items']:
-                            self.install_log_text.append(f"   ⏭️  Skipped {len(restore['skipped_items'])} item(s)")
-                    
-                    # Show helpful message for manual installations
-                    if manual_install:
-                        self.install_log_text.append(f"   💡 Please install {info['tool_name']} manually, your configs are already restored")
+                        log(f"   ✅ Restored {len(restored)} {info['tool_name']} item(s):")
                     
-                    # Update progress bar after complete
-                    self.install_progress_bar.setValue(info['index'])
-            
-            # Check if installation complete
-            if hasattr(self, 'install_thread') and not self.install_thread.is_alive() and not self.install_results:
-                self.install_timer.stop()
-                self.install_progress_label.setText(
-                    f"✅ Installation complete! ({self.install_total} tools processed)"
-                )
+                    log_all(f"      • {item}" for item in restored[:3])
+                    if len(restored) > 3:
+                        log(f"      • ... and {len(restored) - 3} more")
                 
-                # Cleanup extracted backup in background
-                if is_compressed and extracted_path:
-                    self.restore_manager._cleanup_extracted_backup(extracted_path)
+                if failed:
+                    log(f"   ⚠️  Failed {len(failed)} {info['tool_name']} item(s):")
+                    log_all(f"      • {item}" for item in failed[:2])
                 
-                self.install_close_btn.setEnabled(True)
-                self.install_log_text.append(f"\n{'='*60}")
-                self.install_log_text.append(f"Installation process finished.")
-        
-        # Start worker thread
-        self.install_thread = threading.Thread(target=install_worker, daemon=True)
-        self.install_thread.start()
+                if skipped:
+                    log(f"   ⏭️  Skipped {len(skipped)} {info['tool_name']} item(s)")
+            
+            # Show helpful message for manual installations
+            if manual_install:
+                log(f"   💡 Please install {info['tool_name']} manually, your configs are already restored")
+            
+            # Update progress bar after complete
+            self.install_progress_bar.setValue(info['index'])
         
-        # Start UI update timer (100ms interval)
-        self.install_timer = QTimer()
-        self.install_timer.timeout.connect(update_ui)
-        self.install_timer.start(100)
+        if lines:
+            self.install_log_text.appendPlainText("\n".join(lines))
+    
+    def on_install_error(self, error_msg: str):
+        """Log an error that stopped the installation run"""
+        self.install_log_text.appendPlainText(f"   ❌ Installation stopped: {error_msg}")
+    
+    def on_install_complete(self, total: int):
+        """Handle the end of the installation run"""
+        self.install_worker = None
+        self.install_progress_label.setText(
+            f"✅ Installation complete! ({total} tools processed)"
+        )
+        self.install_close_btn.setEnabled(True)
+        self.install_log_text.appendPlainText(f"\n{'='*60}\nInstallation process finished.")
     
     def show_about(self):
         """Show about dialog"""
@@ -3121,14 +3212,18 @@ class MainWindow(QMainWindow):
             "<b>⚙️ Step 3:</b> Restore - Install missing tools and restore configs</p>"
         )
     
-    def center_window(self):
-        """Center the window on the screen"""
-        screen = QApplication.primaryScreen()
-        screen_geometry = screen.availableGeometry()
-        window_geometry = self.frameGeometry()
-        center_point = screen_geometry.center()
-        window_geometry.moveCenter(center_point)
-        self.move(window_geometry.topLeft())
+    def center_window(self, width: int, height: int):
+        """
+        Size the window and center it on the screen in one geometry update
+        
+        Args:
+            width: Window width in pixels
+            height: Window height in pixels
+        """
+        screen_geometry = _available_screen_geometry()
+        x = screen_geometry.x() + (screen_geometry.width() - width) // 2
+        y = screen_geometry.y() + (screen_geometry.height() - height) // 2
+        self.setGeometry(x, y, width, height)
 
 
 def main():
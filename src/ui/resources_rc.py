@@ -0,0 +1,266 @@
+# Resource object code (Python 3)
+# Created by: object code
+# Created by: The Resource Compiler for Qt version 6.12.0
+# WARNING! All changes made in this file will be lost!
+
+from PySide6 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x05\xf4\
+\x00\
+\x00\x18\x98x\x9c\xb5X[o\xdb6\x14~\xcf\xaf \
+\xea\x01m\x0a\xdb\xb5|\x89\x1d\x05\x1b\x10\xc7vW \
+\x03\xd66[\x1f\x8a\xa1\xa0%\xda\xe6*\x89\x82H\xe5\
+\xb2\xc0\xff}\x87\x94d\x892)9@k\x01\x86\xc4\
+\xcb\xb9|\xe7\xf0\x5c\xf8\xee\xed\x19z\x8b\xbe\xf4>\x91\
+uJ\x03\x1f\xe18\x0e\xa8\x87\x05e\x11\xe2\xe2) \
+|G\x88Pk\xa8\xbf%\x82#\x9c\x10\x14b\xe1\xed\
+\x88\x8f\xd6O\x88\xad\xff%\x9e@\x11\x0eI\x1f\xadX\
+$\x10\xa7\xff\x91l\x19\x17\x09\x8d\xb6\xfd;\x12\xc6\x01\
+\x16DR\x81\x17\x8f\xecX\xe0\x93\x84\xa37\x1b\xfe-\
+bI\x88\x83.\x82W\x0e/\xf0\xd6\xef\xf7\xcf\xd1\x86\
+\x06\x010\xa0\x91\xe4\xf1\x07\xa6\xd1\x17\x1a\xf9\xec\xa1\xff\
+M\x89\xf9\xad\x14\x8d\xbf9\xef\x03\xe1wg\x1f\xcbU\
+\xe8\xf9\x0c\xc1o\x8d\xbd\xef\xdb\x84\xa5\x91\xdf\xf3X\xc0\
+\x12\x17uV\xb3\xd5\xe5\xea\xfa\xeal\xaf-\xffx\x8b\
+\xd7$\xc8w\x15KG\xea\xa7\x96\xde1\x16\xccq\xd2\
+@V\xfd\xae\xb2i\x96\x80r\xbd5\x13\x82\x85.r\
+\xe2G\xc4Y@}\xd4Y\xa8_\xb6*\xc6\xbe\x0f\xd8\
+\xb8h\x12?f#<\xc6\x9e\x1aq\x06r\x08\xd8~\
+\x16X\xa4\xbc\x99\xf1D>\x1ac\xc1b#\xd7\xfd\xd9\
+\xd9\xbb\xb7h\x9e\x82X\x11W\x80\xfd\x99\xf2]\xf6\xdd\
+\x89\x13\x1a\xe2\xe4)\xfb\xea\xa2\xea\x94\xe4\x9a\xc6\xa6\x99\
+\x84p\xc1\x12\x92}\xd9e\x1c\x0c\xa6\xb3\xc5\xf8\xaa\x0a\
+\xee\xc3\x8e\x0aR\x95\xdaE\x11\x8b\xb4\x91^\x82}\x9a\
+r\x17\x8d\x0b\x80\x0e\x90\xcd@\xb9\xe1\xa0\x18\xde\x80\xcf\
+\xf5\xa4\xcf\xb9\xe8\x97\xe7\x83C\xed\xb5\xe9\x07B\xb7;\
+\xe1\x02\xe9\xc0W\xd0\xdaTww\xec\x9e$v\x00\xb2\
+\xf9&]'\xd7\x97\xcbf\x161\xe0\xc6\x89\xdf\xc0$\
+_\xd1\xc4f<\x99\xce\xeal\xaa4\x8a\xbd:\x96\x17\
+6\xd0\xd6j\xd3>w<\x0b\xcd\xaf\x1e\x8e<\x12\x04\
+`\x84__\x89$%\xaf\xfe\xb1\x8b\xb8\x18\x0dW\xc3\
+\xd5\x0b\xc9\xe5\xf0\xbfhK+X\xf3\xa9s\xe3\xdc\xd4\
+%9\xd1y\x87\xb3\xeb\xe9xbt\xcc\x8b#\xc7\x94\
+'\x17\x8d\xac\x9e\x99\xb34\xa0\xac\x09\xd3\xe6cCg\
+6\x1b\x1d\x19_'\xd1\x0a\x8a\xb3\x9c.G\xe3fG\
+\xf5)\xc7\xeb\xa0\xd1S\x0fK\x1ad)\xd6\xd8\x85\xb9\
+Q?-Bt.\xd4\xaf. '\x1e\x8b\xfc\x83\x88\
+v\x92\xcb\x99|\xae\x8c\x11\xbd\x1av*\x81\xb2*E\
+k\x0c\x02\xe3#\xc7z\x9c*1\xa8Q\xfe6S/\
+f\xf2)b\xf7\x9d\x84\x11\xa4\xf1\xb1\xc0\xea\x1d\xbd\x89\
+\x13\x06\x99\x92t\x11\x89\xee\xbb(3\x0d?\xef\x82\xca\
+!\xa4\x13\x91\xafZ'\xec\x81C\xc2\x85\x090M\x1a\
+\x08\x9eO\x08Hl\xfc\x5c%\x035\xf27%\x0f\x9d\
+\x03y\xb0{9\xaaQ|\xd60\x1c\x96\x18.\x07\xf2\
+i>.\xc7zV\xd2\xc16\xa1>\x1coRf\xb8\
+\x81|\xcc0\xab\x82\xa1@\xb9\x14U\xd3\xf1\xd9f\xee\
+j6\xb6\x99\xfb\xe7\x88\x0a\xa6,M(\xc3YV-\
+\xc5P\x90\x88\xac\xa8RS\x9f\xd8\xc3\x82\x04d\x0b\x95\
+S\xcdBU[\xb8.\x08\x14j\xa6\xaa\xea\x9fM\xe7\
+(T3h\x0d\xb3c\x92.\x07\xe6\x9eP\xc7\xbf\x89\
+\xf6a]\xc3a\x1cA*X\xe8\x87q\xa0~5)\
+JX>\xfeN0\x98D\x8e\xba\xc0\xc1\x93\x05\xa9\xdd\
+\x1fM\xab\xdb\x8b\xc0\xa3\xd8\xddR\x91\x14%\xdd\xa8t\
+\xa2jmc\xa84\xdac\x83\xc5k_\xa8P\xa5\x0a\
+\xd4m|\x92>\xc3\x1f\xa7\x8f\xf4\xed\xf7 \x5c\x0c\x1b\
+\x1eIVf\xaa\xef9{\xec\xf04\x94\xd9E}\x83\
+-\x0f\xe3y\xd8:\x1a\xf7\x89\xc04\xc8\xc6s\xe5\xdb\
+er\x9c\xba\xde\x16\xf5l\xe1\x09D\xdc\xd2(+\xa3\
+\xeb)>/\xae\x87\xb9\xf1\x8c\x9a5\x98i\x00\x9e\xb7\
+\xd2w\x1at\xcc\x05\xabW 6~\xae+\xa8P\xc1\
+\xda\x08\xa8a\xba\xca3\x9f\xceY\xf3t\x0d\xf9I$\
+,\xe8\xb1\x84\x02\x0cn\x0eG\x86B@6\xa2zR\
+\x0e\xbe6\x90mL\xf6_?\xe5\x19\xe06\x95u\xf6\
+\xc7*K\x7f\xfa\x10\xc5\xa9\xec;#\x1f\x09\xf2(d\
+\xac\xc4\x99g\xddB\xf4]\xfaT@Z\xc5\x89\xb7\x03\
+\xe2\xf5@\xa7*2g\xd2\xe0\x12\xa7d\xac\x96\x16\xc3\
+\x9a%\xf6&\x11\xdd\x0d\xf3Rn\xb6u\x05\xae;P\
+Um\xcc\xe1\x92\xdf?1\x99)\x1578\xa4\xc1\x93\
+\x8b^\x7f&[F\xd0_\x1f^w\xd1uBe{\
+\xceq\xc4{PC\xd0\xcdI\x90\x94\x068`\xafR\
+\xe5.?\xbaN\xffB\xd7\x12\xdc\x0eT!\xb7l+\
+\xab\xcd\x00R\xa1a\xaa\xa9\x9c\x95\x8f\xee{\x8b\xb1|\
+\x0c\xea\xdd(\x82\x98wQ\xc8\x22&\xfbnbV\xaa\
+L\xda\x16\xd8\xc7\xe3q\xe1\xa5\xea\x0a!wK\xf9\xda\
+Q\x8em\xbaX\xa8\x06!\xfd\x1a`_\xec\x0dS\xc8\
+\xa7\xa6\xbdEU\xdc.\xad\x85\xb2\x07\xb0\x89\x97R\xb6\
+\x19W'\xed\x13\xee%4\x96\xa9\xea\x87\x88\xde\xcb\xc2\
+\x8d\xce$\x8f|7R\x8djN\xb0Kk\xb8\xcf\xd1\
+H\xddRn\xa3\xa4\x8beR\xe4\x00\x85\x8c(3\x93\
+\xa4\x92\xfcW(T\xe8=\xa95\xcd&\x7f0\xdfV\
+\xe4\x04I\x8c\x13\x0c\x8dUm\x7f\xb5o\xa9&\xc2Y\
+\x99\x92?C\xdf\x8c\xa0W\xd8\xca\xb6PE\xd2\x10N\
+\x18\x12x\x9d\xdf\x04\xe5Ss\x9ct8\xac-\xbek\
+\x01\xa7RA\x18\x8a<{ \x1d\x15\x8d\x90\x85\x8d\xeb\
+z\xbb4\xfa~\xda\x15\x92\x856\xd4M\xd9\x0deG\
+\xaa\x06_@5\xc6\xd1\xcfj\x00\x8c\x1c\xd1o\xaaB\
+\x05\xf5 \xaf\xe1\xf5\x0b\x0b6\x95\xab\xca{\xad\xbc\x0e\
+I2_\x18\xeaQH\x16\x22\xea|\x18D.\x17\xa8\
+\xbd\xfa\x8aS\xe4n\xaf\xe8\x8f\xee\xef\x9aj\xc9\x93X\
+\xb64\xc2E;\x9f\xb9\xf3\xa7\xec~Au\xb9\x01Q\
+\xb5\xb1\x0fY\x0a\x12\x84t\xe6\x85z\xed\x94\x93\xd9@\
+{\xf2\xd8\xdb\xf7\x1ao\x88\x8b\x04\xd3\xb4\xaf\xec\xfd\x1b\
+\xbc{y1\xba\xac]\x7f\x1c\xdf(W\x8f\x9fv\x15\
+Z^C\xd8\xbc\xd8\x1cUN\x90\xb9\xcd,\x8e3\x9d\
+\xce\xe7'Sk\xbf\xd7\x5cL\xae/Ue\xf0?L\
+C\xee4\
+\x00\x00\x01d\
+<\
+svg xmlns=\x22http:\
+//www.w3.org/200\
+0/svg\x22 width=\x2216\
+\x22 height=\x2216\x22 vi\
+ewBox=\x220 0 16 16\
+\x22>\x0a  <path d=\x22M2\
+ 2h9.5L14 4.5V14\
+H2z\x22 fill=\x22none\x22\
+ stroke=\x22#FFFFFF\
+\x22 stroke-width=\x22\
+1.6\x22 stroke-line\
+join=\x22round\x22/>\x0a \
+ <rect x=\x225\x22 y=\x22\
+2.8\x22 width=\x225\x22 h\
+eight=\x223.4\x22 fill\
+=\x22#FFFFFF\x22/>\x0a  <\
+rect x=\x224.5\x22 y=\x22\
+9\x22 width=\x227\x22 hei\
+ght=\x224.2\x22 fill=\x22\
+none\x22 stroke=\x22#F\
+FFFFF\x22 stroke-wi\
+dth=\x221.4\x22/>\x0a</sv\
+g>\x0a\
+\x00\x00\x01\x16\
+<\
+svg xmlns=\x22http:\
+//www.w3.org/200\
+0/svg\x22 width=\x2216\
+\x22 height=\x2216\x22 vi\
+ewBox=\x220 0 16 16\
+\x22>\x0a  <circle cx=\
+\x226.5\x22 cy=\x226.5\x22 r\
+=\x224.5\x22 fill=\x22non\
+e\x22 stroke=\x22#FFFF\
+FF\x22 stroke-width\
+=\x222\x22/>\x0a  <line x\
+1=\x2210\x22 y1=\x2210\x22 x\
+2=\x2214.5\x22 y2=\x2214.\
+5\x22 stroke=\x22#FFFF\
+FF\x22 stroke-width\
+=\x222\x22 stroke-line\
+cap=\x22round\x22/>\x0a</\
+svg>\x0a\
+\x00\x00\x00\xe7\
+<\
+svg xmlns=\x22http:\
+//www.w3.org/200\
+0/svg\x22 width=\x2216\
+\x22 height=\x2216\x22 vi\
+ewBox=\x220 0 16 16\
+\x22>\x0a  <polyline p\
+oints=\x222.5,8.5 6\
+.5,12.5 13.5,4\x22 \
+fill=\x22none\x22 stro\
+ke=\x22#333333\x22 str\
+oke-width=\x222\x22 st\
+roke-linecap=\x22ro\
+und\x22 stroke-line\
+join=\x22round\x22/>\x0a<\
+/svg>\x0a\
+\x00\x00\x01-\
+<\
+svg xmlns=\x22http:\
+//www.w3.org/200\
+0/svg\x22 width=\x2216\
+\x22 height=\x2216\x22 vi\
+ewBox=\x220 0 16 16\
+\x22>\x0a  <line x1=\x223\
+.5\x22 y1=\x223.5\x22 x2=\
+\x2212.5\x22 y2=\x2212.5\x22\
+ stroke=\x22#333333\
+\x22 stroke-width=\x22\
+2\x22 stroke-lineca\
+p=\x22round\x22/>\x0a  <l\
+ine x1=\x2212.5\x22 y1\
+=\x223.5\x22 x2=\x223.5\x22 \
+y2=\x2212.5\x22 stroke\
+=\x22#333333\x22 strok\
+e-width=\x222\x22 stro\
+ke-linecap=\x22roun\
+d\x22/>\x0a</svg>\x0a\
+\x00\x00\x00\xa0\
+<\
+svg xmlns=\x22http:\
+//www.w3.org/200\
+0/svg\x22 width=\x2216\
+\x22 height=\x2216\x22 vi\
+ewBox=\x220 0 16 16\
+\x22>\x0a  <rect x=\x223\x22\
+ y=\x223\x22 width=\x2210\
+\x22 height=\x2210\x22 rx\
+=\x221.5\x22 fill=\x22#FF\
+FFFF\x22/>\x0a</svg>\x0a\
+"
+
+qt_resource_name = b"\
+\x00\x05\
+\x00o\xa6S\
+\x00i\
+\x00c\x00o\x00n\x00s\
+\x00\x06\
+\x07\xac\x02\xc3\
+\x00s\
+\x00t\x00y\x00l\x00e\x00s\
+\x00\x08\
+\x08\x01V\xc3\
+\x00m\
+\x00a\x00i\x00n\x00.\x00q\x00s\x00s\
+\x00\x0a\
+\x02\xceU\x87\
+\x00b\
+\x00a\x00c\x00k\x00u\x00p\x00.\x00s\x00v\x00g\
+\x00\x08\
+\x09\x81U\xe7\
+\x00s\
+\x00c\x00a\x00n\x00.\x00s\x00v\x00g\
+\x00\x09\
+\x0b\x9e\x89\x07\
+\x00c\
+\x00h\x00e\x00c\x00k\x00.\x00s\x00v\x00g\
+\x00\x09\
+\x06\xa6\x8f\xe7\
+\x00c\
+\x00r\x00o\x00s\x00s\x00.\x00s\x00v\x00g\
+\x00\x08\
+\x0bcU\x87\
+\x00s\
+\x00t\x00o\x00p\x00.\x00s\x00v\x00g\
+"
+
+qt_resource_struct = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x05\x00\x00\x00\x04\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x10\x00\x02\x00\x00\x00\x01\x00\x00\x00\x03\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x22\x00\x01\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\xa1B0uU\
+\x00\x00\x008\x00\x00\x00\x00\x00\x01\x00\x00\x05\xf8\
+\x00\x00\x01\xa1B!\xb4j\
+\x00\x00\x00\x80\x00\x00\x00\x00\x00\x01\x00\x00\x09e\
+\x00\x00\x01\xa1B!\xb4u\
+\x00\x00\x00R\x00\x00\x00\x00\x00\x01\x00\x00\x07`\
+\x00\x00\x01\xa1B!\xb4i\
+\x00\x00\x00\x98\x00\x00\x00\x00\x00\x01\x00\x00\x0a\x96\
+\x00\x00\x01\xa1B!\xb4m\
+\x00\x00\x00h\x00\x00\x00\x00\x00\x01\x00\x00\x08z\
+\x00\x00\x01\xa1B!\xb4s\
+"
+
+def qInitResources():
+    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
@@ -2,14 +2,38 @@
 Test script for backup functionality
 """
 
+import logging
+import os
 import sys
-from pathlib import Path
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent))
+# Add the repository root to path
+_ROOT = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, _ROOT)
 
 from src.core.backup import BackupManager
 
+log = logging.getLogger(__name__)
+
+# Sample data for the test backup; create_backup only reads these
+SAMPLE_TOOLS = [
+    {
+        'name': 'Visual Studio Code',
+        'version': '1.85.0',
+        'path': 'C:\\Program Files\\Microsoft VS Code\\Code.exe'
+    }
+]
+
+SAMPLE_ENV_VARS = [
+    {
+        'name': 'PATH',
+        'value': 'C:\\Windows\\System32'
+    },
+    {
+        'name': 'JAVA_HOME',
+        'value': 'C:\\Program Files\\Java\\jdk-17'
+    }
+]
+
 def test_backup_manager():
     """Test the BackupManager class"""
     
@@ -23,36 +47,16 @@ def test_backup_manager():
     
     # Test tool configuration loading
     print(f"✓ Loaded {len(manager.tool_configs)} tool configurations:")
-    for tool_name in manager.tool_configs.keys():
-        print(f"  • {tool_name}")
+    print("\n".join(f"  • {tool_name}" for tool_name in manager.tool_configs))
     print()
     
     # Create a test backup with sample data
     print("Creating test backup...")
     
-    sample_tools = [
-        {
-            'name': 'Visual Studio Code',
-            'version': '1.85.0',
-            'path': 'C:\\Program Files\\Microsoft VS Code\\Code.exe'
-        }
-    ]
-    
-    sample_env_vars = [
-        {
-            'name': 'PATH',
-            'value': 'C:\\Windows\\System32'
-        },
-        {
-            'name': 'JAVA_HOME',
-            'value': 'C:\\Program Files\\Java\\jdk-17'
-        }
-    ]
-    
     try:
         results = manager.create_backup(
-            selected_tools=sample_tools,
-            selected_env_vars=sample_env_vars,
+            selected_tools=SAMPLE_TOOLS,
+            selected_env_vars=SAMPLE_ENV_VARS,
             backup_name="test_backup"
         )
         
@@ -65,8 +69,7 @@ def test_backup_manager():
     
     except Exception as e:
         print(f"\n✗ Error during backup: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        log.exception("Backup failed")
     
     # List all backups
     print("\n" + "="*50)
@@ -74,11 +77,15 @@ def test_backup_manager():
     backups = manager.list_backups()
     
     if backups:
+        # Build the listing first and write it in one call
+        lines = []
         for backup in backups:
-            print(f"\n• {backup['name']}")
-            print(f"  Timestamp: {backup['timestamp']}")
-            print(f"  Tools: {len(backup['manifest'].get('tools', []))}")
-            print(f"  Env Vars: {len(backup['manifest'].get('environment_variables', []))}")
+            manifest = backup['manifest']
+            lines.append(f"\n• {backup['name']}")
+            lines.append(f"  Timestamp: {backup['timestamp']}")
+            lines.append(f"  Tools: {len(manifest.get('tools', []))}")
+            lines.append(f"  Env Vars: {len(manifest.get('environment_variables', []))}")
+        sys.stdout.write("\n".join(lines) + "\n")
     else:
         print("  No backups found")
 
@@ -1,21 +1,18 @@
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from src.core.detector import SystemDetector
+"""
+Manual detection check; a thin wrapper around `python -m src detect`
+(accepts the same options, e.g. --workers N and --cached)
+"""
 
-print("Testing W-Rebuild Detection System")
-print("=" * 50)
+import os
+import sys
 
-detector = SystemDetector()
-print(f"Script path: {detector.detect_script}")
-print(f"Script exists: {detector.detect_script.exists()}")
-print()
+# Repository root, so src.* imports resolve without installing the package
+_ROOT = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, _ROOT)
 
-print("Running detection...")
-tools = detector.detect_all_tools(force_refresh=True)
+from src.__main__ import main
 
-print(f"\nFound {len(tools)} tools:")
-for tool in tools:
-    print(f"  - {tool.name} (v{tool.version}) - {tool.tool_type}")
-    print(f"    Path: {tool.path}")
+if __name__ == "__main__":
+    print("Testing W-Rebuild Detection System")
+    print("=" * 50)
+    sys.exit(main(["detect", *sys.argv[1:]]))